@@ -0,0 +1,88 @@
+"""
+Mide propuestas/s de la búsqueda difusa de los catálogos
+(comun/coincidencia_difusa.py) sobre el catálogo de direcciones seccionales
+de la DIAN, con valores que tienen de 0 a 3 errores de digitación y valores
+que no se parecen a nada. Como referencia se compara contra calcular la
+distancia de Levenshtein completa con cada valor del catálogo, y se
+verifica que ambas proponen lo mismo.
+
+Sin la memoria de propuestas de IndiceCatalogo: se mide el costo de cada
+valor distinto.
+
+Uso: python benchmarks/benchmark_coincidencia_difusa.py [valores]
+"""
+import os
+import random
+import sys
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(RAIZ)
+sys.path.append(os.path.join(RAIZ, 'proyectos', 'DIAN', 'PQR'))
+from comun.coincidencia_difusa import IndiceDifuso
+from valores_choice.direccion_seccional_dian import VALORES_DIRECCION_SECCIONAL
+
+LETRAS = 'abcdefghijklmnopqrstuvwxyz '
+
+
+def levenshtein(a: str, b: str) -> int:
+    anterior = list(range(len(b) + 1))
+    for i, caracter in enumerate(a, 1):
+        actual = [i]
+        for j, otro in enumerate(b, 1):
+            actual.append(min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + (caracter != otro)))
+        anterior = actual
+    return anterior[-1]
+
+
+def proponer_fuerza_bruta(indice: IndiceDifuso, valor: str):
+    if len(valor) < indice.longitud_minima:
+        return None
+    maximo = indice.distancia_maxima(len(valor))
+    cercanos = sorted((d, v) for v in indice.valores if (d := levenshtein(valor, v)) <= maximo)
+    if not cercanos or (len(cercanos) > 1 and cercanos[0][0] == cercanos[1][0]):
+        return None
+    return cercanos[0][1]
+
+
+def con_errores(valor: str) -> str:
+    letras = list(valor)
+    for _ in range(random.randint(0, 3)):
+        posicion = random.randrange(len(letras))
+        operacion = random.randint(0, 2)
+        if operacion == 0:
+            letras.insert(posicion, random.choice(LETRAS))
+        elif operacion == 1:
+            del letras[posicion]
+        else:
+            letras[posicion] = random.choice(LETRAS)
+    return ''.join(letras)
+
+
+def medir(proponer, valores):
+    inicio = time.perf_counter()
+    propuestas = [proponer(valor) for valor in valores]
+    return len(valores) / (time.perf_counter() - inicio), propuestas
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    random.seed(42)
+    catalogo = sorted(VALORES_DIRECCION_SECCIONAL)
+    valores = [con_errores(random.choice(catalogo)) if random.random() < 0.8
+               else ''.join(random.choice(LETRAS) for _ in range(random.randint(3, 40)))
+               for _ in range(cantidad)]
+
+    inicio = time.perf_counter()
+    indice = IndiceDifuso(catalogo)
+    construccion = time.perf_counter() - inicio
+
+    velocidad_bruta, esperadas = medir(lambda v: proponer_fuerza_bruta(indice, v), valores)
+    velocidad, propuestas = medir(indice.proponer, valores)
+    assert propuestas == esperadas
+
+    corregidos = sum(p is not None for p in propuestas)
+    print(f"catálogo: {len(catalogo)} valores, índice armado en {construccion * 1000:.1f} ms")
+    print(f"{'levenshtein contra todo':>25}: {velocidad_bruta:>10,.0f} propuestas/s")
+    print(f"{'índice de trigramas':>25}: {velocidad:>10,.0f} propuestas/s ({velocidad / velocidad_bruta:.1f}x)")
+    print(f"{'con propuesta':>25}: {corregidos} de {cantidad}")
@@ -0,0 +1,65 @@
+"""
+Compara tamaño y velocidad de escribir y leer un CSV con separador '|'
+sin comprimir, en .gz y en .zst a varios niveles, con abrir() de
+comun/compresion.py (escritura con csv.writer, lectura línea a línea como
+los procesadores). Verifica que todas las variantes se leen completas.
+
+Las filas imitan un consolidado: nombre de archivo y mes repetidos,
+fechas, categorías y texto libre.
+
+Uso: python benchmarks/benchmark_compresion.py [filas]
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(RAIZ)
+from comun.compresion import abrir
+
+VARIANTES = [("", None), (".gz", 1), (".gz", 6), (".zst", 1), (".zst", 3), (".zst", 9)]
+CATEGORIAS = ["PETICION", "QUEJA", "RECLAMO", "SUGERENCIA", "DENUNCIA"]
+PALABRAS = ["solicitud", "radicado", "respuesta", "contribuyente", "Bogotá", "términos", "pago", "factura"]
+
+
+def filas(cantidad: int):
+    random.seed(42)
+    yield ["NOMBRE_ARCHIVO", "MES_REPORTE", "FECHA_RADICACION", "CATEGORIA", "NUMERO", "DESCRIPCION"]
+    for fila in range(cantidad):
+        yield ["ARCHIVO_COLJ_I20250101_F20250131.csv", "01_2025",
+               f"2025-01-{random.randint(1, 31):02d}", random.choice(CATEGORIAS), str(fila),
+               " ".join(random.choices(PALABRAS, k=random.randint(3, 12)))]
+
+
+def escribir(ruta: str, cantidad: int, nivel) -> float:
+    inicio = time.perf_counter()
+    with abrir(ruta, 'w', encoding='utf-8', newline='', nivel=nivel) as f:
+        csv.writer(f, delimiter='|').writerows(filas(cantidad))
+    return time.perf_counter() - inicio
+
+
+def leer(ruta: str):
+    inicio = time.perf_counter()
+    with abrir(ruta, 'r', encoding='utf-8') as f:
+        lineas = sum(1 for _ in f)
+    return time.perf_counter() - inicio, lineas
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as carpeta:
+        print(f"{cantidad:,} filas")
+        base = None
+        for extension, nivel in VARIANTES:
+            ruta = os.path.join(carpeta, f"datos_{nivel}.csv{extension}")
+            escritura = escribir(ruta, cantidad, nivel)
+            lectura, lineas = leer(ruta)
+            tamano = os.path.getsize(ruta)
+            base = base or tamano
+            assert lineas == cantidad + 1
+            nombre = f"{extension or 'sin comprimir'} {'' if nivel is None else nivel}"
+            print(f"{nombre:>15}: {tamano / 2**20:>7.1f} MiB (x{base / tamano:<4.1f})"
+                  f" | escribe {escritura:>5.2f} s | lee {lectura:>5.2f} s")
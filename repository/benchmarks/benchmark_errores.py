@@ -0,0 +1,84 @@
+"""
+Compara memoria pico (tracemalloc) y errores/s de guardar los errores de
+validación como lista de ErrorInfo y escribirlos al final con
+csv.DictWriter (lo de antes) contra AlmacenErrores de comun/errores.py, que
+los guarda en columnas compactas y los escribe por tandas, sin límite y con
+límite de filas de detalle por columna y mensaje. Verifica que sin límite
+los dos archivos de errores quedan idénticos.
+
+Los errores imitan un archivo sucio: pocas columnas con error, el mismo
+mensaje por columna y valores cortos.
+
+Uso: python benchmarks/benchmark_errores.py [errores]
+"""
+import csv
+import filecmp
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(RAIZ)
+from comun.errores import AlmacenErrores
+from comun.procesador_csv import ErrorInfo
+
+COLUMNAS = [("FECHA_RADICACION", 12, "date", "Formato de fecha inválido"),
+            ("CATEGORIA_1", 4, "choice_categoria_1", "Valor no permitido"),
+            ("NIT", 20, "nit", "NIT inválido")]
+VALORES = ["32/13/2021", "valor inexistente", "900.123.456", "nan", "x"]
+LIMITE = 10_000
+
+
+def errores(cantidad: int):
+    random.seed(42)
+    for fila in range(1, cantidad + 1):
+        columna, numero, tipo, mensaje = random.choice(COLUMNAS)
+        yield ErrorInfo(columna=columna, numero_columna=numero, tipo=tipo,
+                        valor=f"{random.choice(VALORES)}{fila % 97}", fila=fila, error=mensaje)
+
+
+def anterior(ruta: str, cantidad: int) -> None:
+    lista = list(errores(cantidad))
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=ErrorInfo.__slots__)
+        writer.writeheader()
+        writer.writerows({campo: getattr(e, campo) for campo in ErrorInfo.__slots__} for e in lista)
+
+
+def almacen(ruta: str, cantidad: int, limite: int = None) -> None:
+    with AlmacenErrores(ruta, limite=limite) as store:
+        store.extend(errores(cantidad))
+
+
+def almacen_limitado(ruta: str, cantidad: int) -> None:
+    almacen(ruta, cantidad, LIMITE)
+
+
+def medir(funcion, ruta: str, cantidad: int):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    funcion(ruta, cantidad)
+    segundos = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cantidad / segundos, pico
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as carpeta:
+        variantes = {"lista de ErrorInfo": anterior, "AlmacenErrores": almacen,
+                     f"límite {LIMITE:,}": almacen_limitado}
+        print(f"{cantidad:,} errores")
+        base = None
+        for nombre, funcion in variantes.items():
+            ruta = os.path.join(carpeta, f"{funcion.__name__}.csv")
+            velocidad, pico = medir(funcion, ruta, cantidad)
+            base = base or pico
+            print(f"{nombre:>20}: {velocidad:>10,.0f} errores/s | pico {pico / 2**20:>8.1f} MiB"
+                  f" | x{base / pico:<4.0f} menos memoria | detalle {os.path.getsize(ruta) / 2**20:>6.1f} MiB")
+        assert filecmp.cmp(os.path.join(carpeta, "anterior.csv"), os.path.join(carpeta, "almacen.csv"),
+                           shallow=False)
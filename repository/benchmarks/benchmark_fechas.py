@@ -0,0 +1,88 @@
+"""
+Mide fechas/s de validar_date de Dynamics con el orden fijo de formatos,
+con el orden aprendido por columna (comun/formatos_fecha.py) y con la
+conversión por columnas a datetime64 (comun/fechas_vectorizadas.py), sobre
+ocho columnas de fecha con la mezcla típica de un export: casi todo
+DD/MM/YYYY (el último formato que se prueba), algo de YYYY-MM-DD HH:MM:SS y
+seriales de Excel.
+
+Sin caché: se mide el costo de parsear cada celda. La variante vectorizada
+necesita NumPy; sin él cae al validador escalar.
+
+Uso: python benchmarks/benchmark_fechas.py [filas]
+"""
+import os
+import random
+import sys
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(RAIZ)
+sys.path.append(os.path.join(RAIZ, 'proyectos', 'DIAN', 'PQR'))
+from comun.formatos_fecha import FormatoFechaAdaptativo
+from validadores.validadores_pqr_dynamics import ValidadoresPQRDynamics
+
+COLUMNAS_FECHA = 8
+
+
+def generar_columnas(filas: int):
+    random.seed(42)
+    columnas = []
+    for _ in range(COLUMNAS_FECHA):
+        valores = []
+        for _ in range(filas):
+            dia, mes, anio = random.randint(1, 28), random.randint(1, 12), random.randint(2020, 2025)
+            sorteo = random.random()
+            if sorteo < 0.85:
+                valores.append(f"{dia:02d}/{mes:02d}/{anio}")
+            elif sorteo < 0.95:
+                valores.append(f"{anio}-{mes:02d}-{dia:02d} {random.randint(0, 23):02d}:15:00")
+            else:
+                valores.append(str(random.randint(43831, 46022)))
+        columnas.append(valores)
+    return columnas
+
+
+def fijo(validador, columnas):
+    return [[validador.validar_date(valor) for valor in columna] for columna in columnas]
+
+
+def adaptativo(validador, columnas):
+    resultado = []
+    for columna in columnas:
+        metodo = FormatoFechaAdaptativo(validador.validar_date)
+        resultado.append([metodo(valor) for valor in columna])
+    return resultado
+
+
+def vectorizado(validador, columnas):
+    resultado = []
+    for columna in columnas:
+        normalizados, mascara = validador.validar_date_batch(columna)
+        resultado.append(list(zip(normalizados, mascara)))
+    return resultado
+
+
+def medir(funcion, validador, columnas, repeticiones: int = 3) -> float:
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(validador, columnas)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return sum(len(columna) for columna in columnas) / mejor
+
+
+if __name__ == "__main__":
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    validador = ValidadoresPQRDynamics()
+    columnas = generar_columnas(filas)
+    esperado = fijo(validador, columnas)
+    assert adaptativo(validador, columnas) == esperado
+    assert vectorizado(validador, columnas) == esperado
+
+    base = None
+    for nombre, funcion in (("orden fijo", fijo), ("aprendido", adaptativo), ("vectorizado", vectorizado)):
+        velocidad = medir(funcion, validador, columnas)
+        base = base or velocidad
+        print(f"{COLUMNAS_FECHA} columnas de fecha | {nombre:>11}: {velocidad:>10,.0f} fechas/s | "
+              f"x{velocidad / base:.1f}")
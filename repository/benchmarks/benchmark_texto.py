@@ -0,0 +1,113 @@
+"""
+Mide cadenas/s de la normalización de texto de comun/texto.py contra lo que
+había antes (NFKD + encode/decode ASCII por celda y la cadena de .replace()
+de normalize_column_name) y contra una tabla de str.translate con respaldo
+NFKD para lo que no está en ella. Verifica que las tres dan exactamente lo
+mismo, incluido todo el plano básico de Unicode carácter a carácter.
+
+Los valores imitan una columna de un export: casi todo en ASCII, algo con
+tildes y Ñ, y muy poco fuera de Latin-1.
+
+Uso: python benchmarks/benchmark_texto.py [cadenas]
+"""
+import os
+import random
+import sys
+import time
+import unicodedata
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(RAIZ)
+from comun.texto import normalizar_nombre_columna, quitar_acentos
+
+ASCII = ["DIRECCION", "SECCIONAL", "DE", "IMPUESTOS", "Y", "ADUANAS", "BOGOTA", "PETICION", "QUEJA",
+         "S.A.S.", "1.234,5", "reclamo", "general"]
+LATIN1 = ["Dirección", "Bogotá", "NIÑO", "petición", "Medellín", "Cúcuta", "pingüino", "Nº", "½"]
+RAROS = ["ﬁscal", "Ελλάδα", "日本", "é", "№"]
+ENCABEZADOS = ["FECHA_RADICACION", "NIT/CC", "Nombre-Archivo", "anio.reporte", " Direccion Seccional ",
+               "MES_REPORTE", "Fecha Radicación", "Número de Ñandú"]
+
+
+def quitar_acentos_anterior(valor: str) -> str:
+    return unicodedata.normalize('NFKD', valor).encode('ASCII', 'ignore').decode('ASCII')
+
+
+class TablaAscii(dict):
+    """Tabla de str.translate que calcula y guarda cada carácter la primera vez."""
+
+    def __missing__(self, codigo: int) -> str:
+        self[codigo] = quitar_acentos_anterior(chr(codigo))
+        return self[codigo]
+
+
+TABLA = TablaAscii()
+
+
+def catalogo_anterior(valor: str) -> str:
+    return quitar_acentos_anterior(valor.strip()).replace('.', '').replace(',', '')
+
+
+def catalogo_tabla(valor: str) -> str:
+    return valor.strip().translate(TABLA).replace('.', '').replace(',', '')
+
+
+def catalogo(valor: str) -> str:
+    return quitar_acentos(valor.strip()).replace('.', '').replace(',', '')
+
+
+def nombre_columna_anterior(column_name: str) -> str:
+    column_name = column_name.strip().upper()
+    replacements = [
+        (' ', '_'), ('-', '_'), ('Á', 'A'), ('É', 'E'), ('Í', 'I'),
+        ('Ó', 'O'), ('Ú', 'U'), ('Ñ', 'N'), ('.', ''), ('/', '_'),
+    ]
+    for old, new in replacements:
+        column_name = column_name.replace(old, new)
+    return column_name
+
+
+TABLA_COLUMNA = str.maketrans({anterior: nuevo or None for anterior, nuevo in [
+    (' ', '_'), ('-', '_'), ('Á', 'A'), ('É', 'E'), ('Í', 'I'),
+    ('Ó', 'O'), ('Ú', 'U'), ('Ñ', 'N'), ('.', ''), ('/', '_')]})
+
+
+def nombre_columna_tabla(column_name: str) -> str:
+    return column_name.strip().upper().translate(TABLA_COLUMNA)
+
+
+def medir(funcion, valores, repeticiones: int = 3):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = [funcion(valor) for valor in valores]
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return len(valores) / mejor, resultado
+
+
+def fila(nombre, funciones, valores) -> str:
+    velocidades, resultados = zip(*(medir(funcion, valores) for funcion in funciones))
+    assert all(resultado == resultados[0] for resultado in resultados), nombre
+    return (f"{nombre:>18} | " + " | ".join(f"{v:>12,.0f}" for v in velocidades)
+            + f" | {velocidades[-1] / velocidades[0]:>5.1f}x")
+
+
+def palabra() -> str:
+    azar = random.random()
+    return random.choice(ASCII if azar < 0.85 else LATIN1 if azar < 0.995 else RAROS)
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    random.seed(42)
+    valores = [" ".join(palabra() for _ in range(random.randint(1, 5))) for _ in range(cantidad)]
+    encabezados = [random.choice(ENCABEZADOS) for _ in range(cantidad)]
+    plano_basico = [chr(c) for c in range(0x10000) if not 0xD800 <= c < 0xE000]
+    plano_basico += [f" a{c}.b,{c} " for c in plano_basico[::7]]
+
+    print(f"{'cadenas/s':>18} | {'anterior':>12} | {'translate':>12} | {'isascii':>12} |")
+    print(fila("catálogo", (catalogo_anterior, catalogo_tabla, catalogo), valores))
+    print(fila("plano básico", (catalogo_anterior, catalogo_tabla, catalogo), plano_basico))
+    print(fila("nombre de columna", (nombre_columna_anterior, nombre_columna_tabla, normalizar_nombre_columna),
+               encabezados))
+    print(fila("nombres (todos)", (nombre_columna_anterior, nombre_columna_tabla, normalizar_nombre_columna),
+               plano_basico))
@@ -0,0 +1,85 @@
+"""
+Compara filas/s del tokenizador de comun/tokenizador.py contra la ruta
+anterior de CSVProcessor (preprocess_line + csv.reader + postprocess_field)
+sobre líneas sintéticas de 30 columnas tipo Dynamics 365.
+
+Uso: python benchmarks/benchmark_tokenizador.py [filas]
+"""
+import csv
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from comun.tokenizador import iter_filas, TEMP_COMMA, TEMP_NEWLINE
+
+COLUMNAS = 30
+VALORES = [
+    "2024-09-12", "12/09/2024", "DIRECCION SECCIONAL DE IMPUESTOS DE CALI",
+    "900123456-7", "Peticion", "Cerrada", "Bogota, D.C.", "", "nan",
+    "Descripcion larga del caso con varias palabras", "45123",
+]
+VALORES_CON_COMILLAS = ['"texto, con coma"', 'linea\\ncon salto', '"dijo ""si"""']
+
+
+def preprocess_line(line: str) -> str:
+    """Ruta anterior: marca comas fuera de comillas caracter por caracter."""
+    if not line.strip():
+        return line
+    line = line.replace('\\n', TEMP_NEWLINE)
+    in_quotes = False
+    processed = []
+    for char in line:
+        if char == '"':
+            in_quotes = not in_quotes
+            processed.append(char)
+        elif char == ',' and not in_quotes:
+            processed.append(TEMP_COMMA)
+        else:
+            processed.append(char)
+    return ''.join(processed)
+
+
+def postprocess_field(field: str) -> str:
+    return field.replace(TEMP_COMMA, ',').replace(TEMP_NEWLINE, '\n')
+
+
+def ruta_anterior(lineas):
+    reader = csv.reader([preprocess_line(l) for l in lineas], delimiter='|', quotechar='"', escapechar='\\')
+    return [[postprocess_field(f) for f in row] for row in reader]
+
+
+def ruta_nueva(lineas):
+    return list(iter_filas(lineas, '|'))
+
+
+def generar_lineas(filas: int, proporcion_comillas: float):
+    random.seed(42)
+    lineas = []
+    for _ in range(filas):
+        campos = [random.choice(VALORES) for _ in range(COLUMNAS)]
+        if random.random() < proporcion_comillas:
+            campos[random.randrange(COLUMNAS)] = random.choice(VALORES_CON_COMILLAS)
+        lineas.append('|'.join(campos))
+    return lineas
+
+
+def medir(funcion, lineas, repeticiones: int = 3) -> float:
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(lineas)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return len(lineas) / mejor
+
+
+if __name__ == "__main__":
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for proporcion in (0.0, 0.05, 0.5):
+        lineas = generar_lineas(filas, proporcion)
+        assert ruta_anterior(lineas) == ruta_nueva(lineas), "Los resultados no coinciden"
+        anterior = medir(ruta_anterior, lineas)
+        nueva = medir(ruta_nueva, lineas)
+        print(f"{proporcion:>5.0%} con comillas | anterior: {anterior:>10,.0f} filas/s | "
+              f"tokenizador: {nueva:>10,.0f} filas/s | x{nueva / anterior:.1f}")
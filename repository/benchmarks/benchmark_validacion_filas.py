@@ -0,0 +1,141 @@
+"""
+Compara filas/s de la validación por celda anterior de CSVProcessor
+(_get_expected_type + _validate_value en cada celda) contra la función por
+fila compilada desde type_mapping y contra la validación por columnas en
+lotes, con y sin las columnas de baja cardinalidad traducidas por valor
+distinto (comun/cardinalidad.py), sobre el layout de 43 columnas de UGPP PQR.
+
+Uso: python benchmarks/benchmark_validacion_filas.py [filas]
+"""
+import os
+import random
+import sys
+import time
+from dataclasses import astuple
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(RAIZ, 'proyectos', 'UGPP', 'PQR'))
+from transformar_columnas_pqr_ugpp import CSVProcessor
+import comun.procesador_csv
+from validadores.validadores_pqr_ugpp import ValidadoresPQRUGPP
+from valores_choice.categoria_1 import VALORES_CATEGORIA_1
+from valores_choice.clasificacion import VALORES_CLASIFICACION
+from valores_choice.dependen_asigna import VALORES_DEPENDENCIA_ASIGNA
+
+COLUMNAS = 43
+TYPE_MAPPING = {
+    "int": [],
+    "float": [],
+    "date": [12, 13, 14, 15],
+    "datetime": [],
+    "str": [
+        1, 2, 3, 5, 8, 9, 10, 11, 16, 17, 18, 19, 20,
+        21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+        32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43
+    ],
+    "str-sin-caracteres-especiales": [],
+    "nit": [],
+    "choice_categoria_1": [4],
+    "choice_clasificacion": [6],
+    "choice_dependen_asigna": [7],
+}
+TEXTOS = ["ARCHIVO_UGPP_PQR_2021.csv", "01_2021", "Peticion de informacion", "", "nan", "BOGOTA", "12345"]
+FECHAS = ["2021-03-15", "15/03/2021", "2021/03/15", "2021-03-15 08:30:00", "44270", ""]
+
+
+class CSVProcessorPorFila(CSVProcessor):
+    """Función por fila compilada, sin la validación por lotes."""
+
+    def _compile_batch_validator(self, header, type_mapping=None):
+        return None
+
+
+class CSVProcessorSinDistintos(CSVProcessor):
+    """Por lotes, pero ninguna columna se toma como de baja cardinalidad."""
+
+    def _iter_processed_rows(self, *args, **kwargs):
+        detectar = comun.procesador_csv.columnas_baja_cardinalidad
+        comun.procesador_csv.columnas_baja_cardinalidad = lambda filas: []
+        try:
+            yield from super()._iter_processed_rows(*args, **kwargs)
+        finally:
+            comun.procesador_csv.columnas_baja_cardinalidad = detectar
+
+
+class CSVProcessorAnterior(CSVProcessorPorFila):
+    """Ruta anterior: busca el tipo y arma el diccionario de métodos en cada celda."""
+
+    def _get_expected_type(self, col_num, type_mapping):
+        for type_name, columns in type_mapping.items():
+            if col_num in columns:
+                return type_name
+        return "str"
+
+    def _compile_row_validator(self, header, type_mapping=None):
+        def validate_row(row, row_num, errors):
+            processed_row = []
+            for col_num, (raw_val, col_name) in enumerate(zip(row, header), start=1):
+                clean_val = self.clean_value(raw_val)
+                if type_mapping and self.validator:
+                    expected_type = self._get_expected_type(col_num, type_mapping)
+                    clean_val, error = self._validate_value(clean_val, expected_type, col_name, col_num, row_num)
+                    if error:
+                        errors.append(error)
+                processed_row.append(clean_val)
+            return processed_row
+        return validate_row
+
+
+def generar_filas(filas: int):
+    random.seed(42)
+    choices = {4: VALORES_CATEGORIA_1, 6: VALORES_CLASIFICACION, 7: VALORES_DEPENDENCIA_ASIGNA}
+    resultado = []
+    for _ in range(filas):
+        fila = []
+        for col_num in range(1, COLUMNAS + 1):
+            if col_num in choices:
+                fila.append(random.choice(choices[col_num] + ["valor inexistente"]))
+            elif col_num in TYPE_MAPPING["date"]:
+                fila.append(random.choice(FECHAS))
+            else:
+                fila.append(random.choice(TEXTOS))
+        resultado.append(fila)
+    return resultado
+
+
+def ejecutar(processor, header, filas):
+    return list(processor._iter_processed_rows(filas, header, header, TYPE_MAPPING))
+
+
+def medir(processor, header, filas, repeticiones: int = 3) -> float:
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        ejecutar(processor, header, filas)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return len(filas) / mejor
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    header = [f"COL_{i}" for i in range(1, COLUMNAS + 1)]
+    filas = generar_filas(cantidad)
+    variantes = {
+        "anterior": CSVProcessorAnterior(validator=ValidadoresPQRUGPP()),
+        "por fila": CSVProcessorPorFila(validator=ValidadoresPQRUGPP()),
+        "lotes sin distintos": CSVProcessorSinDistintos(validator=ValidadoresPQRUGPP()),
+        "por lotes": CSVProcessor(validator=ValidadoresPQRUGPP()),
+    }
+
+    def como_tuplas(resultados):
+        return [(fila, [astuple(e) for e in errores]) for fila, errores in resultados]
+
+    esperado = como_tuplas(ejecutar(variantes["anterior"], header, filas))
+    for processor in variantes.values():
+        assert como_tuplas(ejecutar(processor, header, filas)) == esperado
+
+    base = None
+    for nombre, processor in variantes.items():
+        velocidad = medir(processor, header, filas)
+        base = base or velocidad
+        print(f"{COLUMNAS} columnas | {nombre:>19}: {velocidad:>10,.0f} filas/s | x{velocidad / base:.1f}")
@@ -0,0 +1,148 @@
+"""
+Mide valores/s de los métodos comunes de validación (comun/nucleo_validacion.py)
+en las ocho clases Validadores*: todas comparten la misma ruta, solo cambian
+las políticas de fecha y NIT. Como referencia se mide la implementación que
+antes estaba copiada en cada clase (regex sin compilar y strptime con
+try/except), y se verifica que da lo mismo que las entidades con sus reglas.
+
+Uso: python benchmarks/benchmark_validadores.py [valores]
+"""
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(RAIZ)
+
+# (proyecto, módulo, clase)
+ENTIDADES = [
+    ('DIAN/defensoria', 'validadores_defensoria', 'ValidadoresDefensoria'),
+    ('DIAN/PQR', 'validadores_pqr_dynamics', 'ValidadoresPQRDynamics'),
+    ('DIAN/PQR', 'validadores_pqr_muisca', 'ValidadoresPQRMuisca'),
+    ('DIAN/disciplinarios', 'validadores_disciplinarios', 'ValidadoresDisciplinarios'),
+    ('UGPP/PQR', 'validadores_pqr_ugpp', 'ValidadoresPQRUGPP'),
+    ('UGPP/disciplinarios', 'validadores_disciplianrios', 'ValidadoresDisciplinarios'),
+    ('COLJUEGOS/pqr', 'validadores_pqr_coljuegos', 'ValidadoresPQRColjuegos'),
+    ('COLJUEGOS/disciplinarios', 'validadores_disciplianrios', 'ValidadoresDisciplinarios'),
+]
+ENTEROS = ["12345", "1.234", "-7", "abc", "12 345", "", "3,5"]
+NITS = ["900123456-7", "900.123.456", "900123456.000000", "NaN", "sin registro", "ABC", "123-45-6"]
+FECHAS = ["2021-03-15", "15/03/2021", "2021/03/15", "2021-03-15 08:30:00", "2021-03-15 00:00:00",
+          "44270", "2021-03-15 - 2021-03-20", "1/3/2021", "no es fecha"]
+
+DATE_FORMATS = {
+    'date': "%Y-%m-%d",
+    'date_YY': "%Y/%m/%d",
+    'date_dd_mm_yyyy': "%d/%m/%Y",
+    'datetime': "%Y-%m-%d %H:%M:%S"
+}
+
+
+class ValidadoresAnteriores:
+    """Copia de referencia de los métodos comunes antes del núcleo (reglas de UGPP PQR)."""
+
+    def validar_entero(self, valor):
+        valor_limpio = re.sub(r"[^\d.-]", "", str(valor))
+        return valor_limpio, re.fullmatch(r"^-?\d+$", valor_limpio) is not None
+
+    def limpiar_nit(self, valor):
+        if not valor or str(valor).strip().lower() in {'nan', 'null', '', 'sin registro', 'desconocido',
+                                                      'no aplica', 'ninguna', 'no registra', 'sin', 'sin id'}:
+            return "", False
+        valor_limpio = str(valor).strip()
+        if re.fullmatch(r'[a-zA-Z\s]+', valor_limpio):
+            return valor_limpio, True
+        valor_limpio = valor_limpio.replace(".000000", "")
+        if re.fullmatch(r'\d+(?:-\d+)*', valor_limpio):
+            valor_limpio = valor_limpio.split("-")[0]
+        return valor_limpio, not re.fullmatch(r"^[a-zA-Z]+$", valor_limpio) is not None
+
+    def validar_date(self, valor, formato_salida='date'):
+        valor = str(valor).strip()
+        formatos_intento = [
+            ('datetime', DATE_FORMATS['datetime'], False),
+            ('date', DATE_FORMATS['date'], False),
+            ('date_YY', DATE_FORMATS['date_YY'], False),
+            ('date_dd_mm_yyyy', DATE_FORMATS['date_dd_mm_yyyy'], False),
+            ('date_range_iso', r'^(\d{4}-\d{2}-\d{2})(?: - \d{4}-\d{2}-\d{2})?$', True),
+            ('date_range_dmy', r'^(\d{1,2}/\d{1,2}/\d{4})(?: - \d{1,2}/\d{1,2}/\d{4})?$', True)
+        ]
+        dt = None
+        formato_detectado = None
+        for formato, date_format, es_rango in formatos_intento:
+            try:
+                if es_rango:
+                    match = re.match(date_format, valor)
+                    if not match:
+                        continue
+                    formato_fecha = 'date_dd_mm_yyyy' if formato == 'date_range_dmy' else 'date'
+                    dt = datetime.strptime(match.group(1), DATE_FORMATS[formato_fecha])
+                    formato_detectado = 'range'
+                    break
+                dt = datetime.strptime(valor, date_format)
+                formato_detectado = formato
+                break
+            except ValueError:
+                continue
+        if dt is None:
+            try:
+                excel_num = float(valor)
+                if 0 <= excel_num <= 100000:
+                    return (datetime(1899, 12, 30) + timedelta(days=excel_num)).strftime('%Y-%m-%d'), True
+                return "", False
+            except ValueError:
+                return "", False
+        if formato_detectado == 'datetime' and dt.time() != datetime.min.time():
+            return valor, True
+        return dt.strftime(DATE_FORMATS['date']), True
+
+
+def cargar(proyecto, modulo, clase):
+    directorio = os.path.join(RAIZ, 'proyectos', *proyecto.split('/'))
+    sys.path.insert(0, directorio)
+    for nombre in [n for n in sys.modules if n == 'validadores' or n.startswith(('validadores.', 'valores_choice'))]:
+        del sys.modules[nombre]
+    try:
+        return getattr(__import__(f'validadores.{modulo}', fromlist=[clase]), clase)()
+    finally:
+        sys.path.remove(directorio)
+
+
+def medir(metodo, valores, repeticiones: int = 3) -> float:
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for valor in valores:
+            metodo(valor)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return len(valores) / mejor
+
+
+def fila(nombre, validador, datos) -> str:
+    metodo_fecha = getattr(validador, 'validar_date', None) or validador.validar_fecha
+    velocidades = [medir(validador.validar_entero, datos['entero']),
+                   medir(validador.limpiar_nit, datos['nit']),
+                   medir(metodo_fecha, datos['fecha'])]
+    return f"{nombre:>50} | " + " | ".join(f"{v:>10,.0f}" for v in velocidades)
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    random.seed(42)
+    datos = {
+        'entero': [random.choice(ENTEROS) for _ in range(cantidad)],
+        'nit': [random.choice(NITS) for _ in range(cantidad)],
+        'fecha': [random.choice(FECHAS) for _ in range(cantidad)],
+    }
+    anteriores = ValidadoresAnteriores()
+    ugpp = cargar(*ENTIDADES[4])
+    for tipo, metodo in (('entero', 'validar_entero'), ('nit', 'limpiar_nit'), ('fecha', 'validar_date')):
+        assert [getattr(anteriores, metodo)(v) for v in datos[tipo]] == [getattr(ugpp, metodo)(v) for v in datos[tipo]]
+
+    print(f"{'valores/s':>50} | {'entero':>10} | {'nit':>10} | {'fecha':>10}")
+    print(fila("anterior (copia por clase)", anteriores, datos))
+    for proyecto, modulo, clase in ENTIDADES:
+        print(fila(f"{proyecto}.{clase}", cargar(proyecto, modulo, clase), datos))
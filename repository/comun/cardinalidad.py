@@ -0,0 +1,62 @@
+from typing import Dict, List, Sequence, Tuple
+
+# Una columna es de baja cardinalidad si en la muestra tiene a lo sumo esta
+# proporción de valores distintos (250 en un lote de 5000 filas)
+PROPORCION_DISTINTOS = 0.05
+# Valores distintos que se recuerdan por columna; si la muestra se equivocó
+# y la columna sigue creciendo, vuelve a validarse celda por celda
+MAX_DISTINTOS = 10_000
+
+
+def columnas_baja_cardinalidad(filas: Sequence[Sequence[str]],
+                               proporcion: float = PROPORCION_DISTINTOS) -> List[int]:
+    """Índices de las columnas con pocos valores distintos en la muestra `filas`."""
+    if not filas:
+        return []
+    limite = len(filas) * proporcion
+    return [indice for indice, columna in enumerate(zip(*filas)) if len(set(columna)) <= limite]
+
+
+class MapaDistintos:
+    """
+    Resultado de limpiar y validar cada valor distinto de una columna:
+    valor crudo -> valor final, y para los que no pasaron la validación,
+    valor crudo -> valor limpio (el que va en el error).
+
+    Con él, el costo de una columna de catálogo, estado o mes de reporte
+    depende de cuántos valores distintos tiene y no de cuántas filas.
+    """
+
+    __slots__ = ('resultados', 'invalidos', 'maximo')
+
+    def __init__(self, maximo: int = MAX_DISTINTOS):
+        self.resultados: Dict[str, str] = {}
+        self.invalidos: Dict[str, str] = {}
+        self.maximo = maximo
+
+    def __len__(self) -> int:
+        return len(self.resultados)
+
+    def faltantes(self, columna: Sequence[str]) -> List[str]:
+        """Valores distintos de `columna` que todavía no tienen resultado, en orden de aparición."""
+        resultados = self.resultados
+        return [valor for valor in dict.fromkeys(columna) if valor not in resultados]
+
+    def agregar(self, valores: Sequence[str], finales: Sequence[str],
+                invalidos: Sequence[Tuple[int, str]]) -> None:
+        """Guarda los resultados de `valores`; `invalidos` son (posición, valor limpio)."""
+        self.resultados.update(zip(valores, finales))
+        for posicion, limpio in invalidos:
+            self.invalidos[valores[posicion]] = limpio
+
+    def desbordado(self) -> bool:
+        return len(self.resultados) > self.maximo
+
+    def aplicar(self, columna: Sequence[str]) -> Tuple[List[str], List[Tuple[int, str]]]:
+        """Valores finales de `columna` y (posición, valor limpio) de los inválidos."""
+        finales = list(map(self.resultados.__getitem__, columna))
+        invalidos = self.invalidos
+        if not invalidos:
+            return finales, []
+        return finales, [(posicion, invalidos[valor]) for posicion, valor in enumerate(columna)
+                         if valor in invalidos]
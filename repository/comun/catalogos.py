@@ -0,0 +1,61 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from comun.coincidencia_difusa import IndiceDifuso
+
+# Propuestas difusas que se recuerdan por catálogo antes de empezar de nuevo
+MAX_PROPUESTAS = 100_000
+
+
+class IndiceCatalogo:
+    """
+    Catálogo de valores_choice indexado una sola vez al importar.
+
+    Los VALORES_* son listas (pertenencia O(n)) y los VALORES_REEMPLAZO_*
+    un diccionario aparte. El índice junta ambos: cada forma normalizada
+    conocida (valor del catálogo o clave de reemplazo) apunta a su valor
+    canónico y a si ese valor está en el catálogo, así que una celda se
+    resuelve con una sola búsqueda en un diccionario.
+
+    Con `difuso`, lo que no aparece se busca en un índice de trigramas
+    (comun/coincidencia_difusa.py) sobre esas mismas formas conocidas y
+    `proponer` entrega el valor canónico de la más cercana. La propuesta no
+    reemplaza al valor: el validador la cuenta con el `nombre` del catálogo
+    para el resumen de errores (ver NucleoValidacion._resolver_catalogo).
+    """
+
+    __slots__ = ('nombre', 'valores', '_canonicos', '_difuso', 'propuestas')
+
+    def __init__(self, valores: Iterable[str], reemplazos: Optional[Dict[str, str]] = None,
+                 difuso: bool = False, nombre: str = ''):
+        self.nombre = nombre
+        self.valores = frozenset(valores)
+        self._canonicos: Dict[str, Tuple[str, bool]] = {valor: (valor, True) for valor in self.valores}
+        for origen, destino in (reemplazos or {}).items():
+            self._canonicos[origen] = (destino, destino in self.valores)
+        # El índice de trigramas se arma con el primer valor que no aparece
+        self._difuso: Optional[IndiceDifuso] = None if difuso else False
+        self.propuestas: Dict[str, Optional[str]] = {}
+
+    def __contains__(self, valor: str) -> bool:
+        return valor in self.valores
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+    def proponer(self, normalizado: str) -> Optional[str]:
+        """Valor canónico de la forma conocida más cercana a un valor que no está en el índice."""
+        if self._difuso is False or normalizado in self._canonicos:
+            return None
+        if normalizado in self.propuestas:
+            return self.propuestas[normalizado]
+        if self._difuso is None:
+            self._difuso = IndiceDifuso(self._canonicos)
+        if len(self.propuestas) >= MAX_PROPUESTAS:
+            self.propuestas.clear()
+        cercana = self._difuso.proponer(normalizado)
+        propuesta = self.propuestas[normalizado] = None if cercana is None else self._canonicos[cercana][0]
+        return propuesta
+
+    def resolver(self, normalizado: str) -> Tuple[str, bool]:
+        """(valor canónico, está en el catálogo) para un valor ya normalizado."""
+        return self._canonicos.get(normalizado) or (normalizado, False)
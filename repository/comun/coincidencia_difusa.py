@@ -0,0 +1,112 @@
+from collections import Counter, defaultdict
+from itertools import chain
+from typing import Dict, Iterable, List, Optional
+
+Q = 3
+_RELLENO = '\x00' * (Q - 1)
+
+
+def _trigramas(valor: str) -> Counter:
+    relleno = f"{_RELLENO}{valor}{_RELLENO}"
+    return Counter(relleno[i:i + Q] for i in range(len(relleno) - Q + 1))
+
+
+def distancia_acotada(a: str, b: str, maximo: int) -> Optional[int]:
+    """
+    Distancia de Levenshtein entre `a` y `b` si es <= `maximo`; None si no.
+    Solo recorre la franja diagonal de ancho 2*maximo+1 y corta en cuanto
+    toda una fila supera el máximo.
+    """
+    if abs(len(a) - len(b)) > maximo:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    fuera = maximo + 1
+    anterior = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        desde, hasta = max(1, i - maximo), min(len(b), i + maximo)
+        actual = [fuera] * (len(b) + 1)
+        actual[0] = i if i <= maximo else fuera
+        caracter = a[i - 1]
+        mejor_fila = actual[0]
+        for j in range(desde, hasta + 1):
+            costo = anterior[j - 1] + (caracter != b[j - 1])
+            if anterior[j] + 1 < costo:
+                costo = anterior[j] + 1
+            if actual[j - 1] + 1 < costo:
+                costo = actual[j - 1] + 1
+            actual[j] = costo if costo <= maximo else fuera
+            if actual[j] < mejor_fila:
+                mejor_fila = actual[j]
+        if mejor_fila > maximo:
+            return None
+        anterior = actual
+    return anterior[len(b)] if anterior[len(b)] <= maximo else None
+
+
+class IndiceDifuso:
+    """
+    Índice invertido de trigramas sobre un catálogo para proponer el valor
+    más cercano a un texto que no está en él (errores de digitación,
+    espacios dobles, palabras pegadas).
+
+    Un texto a distancia de edición <= k de un valor de longitud n comparte
+    con él al menos max(len) + Q - 1 - k*Q trigramas (lema de q-gramas), así
+    que solo se calcula la distancia, acotada, de los pocos candidatos que
+    pasan ese filtro. Se propone un valor solo si es el único a la menor
+    distancia; los empates no se resuelven.
+    """
+
+    def __init__(self, valores: Iterable[str], longitud_minima: int = 5,
+                 distancia_corta: int = 1, distancia_larga: int = 2, longitud_larga: int = 10):
+        self.valores: List[str] = sorted(set(valores))
+        self.longitud_minima = longitud_minima
+        self.distancia_corta = distancia_corta
+        self.distancia_larga = distancia_larga
+        self.longitud_larga = longitud_larga
+        # trigrama -> niveles: en el nivel j las posiciones de los valores que
+        # tienen el trigrama al menos j+1 veces (casi siempre hay un solo nivel).
+        # Un texto con el trigrama v veces comparte min(v, k) con un valor que
+        # lo tiene k veces: las apariciones de su posición en los v primeros
+        # niveles
+        self._indice: Dict[str, List[List[int]]] = defaultdict(list)
+        for posicion, valor in enumerate(self.valores):
+            for trigrama, veces in _trigramas(valor).items():
+                niveles = self._indice[trigrama]
+                while len(niveles) < veces:
+                    niveles.append([])
+                for nivel in niveles[:veces]:
+                    nivel.append(posicion)
+
+    def distancia_maxima(self, longitud: int) -> int:
+        return self.distancia_larga if longitud >= self.longitud_larga else self.distancia_corta
+
+    def proponer(self, valor: str) -> Optional[str]:
+        """Valor del catálogo más cercano a `valor`, o None si no hay uno claro."""
+        if len(valor) < self.longitud_minima or not self.valores:
+            return None
+        maximo = self.distancia_maxima(len(valor))
+        # Solo se cuentan los candidatos de las listas de los trigramas del
+        # valor, no todo el catálogo
+        indice = self._indice
+        compartidos = Counter(chain.from_iterable(
+            chain.from_iterable(indice[trigrama][:veces])
+            for trigrama, veces in _trigramas(valor).items() if trigrama in indice
+        ))
+
+        mejor, mejor_distancia, empate = None, maximo + 1, False
+        minimo_valor = len(valor) + Q - 1 - maximo * Q
+        for posicion, comunes in compartidos.items():
+            if comunes < minimo_valor:
+                continue
+            candidato = self.valores[posicion]
+            if comunes < len(candidato) + Q - 1 - maximo * Q:
+                continue
+            distancia = distancia_acotada(valor, candidato, min(maximo, mejor_distancia))
+            if distancia is None:
+                continue
+            if distancia < mejor_distancia:
+                mejor, mejor_distancia, empate = candidato, distancia, False
+            elif distancia == mejor_distancia:
+                empate = True
+        return None if empate else mejor
@@ -0,0 +1,71 @@
+import gzip
+import io
+from typing import IO, Optional, Tuple
+
+EXTENSION_GZIP = '.gz'
+EXTENSION_ZSTD = '.zst'
+EXTENSIONES_COMPRIMIDAS = (EXTENSION_GZIP, EXTENSION_ZSTD)
+# Niveles por defecto: el 9 que usa gzip.open comprime apenas un poco más
+# que el 6 y tarda varias veces más; el 3 es el nivel por defecto de zstd
+NIVEL_GZIP = 6
+NIVEL_ZSTD = 3
+
+
+def _zstandard():
+    """zstandard es opcional: solo se necesita para leer o escribir .zst."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("Los archivos .zst necesitan zstandard (pip install zstandard)") from e
+    return zstandard
+
+
+def separar_compresion(ruta: str) -> Tuple[str, str]:
+    """('datos.csv', '.gz') para 'datos.csv.gz'; ('datos.csv', '') si no está comprimido."""
+    for extension in EXTENSIONES_COMPRIMIDAS:
+        if ruta.lower().endswith(extension):
+            return ruta[:-len(extension)], ruta[-len(extension):]
+    return ruta, ''
+
+
+def es_comprimido(ruta: str) -> bool:
+    return bool(separar_compresion(ruta)[1])
+
+
+def _abrir_zstd(ruta: str, modo: str, nivel: Optional[int]) -> IO[bytes]:
+    zstandard = _zstandard()
+    if 'r' in modo:
+        # read_across_frames: los .zst concatenados (cat a.zst b.zst) se leen
+        # completos, como hace la herramienta zstd
+        lector = zstandard.ZstdDecompressor().stream_reader(open(ruta, 'rb'), read_across_frames=True,
+                                                           closefd=True)
+        return io.BufferedReader(lector)
+    compresor = zstandard.ZstdCompressor(level=NIVEL_ZSTD if nivel is None else nivel)
+    return compresor.stream_writer(open(ruta, modo.replace('t', '').replace('b', '') + 'b'), closefd=True)
+
+
+def abrir(ruta: str, modo: str = 'r', encoding: Optional[str] = None, newline: Optional[str] = None,
+          nivel: Optional[int] = None) -> IO:
+    """
+    open() que comprime o descomprime según la extensión: .gz con gzip y
+    .zst con zstandard; cualquier otra ruta se abre tal cual. La
+    (des)compresión es en streaming, por bloques, a medida que se lee o se
+    escribe, así que el archivo descomprimido nunca está completo en disco
+    ni en memoria.
+
+    Los modos son los de open() ('r', 'w', 'rb', 'wb', 'a'...); sin 'b' el
+    archivo es de texto con `encoding` y `newline`. `nivel` es el nivel de
+    compresión al escribir (NIVEL_GZIP o NIVEL_ZSTD si no se indica).
+    """
+    _, extension = separar_compresion(ruta)
+    if not extension:
+        return open(ruta, modo, encoding=encoding, newline=newline)
+    binario = 'b' in modo
+    if extension == EXTENSION_GZIP:
+        archivo = gzip.open(ruta, modo.replace('t', '').replace('b', '') + 'b',
+                            compresslevel=NIVEL_GZIP if nivel is None else nivel)
+    else:
+        archivo = _abrir_zstd(ruta, modo, nivel)
+    if binario:
+        return archivo
+    return io.TextIOWrapper(archivo, encoding=encoding, newline=newline)
@@ -0,0 +1,95 @@
+import codecs
+import os
+from typing import List
+
+from comun.compresion import abrir, es_comprimido
+from comun.manifiesto import actualizar_manifiesto, firma_archivo, leer_manifiesto
+
+TAMANO_MUESTRA = 64 * 1024
+BOM_UTF8 = codecs.BOM_UTF8
+
+
+def _leer_muestras(ruta: str, tamano: int) -> List[bytes]:
+    """Lee bloques del inicio, la mitad y el final del archivo."""
+    total = os.path.getsize(ruta)
+    with open(ruta, 'rb') as f:
+        if total <= 3 * tamano:
+            return [f.read()]
+        muestras = []
+        for inicio in (0, (total - tamano) // 2, total - tamano):
+            f.seek(inicio)
+            muestras.append(f.read(tamano))
+        return muestras
+
+
+def _es_utf8(muestra: bytes, es_inicio: bool) -> bool:
+    """Valida UTF-8 tolerando un carácter multibyte cortado en los bordes."""
+    if not es_inicio:
+        # Saltar bytes de continuación (10xxxxxx) de un carácter cortado
+        corte = 0
+        while corte < 3 and corte < len(muestra) and 0x80 <= muestra[corte] <= 0xBF:
+            corte += 1
+        muestra = muestra[corte:]
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(muestra, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _es_cp1252(muestra: bytes) -> bool:
+    try:
+        muestra.decode('cp1252')
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _leer_muestra_comprimida(ruta: str, tamano: int) -> List[bytes]:
+    """
+    Un .gz o .zst no permite saltar a la mitad ni al final sin descomprimir
+    lo anterior, así que se toma solo el inicio, con el mismo presupuesto
+    que las tres muestras de un archivo sin comprimir.
+    """
+    with abrir(ruta, 'rb') as f:
+        return [f.read(3 * tamano)]
+
+
+def detectar_encoding(ruta: str, tamano_muestra: int = TAMANO_MUESTRA) -> str:
+    """
+    Elige utf-8-sig, utf-8, cp1252 o latin-1 a partir de una muestra acotada
+    (inicio, mitad y final) sin decodificar el archivo completo. De los
+    archivos comprimidos se usa solo el inicio (ver _leer_muestra_comprimida).
+    """
+    if es_comprimido(ruta):
+        muestras = _leer_muestra_comprimida(ruta, tamano_muestra)
+    else:
+        muestras = _leer_muestras(ruta, tamano_muestra)
+    if muestras[0].startswith(BOM_UTF8):
+        return 'utf-8-sig'
+    if all(_es_utf8(m, i == 0) for i, m in enumerate(muestras)):
+        return 'utf-8'
+    # cp1252 deja sin definir 0x81, 0x8D, 0x8F, 0x90 y 0x9D; latin-1 acepta todo
+    if all(_es_cp1252(m) for m in muestras):
+        return 'cp1252'
+    return 'latin-1'
+
+
+def encoding_de_archivo(ruta: str, tamano_muestra: int = TAMANO_MUESTRA,
+                        usar_manifiesto: bool = False) -> str:
+    """
+    Retorna el encoding de un archivo. Con `usar_manifiesto` se reutiliza el
+    registrado en su manifiesto si el archivo no cambió desde la última
+    detección, y se escribe uno junto al archivo si no lo hay: solo conviene
+    cuando la carpeta de entrada es propia y se puede escribir.
+    """
+    firma = firma_archivo(ruta)
+    if usar_manifiesto:
+        manifiesto = leer_manifiesto(ruta)
+        if manifiesto.get('encoding') and manifiesto.get('firma') == firma:
+            return manifiesto['encoding']
+
+    encoding = detectar_encoding(ruta, tamano_muestra)
+    if usar_manifiesto:
+        actualizar_manifiesto(ruta, {'firma': firma, 'encoding': encoding})
+    return encoding
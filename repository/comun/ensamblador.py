@@ -0,0 +1,85 @@
+from collections import deque
+from typing import Iterable, Iterator, List, Optional
+
+# Filas que puede sumar un registro partido antes de darlo por fragmentos sueltos
+MAX_FRAGMENTOS = 100
+
+
+def _unir(fragmentos: List[List[str]]) -> List[str]:
+    """Une las filas de un registro: el último campo de una con el primero de la siguiente."""
+    registro = list(fragmentos[0])
+    for fragmento in fragmentos[1:]:
+        continuacion = fragmento or ['']  # Línea vacía dentro del texto libre
+        registro[-1] = registro[-1] + '\n' + continuacion[0]
+        registro.extend(continuacion[1:])
+    return registro
+
+
+def ensamblar_registros(filas: Iterable[List[str]], columnas_esperadas: int,
+                        resto: Optional[List[List[str]]] = None) -> Iterator[List[str]]:
+    """
+    Une en un solo registro las filas partidas por saltos de línea reales.
+
+    iter_filas ya junta las líneas de un campo entre comillas (estado de
+    comillas de csv.reader). Aquí se reparan los saltos sin comillas, como
+    los de las exportaciones de Muisca: una fila con menos columnas que el
+    encabezado se completa con las siguientes, uniendo el último campo de una
+    con el primero de la otra mediante '\\n'.
+
+    El ancho solo no distingue una continuación de un registro nuevo, así que
+    la unión se acepta únicamente si llega exactamente a `columnas_esperadas`
+    y ninguna de las filas que continúan podría ser un registro por sí sola
+    (tiene el ancho completo o más). Si no, la primera fila pendiente se
+    entrega tal cual (la validación la reporta) y las demás se vuelven a
+    revisar desde la siguiente. Así un resto de texto libre tras una fila
+    completa no se pega al registro que sigue, y dos filas cortas que no
+    suman el ancho no se unen. Solo se retiene en memoria el registro en
+    construcción (hasta MAX_FRAGMENTOS filas).
+
+    Con `resto`, las filas del registro que queda incompleto al final no se
+    entregan: se agregan a `resto` para seguir uniéndolas con las filas que
+    vienen después (un rango de bytes que termina a mitad de un registro).
+    Pasarlas como primeras filas de otra llamada retoma la unión donde quedó.
+    Tras una fila del ancho completo nunca queda nada pendiente.
+    """
+    fragmentos: List[List[str]] = []
+    ancho = 0
+    cola = deque()
+    for fila in filas:
+        cola.append(fila)
+        while cola:
+            fila = cola.popleft()
+            if fragmentos:
+                largo = len(fila) or 1
+                if (largo < columnas_esperadas and ancho + largo - 1 <= columnas_esperadas
+                        and len(fragmentos) < MAX_FRAGMENTOS):
+                    fragmentos.append(fila)
+                    ancho += largo - 1
+                    if ancho == columnas_esperadas:
+                        yield _unir(fragmentos)
+                        fragmentos = []
+                    continue
+                # La unión no llega al ancho: la primera fila queda sola y el
+                # resto se revisa de nuevo, empezando por la que le seguía
+                yield fragmentos[0]
+                cola.appendleft(fila)
+                cola.extendleft(reversed(fragmentos[1:]))
+                fragmentos = []
+                continue
+
+            if 0 < len(fila) < columnas_esperadas:
+                fragmentos = [fila]
+                ancho = len(fila)
+            else:
+                yield fila
+
+    if resto is not None:
+        resto.extend(fragmentos)
+        return
+    while fragmentos:
+        # Al final del archivo, los fragmentos que no completaron un registro
+        yield fragmentos[0]
+        pendientes = fragmentos[1:]
+        fragmentos = []
+        for fila in ensamblar_registros(pendientes, columnas_esperadas, fragmentos):
+            yield fila
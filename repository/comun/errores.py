@@ -0,0 +1,184 @@
+import csv
+import os
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from comun.compresion import abrir, separar_compresion
+
+# Errores que se guardan en memoria antes de escribirse al archivo
+UMBRAL_ERRORES = 50_000
+# Columnas del archivo de errores, en el orden de los campos de ErrorInfo
+CAMPOS_ERROR = ('columna', 'numero_columna', 'tipo', 'valor', 'fila', 'error')
+# Columnas del resumen: una fila por cada valor frecuente de cada columna/mensaje
+CAMPOS_RESUMEN = ('columna', 'numero_columna', 'tipo', 'error', 'errores', 'en_detalle', 'valor', 'veces')
+# Valores más frecuentes que se informan por columna y mensaje
+TOP_VALORES = 10
+# Valores distintos que se cuentan por columna y mensaje; al pasarse se
+# conservan los más frecuentes (los conteos quedan como mínimos)
+MAX_VALORES_CONTADOS = 1000
+# Tipo de las filas del resumen con propuestas de los catálogos
+TIPO_PROPUESTA = 'propuesta_catalogo'
+
+
+def ruta_resumen(ruta: str) -> str:
+    """
+    Archivo de resumen que va junto al de errores: errores.csv ->
+    errores_resumen.csv (errores.csv.gz -> errores_resumen.csv.gz).
+    """
+    ruta, compresion = separar_compresion(ruta)
+    base, extension = os.path.splitext(ruta)
+    return f"{base}_resumen{extension or '.csv'}{compresion}"
+
+
+class AlmacenErrores:
+    """
+    Errores de validación guardados en columnas compactas y escritos al
+    archivo de errores cada `umbral` registros, así que la memoria no crece
+    con la cantidad de errores del archivo.
+
+    Cada error ocupa una entrada en dos array (fila y un código para la
+    combinación columna/número/tipo/mensaje, que se repite en todos los
+    errores de una misma columna) y una referencia al valor. El archivo se
+    crea con el primer error que se escribe y queda igual al que antes se
+    armaba con csv.DictWriter sobre los ErrorInfo.
+
+    Con `limite`, el detalle guarda a lo sumo esa cantidad de filas por
+    columna y mensaje: una columna corrida entera (un cambio de layout) ya
+    no produce millones de líneas casi iguales. Todos los errores se cuentan
+    igual, junto con los valores más frecuentes de cada columna y mensaje,
+    y al cerrar se escribe el resumen (ver ruta_resumen).
+
+    Las propuestas de los catálogos (ver comun/catalogos.py) van al
+    final del resumen, con tipo TIPO_PROPUESTA y el nombre del catálogo en
+    columna.
+
+    Sin `ruta` los errores solo se cuentan. Si la ruta termina en .gz o
+    .zst, el detalle y el resumen se escriben comprimidos con `nivel` (ver
+    comun/compresion.py).
+    """
+
+    def __init__(self, ruta: Optional[str], encoding: str = 'utf-8', umbral: int = UMBRAL_ERRORES,
+                 limite: Optional[int] = None, nivel: Optional[int] = None):
+        self.ruta = ruta
+        self.encoding = encoding
+        self.umbral = umbral
+        self.limite = limite
+        self.nivel = nivel
+        self.total = 0
+        self._codigos: Dict[Tuple[str, int, str, str], int] = {}
+        self._claves: List[Tuple[str, int, str, str]] = []
+        self._conteos: List[int] = []
+        self._valores_frecuentes: List[Counter] = []
+        self.propuestas = Counter()
+        self._archivo = None
+        self._escritor = None
+        self._reiniciar()
+
+    def _reiniciar(self) -> None:
+        self._filas = array('q')
+        self._codigos_error = array('l')
+        self._valores: List[str] = []
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __enter__(self) -> 'AlmacenErrores':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    @property
+    def en_detalle(self) -> int:
+        """Errores que van (o ya fueron) al archivo de detalle."""
+        if self.limite is None:
+            return self.total
+        return sum(min(conteo, self.limite) for conteo in self._conteos)
+
+    def agregar(self, error) -> None:
+        """Guarda un ErrorInfo (o cualquier objeto con sus campos)."""
+        self.total += 1
+        if self.ruta is None:
+            return
+        clave = (error.columna, error.numero_columna, error.tipo, error.error)
+        codigo = self._codigos.get(clave)
+        if codigo is None:
+            codigo = self._codigos[clave] = len(self._claves)
+            self._claves.append(clave)
+            self._conteos.append(0)
+            self._valores_frecuentes.append(Counter())
+        self._conteos[codigo] += 1
+        frecuentes = self._valores_frecuentes[codigo]
+        frecuentes[error.valor] += 1
+        if len(frecuentes) > 2 * MAX_VALORES_CONTADOS:
+            self._valores_frecuentes[codigo] = Counter(dict(frecuentes.most_common(MAX_VALORES_CONTADOS)))
+        if self.limite is not None and self._conteos[codigo] > self.limite:
+            return
+        self._filas.append(error.fila)
+        self._codigos_error.append(codigo)
+        self._valores.append(error.valor)
+        if len(self._valores) >= self.umbral:
+            self.volcar()
+
+    def extend(self, errores: Iterable) -> None:
+        for error in errores:
+            self.agregar(error)
+
+    def agregar_propuestas(self, propuestas: Counter) -> None:
+        """Suma propuestas de catálogo ((catálogo, valor, propuesta) -> veces) para el resumen."""
+        self.propuestas.update(propuestas)
+
+    def volcar(self) -> None:
+        """Escribe al archivo los errores que están en memoria."""
+        if not self._valores:
+            return
+        if self._escritor is None:
+            self._archivo = abrir(self.ruta, 'w', encoding=self.encoding, newline='', nivel=self.nivel)
+            self._escritor = csv.writer(self._archivo)
+            self._escritor.writerow(CAMPOS_ERROR)
+        claves = self._claves
+        self._escritor.writerows(
+            (claves[codigo][0], claves[codigo][1], claves[codigo][2], valor, fila, claves[codigo][3])
+            for codigo, valor, fila in zip(self._codigos_error, self._valores, self._filas)
+        )
+        self._reiniciar()
+
+    def resumen(self) -> List[Tuple]:
+        """
+        Filas del resumen (CAMPOS_RESUMEN), de la columna/mensaje con más
+        errores a la de menos y, dentro de cada una, del valor más frecuente.
+        """
+        filas = []
+        for codigo in sorted(range(len(self._claves)), key=lambda c: -self._conteos[c]):
+            columna, numero_columna, tipo, error = self._claves[codigo]
+            conteo = self._conteos[codigo]
+            en_detalle = conteo if self.limite is None else min(conteo, self.limite)
+            for valor, veces in self._valores_frecuentes[codigo].most_common(TOP_VALORES):
+                filas.append((columna, numero_columna, tipo, error, conteo, en_detalle, valor, veces))
+        for (catalogo, valor, propuesta), veces in self.propuestas.most_common():
+            filas.append((catalogo, 0, TIPO_PROPUESTA, f"Valor cercano en el catálogo: {propuesta}",
+                          veces, 0, valor, veces))
+        return filas
+
+    def escribir_resumen(self) -> Optional[str]:
+        """Escribe el resumen junto al archivo de errores; retorna su ruta."""
+        if not self._claves and not self.propuestas:
+            return None
+        ruta = ruta_resumen(self.ruta)
+        with abrir(ruta, 'w', encoding=self.encoding, newline='', nivel=self.nivel) as f:
+            escritor = csv.writer(f)
+            escritor.writerow(CAMPOS_RESUMEN)
+            escritor.writerows(self.resumen())
+        return ruta
+
+    def cerrar(self) -> None:
+        """Escribe lo pendiente y el resumen, y cierra el archivo."""
+        try:
+            self.volcar()
+            if self.ruta is not None:
+                self.escribir_resumen()
+        finally:
+            if self._archivo is not None:
+                self._archivo.close()
+                self._archivo = None
@@ -0,0 +1,173 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from comun.formatos_fecha import SIN_FORMATO
+
+Resultado = Tuple[str, bool]
+
+BASE_EXCEL = '1899-12-30'
+MAX_EXCEL = 100000
+
+# (formato, plantilla, año, mes, día): en la plantilla '9' es un dígito ASCII
+# y el resto son literales; año/mes/día son posiciones [inicio, fin).
+# Solo se aceptan los anchos fijos: lo demás (días de un dígito, espacios,
+# dígitos no ASCII, años < 1000...) lo resuelve el validador escalar.
+_PATRONES = (
+    ('datetime', '9999-99-99 99:99:99', (0, 4), (5, 7), (8, 10)),
+    ('date', '9999-99-99', (0, 4), (5, 7), (8, 10)),
+    ('date_YY', '9999/99/99', (0, 4), (5, 7), (8, 10)),
+    ('date_dd_mm_yyyy', '99/99/9999', (6, 10), (3, 5), (0, 2)),
+    ('date_range_iso', '9999-99-99 - 9999-99-99', (0, 4), (5, 7), (8, 10)),
+    ('date_range_dmy', '99/99/9999 - 99/99/9999', (6, 10), (3, 5), (0, 2)),
+)
+_ANCHO = max(len(plantilla) for _, plantilla, _, _, _ in _PATRONES)
+_DIGITOS_EXCEL = len(str(MAX_EXCEL))
+_DIAS_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@dataclass(frozen=True)
+class PoliticaFechas:
+    """
+    Reglas de validar_date/validar_fecha que cambian entre entidades.
+
+    hora_en_fecha dice qué pasa con un 'YYYY-MM-DD HH:MM:SS' con hora distinta
+    de medianoche cuando se pide 'date': 'conservar' lo deja como viene y es
+    válido, 'rechazar' lo deja como viene y es inválido, 'truncar' deja la fecha.
+    """
+    formato_yy: bool = True
+    rangos: bool = True
+    excel: bool = True
+    hora_en_fecha: str = 'conservar'
+
+    def acepta(self, formato: str) -> bool:
+        if formato == 'date_YY':
+            return self.formato_yy
+        if formato.startswith('date_range'):
+            return self.rangos
+        return True
+
+
+def _numpy():
+    """NumPy es opcional: sin él, todas las fechas van al validador escalar."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def normalizar_fechas(valores: Sequence[str], politica: Optional[PoliticaFechas],
+                      respaldo: Callable[[str], Resultado], formato_salida: str = 'date',
+                      mezcla: Optional[Counter] = None) -> Tuple[List[str], List[bool]]:
+    """
+    Versión columnar de validar_date/validar_fecha.
+
+    Los valores distintos con forma YYYY-MM-DD, YYYY/MM/DD, DD/MM/YYYY,
+    YYYY-MM-DD HH:MM:SS, rango de esas fechas o serial de Excel se convierten
+    de una vez a datetime64 y de vuelta a texto ISO; el resto (y todo, si no
+    hay NumPy, no hay política o el formato de salida no es 'date' ni
+    'datetime') se entrega a `respaldo`, el validador escalar. El resultado es
+    el mismo que llamar `respaldo` celda por celda.
+
+    Si se pasa `mezcla`, se suman ahí los formatos resueltos sin `respaldo`,
+    con los mismos nombres que registra el validador escalar.
+    """
+    distintos = list(dict.fromkeys(valores))
+    resultados: Dict[str, Resultado] = {}
+    np = _numpy()
+    if np is not None and politica is not None and formato_salida in ('date', 'datetime'):
+        resultados = _vectorizar(np, distintos, politica, formato_salida,
+                                 mezcla if mezcla is not None else Counter())
+    for valor in distintos:
+        if valor not in resultados:
+            resultados[valor] = respaldo(valor)
+    return [resultados[valor][0] for valor in valores], [bool(resultados[valor][1]) for valor in valores]
+
+
+def _numero(np, cifras, filas, posiciones: Tuple[int, int]):
+    inicio, fin = posiciones
+    numero = np.zeros(len(filas), dtype=np.int64)
+    for posicion in range(inicio, fin):
+        numero = numero * 10 + cifras[filas, posicion]
+    return numero
+
+
+def _a_iso(np, anios, meses, dias) -> List[str]:
+    fechas = ((anios - 1970) * 12 + meses - 1).astype('datetime64[M]').astype('datetime64[D]') + (dias - 1)
+    return np.datetime_as_string(fechas, unit='D').tolist()
+
+
+def _vectorizar(np, distintos: List[str], politica: PoliticaFechas, formato_salida: str,
+                mezcla: Counter) -> Dict[str, Resultado]:
+    candidatos = [valor for valor in distintos if isinstance(valor, str) and 0 < len(valor) <= _ANCHO]
+    if not candidatos:
+        return {}
+    codigos = np.array(candidatos, dtype=f'<U{_ANCHO}').view(np.uint32).reshape(len(candidatos), _ANCHO)
+    longitudes = np.fromiter(map(len, candidatos), dtype=np.int64, count=len(candidatos))
+    es_digito = (codigos >= ord('0')) & (codigos <= ord('9'))
+    cifras = codigos.astype(np.int64) - ord('0')
+    pendientes = np.ones(len(candidatos), dtype=bool)
+    dias_mes = np.array(_DIAS_MES, dtype=np.int64)
+    sufijo = ' 00:00:00' if formato_salida == 'datetime' else ''
+    resultados = {}
+
+    for formato, plantilla, pos_anio, pos_mes, pos_dia in _PATRONES:
+        if not politica.acepta(formato):
+            continue
+        coincide = pendientes & (longitudes == len(plantilla))
+        for posicion, caracter in enumerate(plantilla):
+            coincide &= es_digito[:, posicion] if caracter == '9' else codigos[:, posicion] == ord(caracter)
+        filas = np.flatnonzero(coincide)
+        if not len(filas):
+            continue
+
+        anios = _numero(np, cifras, filas, pos_anio)
+        meses = _numero(np, cifras, filas, pos_mes)
+        dias = _numero(np, cifras, filas, pos_dia)
+        bisiesto = (anios % 4 == 0) & ((anios % 100 != 0) | (anios % 400 == 0))
+        maximo = dias_mes[np.clip(meses, 1, 12) - 1] + ((meses == 2) & bisiesto)
+        # strftime('%Y') no rellena años < 1000: esos van al validador escalar
+        validas = (anios >= 1000) & (meses >= 1) & (meses <= 12) & (dias >= 1) & (dias <= maximo)
+        if formato == 'datetime':
+            horas = _numero(np, cifras, filas, (11, 13))
+            minutos = _numero(np, cifras, filas, (14, 16))
+            segundos = _numero(np, cifras, filas, (17, 19))
+            validas &= (horas <= 23) & (minutos <= 59) & (segundos <= 59)
+            medianoche = ((horas == 0) & (minutos == 0) & (segundos == 0))[validas].tolist()
+        filas = filas[validas]
+        if not len(filas):
+            continue
+        pendientes[filas] = False
+        isos = _a_iso(np, anios[validas], meses[validas], dias[validas])
+        mezcla[formato] += len(filas)
+
+        for i, fila in enumerate(filas.tolist()):
+            valor = candidatos[fila]
+            if formato != 'datetime':
+                resultados[valor] = (isos[i] + sufijo, True)
+            elif formato_salida == 'datetime':
+                resultados[valor] = (valor, True)
+            elif medianoche[i] or politica.hora_en_fecha == 'truncar':
+                resultados[valor] = (isos[i], True)
+            else:
+                resultados[valor] = (valor, politica.hora_en_fecha == 'conservar')
+
+    if politica.excel:
+        # Serial de Excel: solo enteros sin signo; decimales, exponentes, etc. van al escalar
+        ancho = min(_DIGITOS_EXCEL, _ANCHO)
+        fuera = np.arange(ancho)[None, :] >= longitudes[:, None]
+        coincide = pendientes & (longitudes <= ancho) & np.all(es_digito[:, :ancho] | fuera, axis=1)
+        filas = np.flatnonzero(coincide)
+        if len(filas):
+            numeros = np.array([candidatos[fila] for fila in filas.tolist()], dtype=f'<U{ancho}').astype(np.int64)
+            en_rango = numeros <= MAX_EXCEL
+            isos = np.datetime_as_string(np.datetime64(BASE_EXCEL, 'D') + numeros[en_rango],
+                                         unit='D').tolist()
+            mezcla['excel'] += len(isos)
+            mezcla[SIN_FORMATO] += len(filas) - len(isos)
+            isos = iter(isos)
+            for fila, valido in zip(filas.tolist(), en_rango.tolist()):
+                resultados[candidatos[fila]] = (next(isos) + sufijo, True) if valido else ("", False)
+
+    return resultados
@@ -0,0 +1,71 @@
+from collections import Counter
+from typing import Callable, Dict, Tuple
+
+# Formatos de strptime que los validar_date/validar_fecha prueban en orden.
+# Son excluyentes entre sí, así que cambiar el orden no cambia el resultado.
+FORMATOS_FECHA = ('datetime', 'date', 'date_YY', 'date_dd_mm_yyyy')
+# Los rangos van siempre al final: el ISO también acepta una fecha sola
+FORMATOS_RANGO = ('date_range_iso', 'date_range_dmy')
+SIN_FORMATO = 'sin_formato'
+
+
+class FormatoFechaAdaptativo:
+    """
+    Envuelve el validador de fechas de una columna para que pruebe primero el
+    formato que más gana en esa columna.
+
+    El orden se aprende con las primeras `muestra` fechas y se recalcula cada
+    `ventana` fechas con lo visto en esa ventana, para seguir la deriva de
+    los datos (p. ej. un mes exportado con otro formato). Cada formato
+    probado cuesta un fullmatch, así que en columnas homogéneas casi todas
+    las fechas se resuelven al primer intento. El orden se entrega al
+    validador como una tupla ya armada: por fecha no se ordena nada.
+
+    También lleva la mezcla de formatos encontrados: los de FORMATOS_FECHA,
+    los rangos ('date_range_iso', 'date_range_dmy'), 'excel' y SIN_FORMATO.
+    Cuenta los valores que llegan al validador; detrás de una caché, eso son
+    los valores distintos de la columna.
+    """
+
+    def __init__(self, metodo: Callable[..., Tuple[str, bool]], muestra: int = 100, ventana: int = 1000):
+        self.metodo = metodo
+        self.orden = FORMATOS_FECHA + FORMATOS_RANGO
+        self.mezcla = Counter()
+        self._ventana = ventana
+        self._pendientes = muestra
+        self._conteo_ventana = Counter()
+        self._ultimo = None
+
+    def _registrar(self, formato: str) -> None:
+        self._ultimo = formato
+
+    def __call__(self, valor: str) -> Tuple[str, bool]:
+        self._ultimo = None
+        resultado = self.metodo(valor, orden_formatos=self.orden, registro=self._registrar)
+        formato = self._ultimo or SIN_FORMATO
+        self.mezcla[formato] += 1
+        self._conteo_ventana[formato] += 1
+        self._pendientes -= 1
+        if self._pendientes <= 0:
+            self._reordenar()
+        return resultado
+
+    def _reordenar(self) -> None:
+        # Empates: se conserva el orden anterior (sort estable)
+        cantidad = len(FORMATOS_FECHA)
+        orden = sorted(self.orden[:cantidad], key=lambda formato: -self._conteo_ventana[formato])
+        if orden != list(self.orden[:cantidad]):
+            self.orden = tuple(orden) + FORMATOS_RANGO
+        self._conteo_ventana.clear()
+        self._pendientes = self._ventana
+
+
+def reporte_formatos_fecha(mezclas: Dict[str, Counter]) -> str:
+    """Texto con la mezcla de formatos de fecha encontrada en cada columna."""
+    lineas = ["Formatos de fecha por columna:"]
+    for columna, mezcla in mezclas.items():
+        total = sum(mezcla.values())
+        detalle = ", ".join(f"{formato}={cantidad} ({cantidad / total:.1%})"
+                            for formato, cantidad in mezcla.most_common())
+        lineas.append(f"  {columna}: {detalle}")
+    return "\n".join(lineas)
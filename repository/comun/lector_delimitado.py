@@ -0,0 +1,167 @@
+from collections import deque
+from typing import Iterator, List, Optional, Sequence
+
+from comun.compresion import abrir
+
+# Líneas que puede sumar un campo entre comillas antes de dar la comilla por
+# no cerrada; más allá, la línea que la abrió se divide literal
+MAX_LINEAS_REGISTRO = 100
+
+
+def _parsear_registro(texto: str, delimitador: str) -> Optional[List[str]]:
+    """
+    Divide un registro con delimitador de varios caracteres respetando comillas.
+
+    Un campo que empieza con '"' se lee hasta la comilla de cierre ('""' es
+    una comilla literal). Retorna None si una comilla queda abierta al final.
+    """
+    campos = []
+    largo = len(delimitador)
+    i = 0
+    while True:
+        if texto.startswith('"', i):
+            partes = []
+            j = i + 1
+            while True:
+                k = texto.find('"', j)
+                if k == -1:
+                    return None
+                if texto.startswith('""', k):
+                    partes.append(texto[j:k + 1])
+                    j = k + 2
+                    continue
+                partes.append(texto[j:k])
+                j = k + 1
+                break
+            # Lo que sigue a la comilla de cierre hasta el delimitador se conserva
+            fin = texto.find(delimitador, j)
+            if fin == -1:
+                campos.append(''.join(partes) + texto[j:])
+                return campos
+            campos.append(''.join(partes) + texto[j:fin])
+        else:
+            fin = texto.find(delimitador, i)
+            if fin == -1:
+                campos.append(texto[i:])
+                return campos
+            campos.append(texto[i:fin])
+        i = fin + largo
+
+
+class LectorDelimitado:
+    """
+    Lector en streaming para archivos con delimitador de varios caracteres
+    (p. ej. '|@' en las exportaciones de COLJUEGOS).
+
+    El archivo se lee una sola vez en binario y cada línea se decodifica por
+    separado: si no es válida en el primer encoding se usan los siguientes,
+    sin reiniciar la lectura. Cada línea física se recorta con strip(), como
+    hacía el conversor original. Los .gz y .zst se descomprimen al vuelo
+    (ver comun/compresion.py).
+
+    Un campo entre comillas puede seguir en las líneas siguientes hasta
+    `max_lineas` de más. Si la comilla no se cierra en ese tramo (o antes
+    del final del archivo), la línea que la abrió se divide literal, como
+    hacía el conversor original, y las siguientes se leen de nuevo como
+    registros propios; `lineas_sin_cerrar` cuenta esos casos. Lo mismo pasa
+    si el registro unido no tiene el ancho del encabezado (la primera fila)
+    o si una de las líneas que seguirían es por sí sola un registro de ese
+    ancho: una comilla suelta en texto libre no se traga las filas que
+    siguen hasta la próxima línea con comillas.
+    """
+
+    def __init__(self, ruta: str, delimitador: str = '|@',
+                 encodings: Sequence[str] = ('utf-8', 'latin-1'),
+                 max_lineas: int = MAX_LINEAS_REGISTRO):
+        self.ruta = ruta
+        self.delimitador = delimitador
+        self.encodings = encodings
+        self.max_lineas = max_lineas
+        self.lineas_respaldo = 0
+        self.lineas_sin_cerrar = 0
+
+    def _decodificar(self, linea: bytes) -> str:
+        ultimo = len(self.encodings) - 1
+        for indice, encoding in enumerate(self.encodings):
+            try:
+                texto = linea.decode(encoding)
+            except UnicodeDecodeError:
+                if indice == ultimo:
+                    raise
+                continue
+            if indice:
+                self.lineas_respaldo += 1
+            return texto
+
+    def __iter__(self) -> Iterator[List[str]]:
+        with abrir(self.ruta, 'rb') as f:
+            yield from self._registros(self._decodificar(linea).strip() for linea in f)
+
+    def _registros(self, lineas: Iterator[str]) -> Iterator[List[str]]:
+        delimitador = self.delimitador
+        releer = deque()  # Líneas que siguen a una comilla que no se cerró
+        pendientes: List[str] = []  # Líneas del registro con una comilla abierta
+        ancho = None  # Campos del encabezado
+        while True:
+            if releer:
+                linea = releer.popleft()
+            else:
+                linea = next(lineas, None)
+                if linea is None:
+                    if not pendientes:
+                        return
+                    # Comilla sin cerrar al final del archivo
+                    yield self._sin_cerrar(pendientes, releer)
+                    pendientes = []
+                    continue
+
+            if pendientes:
+                if self._es_registro(linea, ancho):
+                    # La línea es un registro completo: la comilla abierta no la alcanza
+                    releer.appendleft(linea)
+                    yield self._sin_cerrar(pendientes, releer)
+                    pendientes = []
+                    continue
+                pendientes.append(linea)
+                # Sin '"' la comilla no se cierra en esta línea: no hace falta volver a parsear
+                if '"' in linea:
+                    campos = _parsear_registro('\n'.join(pendientes), delimitador)
+                    if campos is not None and ancho is not None and len(campos) != ancho:
+                        # La comilla que cierra es de otro campo: no es un solo registro
+                        yield self._sin_cerrar(pendientes, releer)
+                        pendientes = []
+                        continue
+                    if campos is not None:
+                        pendientes = []
+                        yield campos
+                        continue
+                if len(pendientes) > self.max_lineas:
+                    yield self._sin_cerrar(pendientes, releer)
+                    pendientes = []
+                continue
+
+            if '"' not in linea:
+                campos = linea.split(delimitador)
+            else:
+                campos = _parsear_registro(linea, delimitador)
+                if campos is None:
+                    pendientes = [linea]  # Campo entre comillas con salto de línea
+                    continue
+            if ancho is None:
+                ancho = len(campos)
+            yield campos
+
+    def _es_registro(self, linea: str, ancho: Optional[int]) -> bool:
+        """Si la línea, leída sola, es un registro con el ancho del encabezado."""
+        if ancho is None:
+            return False
+        if '"' not in linea:
+            return linea.count(self.delimitador) == ancho - 1
+        campos = _parsear_registro(linea, self.delimitador)
+        return campos is not None and len(campos) == ancho
+
+    def _sin_cerrar(self, pendientes: List[str], releer: deque) -> List[str]:
+        """Divide literal la línea que abrió la comilla y deja las demás para releer."""
+        self.lineas_sin_cerrar += 1
+        releer.extendleft(reversed(pendientes[1:]))
+        return pendientes[0].split(self.delimitador)
@@ -0,0 +1,30 @@
+import mmap
+import os
+from typing import Iterator, Optional
+
+
+def iter_lineas_mmap(ruta: str, encoding: str = 'utf-8', inicio: int = 0,
+                     fin: Optional[int] = None) -> Iterator[str]:
+    """
+    Recorre las líneas de un archivo mapeado en memoria.
+
+    inicio/fin limitan la lectura a un rango de bytes; deben caer en límites
+    de línea (ver comun/particion.py).
+
+    Los bytes los respalda la caché de páginas del sistema operativo: solo se
+    decodifica la línea actual, buscando el siguiente b'\\n' de forma perezosa.
+    Cada tramo se parte con splitlines(), así que el resultado es el mismo que
+    open(ruta, encoding=encoding).read().splitlines().
+    """
+    with open(ruta, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if hasattr(mapa, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapa.madvise(mmap.MADV_SEQUENTIAL)
+            total = len(mapa) if fin is None else min(fin, len(mapa))
+            while inicio < total:
+                corte = mapa.find(b'\n', inicio, total)
+                corte = total if corte == -1 else corte + 1
+                yield from mapa[inicio:corte].decode(encoding).splitlines()
+                inicio = corte
@@ -0,0 +1,36 @@
+import json
+import os
+from typing import Any, Dict
+
+SUFIJO_MANIFIESTO = '.manifest.json'
+
+
+def ruta_manifiesto(ruta: str) -> str:
+    """Ruta del manifiesto que acompaña a un archivo de datos."""
+    return ruta + SUFIJO_MANIFIESTO
+
+
+def firma_archivo(ruta: str) -> Dict[str, int]:
+    """Tamaño y fecha de modificación, para saber si el manifiesto sigue vigente."""
+    estado = os.stat(ruta)
+    return {'tamano': estado.st_size, 'modificado_ns': estado.st_mtime_ns}
+
+
+def leer_manifiesto(ruta: str) -> Dict[str, Any]:
+    """Lee el manifiesto de un archivo; retorna {} si no existe o está dañado."""
+    try:
+        with open(ruta_manifiesto(ruta), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def actualizar_manifiesto(ruta: str, datos: Dict[str, Any]) -> None:
+    """Combina `datos` con el manifiesto existente y lo guarda."""
+    manifiesto = leer_manifiesto(ruta)
+    manifiesto.update(datos)
+    try:
+        with open(ruta_manifiesto(ruta), 'w', encoding='utf-8') as f:
+            json.dump(manifiesto, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"No se pudo guardar el manifiesto de {ruta}: {e}")
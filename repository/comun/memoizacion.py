@@ -0,0 +1,85 @@
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, List, Sequence, Tuple
+
+Resultado = Tuple[str, bool]
+
+
+class MemoriaLRU:
+    """
+    Memoiza un validador `(valor) -> (valor_normalizado, es_valido)` con un
+    tamaño máximo: al superarlo se desaloja el valor usado hace más tiempo.
+
+    Pensado para una columna: fechas, catálogos y NIT repiten unos cientos de
+    valores en millones de filas. Lleva la cuenta de aciertos, fallos (llamadas
+    reales al validador) y desalojos. Las excepciones no se guardan.
+    """
+
+    def __init__(self, funcion: Callable[[str], Resultado], tamano_maximo: int = 4096):
+        self.funcion = funcion
+        self.tamano_maximo = tamano_maximo
+        self._valores = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def _guardar(self, valor: str, resultado: Resultado) -> None:
+        self._valores[valor] = resultado
+        if len(self._valores) > self.tamano_maximo:
+            self._valores.popitem(last=False)
+            self.desalojos += 1
+
+    def __call__(self, valor: str) -> Resultado:
+        try:
+            resultado = self._valores[valor]
+        except KeyError:
+            self.fallos += 1
+            resultado = self.funcion(valor)
+            self._guardar(valor, resultado)
+            return resultado
+        self._valores.move_to_end(valor)
+        self.aciertos += 1
+        return resultado
+
+    def lote(self, funcion_lote: Callable[[List[str]], Tuple[List[str], List[bool]]],
+             valores: Sequence[str]) -> Tuple[List[str], List[bool]]:
+        """
+        Versión por lotes: solo los valores distintos que no están en memoria
+        se entregan a `funcion_lote` (una sola llamada).
+        """
+        encontrados = {}
+        faltantes = []
+        for valor in valores:
+            if valor in encontrados:
+                continue
+            resultado = self._valores.get(valor)
+            if resultado is None:
+                encontrados[valor] = None
+                faltantes.append(valor)
+            else:
+                self._valores.move_to_end(valor)
+                encontrados[valor] = resultado
+
+        if faltantes:
+            normalizados, mascara = funcion_lote(faltantes)
+            for valor, normalizado, es_valido in zip(faltantes, normalizados, mascara):
+                encontrados[valor] = (normalizado, es_valido)
+                self._guardar(valor, encontrados[valor])
+        self.fallos += len(faltantes)
+        self.aciertos += len(valores) - len(faltantes)
+
+        resultados = [encontrados[valor] for valor in valores]
+        return [r[0] for r in resultados], [r[1] for r in resultados]
+
+    def estadisticas(self) -> Counter:
+        return Counter(aciertos=self.aciertos, fallos=self.fallos, desalojos=self.desalojos)
+
+
+def reporte_memoria(estadisticas: Dict[str, Counter]) -> str:
+    """Texto con aciertos, fallos, desalojos y tasa de acierto por columna."""
+    lineas = ["Caché de validación por columna:"]
+    for columna, conteo in estadisticas.items():
+        total = conteo['aciertos'] + conteo['fallos']
+        tasa = conteo['aciertos'] / total if total else 0.0
+        lineas.append(f"  {columna}: aciertos={conteo['aciertos']}, fallos={conteo['fallos']}, "
+                      f"desalojos={conteo['desalojos']}, tasa={tasa:.1%}")
+    return "\n".join(lineas)
@@ -0,0 +1,219 @@
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, FrozenSet, Optional, Sequence, Tuple
+
+from comun.catalogos import IndiceCatalogo
+from comun.fechas_vectorizadas import BASE_EXCEL, MAX_EXCEL, PoliticaFechas
+from comun.texto import quitar_acentos
+from comun.validacion_lotes import ValidacionPorLotes
+
+_RE_NO_NUMERICO = re.compile(r"[^\d.-]")
+_RE_ENTERO = re.compile(r"-?\d+")
+_RE_FLOTANTE = re.compile(r"-?\d+(\.\d+)?")
+
+_RE_NIT_TEXTO = re.compile(r"[a-zA-Z\s]+")
+_RE_NIT_GUIONES = re.compile(r"\d+(?:-\d+)*")
+_RE_NIT_LETRAS = re.compile(r"[a-zA-Z]+")
+
+# Mismas piezas que arma strptime para %Y, %m, %d, %H, %M y %S; un espacio
+# del formato equivale a \s+. fullmatch equivale a su "unconverted data remains".
+_ANIO = r"(\d\d\d\d)"
+_MES = r"(1[0-2]|0[1-9]|[1-9])"
+_DIA = r"(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])"
+_HORA = r"(2[0-3]|[0-1]\d|\d):([0-5]\d|\d):(6[0-1]|[0-5]\d|\d)"
+
+# formato -> (patrón, posiciones de año, mes y día entre los grupos)
+_PATRONES_FECHA = {
+    'datetime': (re.compile(rf"{_ANIO}-{_MES}-{_DIA}\s+{_HORA}", re.IGNORECASE), (0, 1, 2)),
+    'date': (re.compile(rf"{_ANIO}-{_MES}-{_DIA}", re.IGNORECASE), (0, 1, 2)),
+    'date_YY': (re.compile(rf"{_ANIO}/{_MES}/{_DIA}", re.IGNORECASE), (0, 1, 2)),
+    'date_dd_mm_yyyy': (re.compile(rf"{_DIA}/{_MES}/{_ANIO}", re.IGNORECASE), (2, 1, 0)),
+    # Rangos: cuenta la primera fecha
+    'date_range_iso': (re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?: - \d{4}-\d{2}-\d{2})?$"), (0, 1, 2)),
+    'date_range_dmy': (re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})(?: - \d{1,2}/\d{1,2}/\d{4})?$"), (2, 1, 0)),
+}
+_FORMATOS_FECHA = tuple(_PATRONES_FECHA)
+
+# Lo que acepta float(): con esto el serial de Excel se reconoce sin try/except.
+# nan/inf no entran, pero tampoco pasarían el rango 0..MAX_EXCEL.
+_RE_NUMERO = re.compile(r"[+-]?(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)(?:[eE][+-]?\d(?:_?\d)*)?")
+
+DATE_FORMATS = {
+    'date': "%Y-%m-%d",
+    'date_YY': "%Y/%m/%d",
+    'date_dd_mm_yyyy': "%d/%m/%Y",
+    'datetime': "%Y-%m-%d %H:%M:%S"
+}
+# El serial de Excel tiene su propio 'date_YY'
+_FORMATOS_EXCEL = {
+    'date_dd_mm_yyyy': "%d/%m/%Y",
+    'date_YY': "%y-%m-%d",
+    'datetime': "%Y-%m-%d %H:%M:%S",
+}
+_BASE_EXCEL = datetime.strptime(BASE_EXCEL, DATE_FORMATS['date'])
+_DIAS_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+NULOS_NIT = frozenset({'nan', 'null', ''})
+NULOS_NIT_AMPLIADOS = NULOS_NIT | {'sin registro', 'desconocido', 'no aplica', 'ninguna', 'no registra',
+                                   'sin', 'sin id'}
+
+
+@dataclass(frozen=True)
+class PoliticaNit:
+    """
+    Reglas de limpiar_nit que cambian entre entidades: qué textos cuentan
+    como vacío y si un NIT que es solo texto se conserva o se descarta.
+    """
+    nulos: FrozenSet[str] = NULOS_NIT
+    conservar_texto: bool = False
+
+
+def _fecha_valida(anio: int, mes: int, dia: int) -> bool:
+    if anio < 1 or not 1 <= mes <= 12 or dia < 1:
+        return False
+    bisiesto = mes == 2 and anio % 4 == 0 and (anio % 100 != 0 or anio % 400 == 0)
+    return dia <= _DIAS_MES[mes - 1] + bisiesto
+
+
+class NucleoValidacion(ValidacionPorLotes):
+    """
+    Validaciones comunes a todas las clases Validadores*: cadenas, enteros,
+    flotantes, NIT y fechas, con los patrones compilados una sola vez y sin
+    excepciones como control de flujo. Lo que cambia entre entidades va en
+    `politica_fechas` y `politica_nit`; los catálogos siguen en cada clase.
+
+    `propuestas` cuenta (catálogo, valor, propuesta) -> veces de los valores
+    que no están en un catálogo pero tienen uno cercano; el procesador las
+    lee y las pone en cero por archivo (ver comun/procesador_csv.py). Detrás
+    de la caché de validación, las veces son las de los valores distintos.
+    """
+
+    politica_fechas: PoliticaFechas = PoliticaFechas()
+    politica_nit: PoliticaNit = PoliticaNit()
+
+    def __init__(self):
+        self.propuestas: Counter = Counter()
+
+    @staticmethod
+    def _normalize_string(valor: str) -> str:
+        """Normaliza una cadena eliminando acentos y caracteres especiales."""
+        if not valor:
+            return ""
+        return quitar_acentos(valor.strip())
+
+    @staticmethod
+    def _clean_numeric(value: str) -> str:
+        """Limpia valores numéricos eliminando caracteres no deseados."""
+        return _RE_NO_NUMERICO.sub("", str(value))
+
+    def _normalizar_catalogo(self, valor: str) -> str:
+        """Forma normalizada con la que se buscan los valores en los catálogos."""
+        valor_normalizado, _ = self.validar_cadena_caracteres_especiales(valor)
+        return valor_normalizado
+
+    def _resolver_catalogo(self, valor: str, catalogo: IndiceCatalogo) -> Tuple[str, bool]:
+        """
+        Valor canónico (con el reemplazo aplicado; si no aparece, el valor
+        normalizado) y si está en el catálogo. Si no está y el catálogo tiene
+        un valor cercano, la propuesta se cuenta en `propuestas`.
+        """
+        normalizado = self._normalizar_catalogo(valor)
+        resultado = catalogo.resolver(normalizado)
+        if not resultado[1]:
+            propuesta = catalogo.proponer(normalizado)
+            if propuesta is not None:
+                self.propuestas[catalogo.nombre, normalizado, propuesta] += 1
+        return resultado
+
+    def validar_cadena_caracteres_especiales(self, valor: str) -> Tuple[str, bool]:
+        valor_normalizado = self._normalize_string(valor)
+        valor_normalizado = valor_normalizado.replace('.', '').replace(',', '')
+        return valor_normalizado, True
+
+    def validar_entero(self, valor: str) -> Tuple[str, bool]:
+        valor_limpio = self._clean_numeric(valor)
+        return valor_limpio, _RE_ENTERO.fullmatch(valor_limpio) is not None
+
+    def validar_flotante(self, valor: str) -> Tuple[str, bool]:
+        valor_limpio = self._clean_numeric(valor)
+        return valor_limpio, _RE_FLOTANTE.fullmatch(valor_limpio) is not None
+
+    def limpiar_nit(self, valor: str) -> Tuple[str, bool]:
+        if not valor:
+            return "", False
+        politica = self.politica_nit
+        valor_limpio = str(valor).strip()
+        if valor_limpio.lower() in politica.nulos:
+            return "", False
+        if _RE_NIT_TEXTO.fullmatch(valor_limpio):
+            return (valor_limpio, True) if politica.conservar_texto else ("", False)
+        valor_limpio = valor_limpio.replace(".000000", "")
+        if _RE_NIT_GUIONES.fullmatch(valor_limpio):
+            valor_limpio = valor_limpio.split("-", 1)[0]
+        if _RE_NIT_LETRAS.fullmatch(valor_limpio):
+            return (valor_limpio if politica.conservar_texto else ""), False
+        return valor_limpio, True
+
+    def validar_date(self, valor: str, formato_salida: str = 'date',
+                     orden_formatos: Optional[Sequence[str]] = None,
+                     registro: Optional[Callable[[str], None]] = None) -> Tuple[str, bool]:
+        """
+        Valida y normaliza una fecha en los formatos que admite la entidad
+        (datetime, date, date_YY, date_dd_mm_yyyy, rangos y serial de Excel)
+        y la convierte al formato de salida ('date', 'datetime',
+        'date_dd_mm_yyyy' o 'date_YY').
+
+        `orden_formatos` es la tupla de todos los formatos en el orden en que
+        se prueban (son excluyentes, no cambia el resultado; los rangos al
+        final) y `registro` recibe el formato que coincidió (ver
+        comun/formatos_fecha.py).
+        """
+        if valor is None:
+            return "", False
+        valor = str(valor).strip()
+        if not valor:
+            return "", False
+        politica = self.politica_fechas
+
+        for formato in orden_formatos or _FORMATOS_FECHA:
+            if not politica.acepta(formato):
+                continue
+            patron, (i_anio, i_mes, i_dia) = _PATRONES_FECHA[formato]
+            coincidencia = patron.fullmatch(valor)
+            if coincidencia is None:
+                continue
+            partes = coincidencia.groups()
+            anio, mes, dia = int(partes[i_anio]), int(partes[i_mes]), int(partes[i_dia])
+            if not _fecha_valida(anio, mes, dia):
+                continue
+            if formato == 'datetime':
+                hora, minuto, segundo = int(partes[3]), int(partes[4]), int(partes[5])
+                if segundo > 59:
+                    continue
+                dt = datetime(anio, mes, dia, hora, minuto, segundo)
+            else:
+                dt = datetime(anio, mes, dia)
+            if registro is not None:
+                registro(formato)
+            return self._formatear_fecha(dt, valor, formato, formato_salida)
+
+        if politica.excel and _RE_NUMERO.fullmatch(valor):
+            excel_num = float(valor)
+            if 0 <= excel_num <= MAX_EXCEL:
+                if registro is not None:
+                    registro('excel')
+                fecha = _BASE_EXCEL + timedelta(days=excel_num)
+                return fecha.strftime(_FORMATOS_EXCEL.get(formato_salida, DATE_FORMATS['date'])), True
+        return "", False
+
+    def _formatear_fecha(self, dt: datetime, valor: str, formato: str, formato_salida: str) -> Tuple[str, bool]:
+        politica = self.politica_fechas
+        if (formato == 'datetime' and formato_salida in ('date', 'date_dd_mm_yyyy')
+                and politica.hora_en_fecha != 'truncar' and dt.time() != datetime.min.time()):
+            # Tiene hora: se deja como viene
+            return valor, politica.hora_en_fecha == 'conservar'
+        if formato_salida not in DATE_FORMATS or (formato_salida == 'date_YY' and not politica.formato_yy):
+            formato_salida = 'date'
+        return dt.strftime(DATE_FORMATS[formato_salida]), True
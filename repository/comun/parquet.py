@@ -0,0 +1,175 @@
+import os
+from typing import Iterable, List, Optional, Sequence
+
+# Filas por grupo de filas (row group): cada grupo se escribe apenas se
+# completa, así la memoria no depende del tamaño del archivo
+FILAS_POR_GRUPO = 100_000
+COMPRESION = 'zstd'
+EXTENSIONES_PARQUET = ('.parquet', '.pq')
+# Columna int que recibió un entero que no cabe en int64: enteros como texto
+TIPO_ENTERO_TEXTO = 'int_texto'
+
+# Lo que dejan los validadores en columnas int y float (validar_entero /
+# validar_flotante); int64 admite hasta 18 dígitos sin desbordarse
+_RE_ENTERO = r'^-?\d{1,18}$'
+_RE_ENTERO_LARGO = r'^-?\d{19,}$'
+_RE_ENTERO_TEXTO = r'^-?\d+$'
+_RE_FLOTANTE = r'^-?\d+(\.\d+)?$'
+_FORMATO_FECHA = '%Y-%m-%d'
+_FORMATO_FECHA_HORA = '%Y-%m-%d %H:%M:%S'
+
+
+def _pyarrow():
+    """pyarrow es opcional: solo se necesita para escribir Parquet."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("La salida Parquet necesita pyarrow (pip install pyarrow)") from e
+    return pa, pc, pq
+
+
+def es_parquet(ruta: str) -> bool:
+    return ruta.lower().endswith(EXTENSIONES_PARQUET)
+
+
+def tipo_arrow(pa, tipo: str):
+    """Tipo de Arrow para un tipo de type_mapping; lo que no se reconoce queda como texto."""
+    if tipo == 'int':
+        return pa.int64()
+    if tipo == 'float':
+        return pa.float64()
+    if tipo == 'date':
+        return pa.date32()
+    if tipo == 'datetime':
+        return pa.timestamp('s')
+    if tipo.startswith('choice_'):
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+def _columna(pa, pc, valores: Sequence[Optional[str]], tipo: str):
+    """
+    Convierte una columna de texto ya validada a su tipo. Las celdas vacías
+    y las que no pasaron la validación (su valor original queda en el
+    archivo de errores) quedan nulas; las de texto se guardan tal cual.
+    """
+    texto = pa.array(valores, pa.string())
+    nulo = pa.scalar(None, pa.string())
+    if tipo == TIPO_ENTERO_TEXTO:
+        return pc.if_else(pc.match_substring_regex(texto, _RE_ENTERO_TEXTO), texto, nulo)
+    destino = tipo_arrow(pa, tipo)
+    if destino == pa.string():
+        return texto
+    if tipo in ('int', 'float'):
+        validos = pc.match_substring_regex(texto, _RE_ENTERO if tipo == 'int' else _RE_FLOTANTE)
+        return pc.if_else(validos, texto, nulo).cast(destino)
+    if tipo in ('date', 'datetime'):
+        dias = pc.strptime(pc.utf8_slice_codeunits(texto, 0, 10), format=_FORMATO_FECHA,
+                           unit='s', error_is_null=True)
+        if tipo == 'date':
+            return dias.cast(destino)
+        completas = pc.strptime(texto, format=_FORMATO_FECHA_HORA, unit='s', error_is_null=True)
+        return pc.coalesce(completas, dias)
+    return pc.if_else(pc.equal(texto, ''), nulo, texto).dictionary_encode()
+
+
+class EscritorParquet:
+    """
+    Escribe filas de texto a un Parquet con tipos: fechas como date32,
+    enteros como int64, flotantes como float64 y columnas choice_*
+    codificadas como diccionario (ver tipo_arrow). Las filas se acumulan
+    hasta completar un grupo de `filas_por_grupo`, que se convierte por
+    columnas y se escribe de una vez.
+
+    Un entero de más de 18 dígitos no cabe en int64: su columna pasa a
+    texto (solo los enteros válidos, el resto nulo) en todo el archivo. Los
+    grupos ya escritos se reescriben uno a uno con esa columna convertida y
+    su nombre queda en `enteros_como_texto`.
+
+    Sin `tipos`, todas las columnas son texto.
+    """
+
+    def __init__(self, ruta: str, columnas: Sequence[str], tipos: Optional[Sequence[str]] = None,
+                 filas_por_grupo: int = FILAS_POR_GRUPO, compresion: str = COMPRESION):
+        pa, pc, pq = _pyarrow()
+        self._pa, self._pc, self._pq = pa, pc, pq
+        self.ruta = ruta
+        self.compresion = compresion
+        self.tipos = list(tipos) if tipos else ['str'] * len(columnas)
+        self.filas_por_grupo = filas_por_grupo
+        self.total = 0
+        self.enteros_como_texto: List[str] = []
+        self._esquema = pa.schema([pa.field(nombre, tipo_arrow(pa, tipo))
+                                   for nombre, tipo in zip(columnas, self.tipos)])
+        self._escritor = pq.ParquetWriter(ruta, self._esquema, compression=compresion)
+        self._filas: List[Sequence[Optional[str]]] = []
+
+    def __enter__(self) -> 'EscritorParquet':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def agregar(self, fila: Sequence[Optional[str]]) -> None:
+        self._filas.append(fila)
+        if len(self._filas) >= self.filas_por_grupo:
+            self.volcar()
+
+    def escribir(self, filas: Iterable[Sequence[Optional[str]]]) -> None:
+        for fila in filas:
+            self.agregar(fila)
+
+    def volcar(self) -> None:
+        """Escribe las filas pendientes como un grupo de filas."""
+        if not self._filas:
+            return
+        pa, pc = self._pa, self._pc
+        columnas = list(zip(*self._filas))
+        largos = [indice for indice, tipo in enumerate(self.tipos)
+                  if tipo == 'int' and pc.any(pc.match_substring_regex(
+                      pa.array(columnas[indice], pa.string()), _RE_ENTERO_LARGO)).as_py()]
+        if largos:
+            self._enteros_a_texto(largos)
+        tabla = pa.Table.from_arrays([_columna(pa, pc, valores, tipo)
+                                      for valores, tipo in zip(columnas, self.tipos)],
+                                     schema=self._esquema)
+        self._escritor.write_table(tabla, row_group_size=len(self._filas))
+        self.total += len(self._filas)
+        self._filas = []
+
+    def _enteros_a_texto(self, indices: List[int]) -> None:
+        """Pasa columnas int a TIPO_ENTERO_TEXTO y reescribe con ellas lo ya escrito."""
+        pa, pq = self._pa, self._pq
+        for indice in indices:
+            self.tipos[indice] = TIPO_ENTERO_TEXTO
+            self.enteros_como_texto.append(self._esquema.names[indice])
+        esquema = pa.schema([pa.field(nombre, tipo_arrow(pa, tipo))
+                             for nombre, tipo in zip(self._esquema.names, self.tipos)])
+        self._escritor.close()
+        anterior = self.ruta + '.int64'
+        os.replace(self.ruta, anterior)
+        try:
+            self._escritor = pq.ParquetWriter(self.ruta, esquema, compression=self.compresion)
+            self._esquema = esquema
+            with open(anterior, 'rb') as f:
+                archivo = pq.ParquetFile(f)
+                for grupo in range(archivo.num_row_groups):
+                    self._escritor.write_table(archivo.read_row_group(grupo).cast(esquema))
+        finally:
+            os.remove(anterior)
+
+    def cerrar(self) -> None:
+        try:
+            self.volcar()
+        finally:
+            self._escritor.close()
+
+
+def escribir_parquet(ruta: str, columnas: Sequence[str], filas: Iterable[Sequence[Optional[str]]],
+                     tipos: Optional[Sequence[str]] = None, filas_por_grupo: int = FILAS_POR_GRUPO) -> int:
+    """Escribe `filas` con EscritorParquet; retorna cuántas filas escribió."""
+    with EscritorParquet(ruta, columnas, tipos, filas_por_grupo) as escritor:
+        escritor.escribir(filas)
+    return escritor.total
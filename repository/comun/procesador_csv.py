@@ -0,0 +1,807 @@
+import csv
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from comun.cardinalidad import MapaDistintos, columnas_baja_cardinalidad
+from comun.compresion import abrir, es_comprimido
+from comun.deteccion_encoding import encoding_de_archivo
+from comun.ensamblador import ensamblar_registros
+from comun.errores import AlmacenErrores
+from comun.formatos_fecha import FormatoFechaAdaptativo
+from comun.lectura import iter_lineas_mmap
+from comun.memoizacion import MemoriaLRU
+from comun.parquet import EscritorParquet, es_parquet
+from comun.particion import rangos_de_registros
+from comun.proyeccion import proyector
+from comun.reportes import estadisticas_vacias, informe_procesamiento, sumar_estadisticas
+from comun.reparacion import reparar_filas
+from comun.salida_particionada import COLUMNA_PARTICION, EscritorParticionado
+from comun.texto import normalizar_nombre_columna
+from comun.tokenizador import iter_filas
+
+NULL_VALUES = {"$null$", "nan", "NULL", "N.A", "null", "N.A."}
+DELIMITER = '|'
+ENCODING = 'utf-8'
+
+# Tamaño aproximado de cada rango de bytes en el procesamiento paralelo
+CHUNK_BYTES = 32 * 1024 * 1024
+# Filas por lote en la validación por columnas
+BATCH_ROWS = 5000
+# Valores distintos que se recuerdan por columna validada (0 desactiva la caché)
+CACHE_SIZE = 4096
+# Tope sugerido de filas de detalle por columna y mensaje en el archivo de
+# errores, para pasarlo como error_limit (por omisión se guardan todas)
+ERROR_LIMIT = 10_000
+# Tipos de type_mapping cuyos valores son fechas
+DATE_TYPES = ("date", "datetime")
+
+# Mensajes de los tipos comunes a todos los proyectos
+BASE_ERROR_MESSAGES = {
+    'invalid_integer': "No es un entero válido",
+    'invalid_float': "No es un flotante válido",
+    'invalid_date': "No es una fecha válida",
+    'invalid_datetime': "No es una fecha y hora válida",
+    'invalid_nit': "No es un NIT válido",
+    'invalid_columns': "Número de columnas no coincide con el encabezado",
+}
+
+
+@dataclass
+class ErrorInfo:
+    __slots__ = ('columna', 'numero_columna', 'tipo', 'valor', 'fila', 'error')
+
+    columna: str
+    numero_columna: int
+    tipo: str
+    valor: str
+    fila: int
+    error: str
+
+
+class ProcesadorCSV:
+    """
+    Procesador de los transformar_columnas_*.py de cada proyecto: lectura,
+    reparación y ensamblado de registros, validación por lotes con caché,
+    procesamiento paralelo, salida CSV/Parquet/particionada y errores.
+
+    Cada proyecto define una subclase CSVProcessor que solo aporta sus datos:
+    REFERENCE_HEADERS, REPLACEMENT_MAP, VALIDATION_METHODS (tipo de
+    type_mapping -> (método del validador, clave del mensaje)) y
+    ERROR_MESSAGES con los mensajes propios, que se suman a los comunes.
+    NORMALIZE_SLASH indica si '/' pasa a '_' en los nombres de columna y
+    QUOTING cómo se entrecomilla la salida CSV.
+    """
+
+    REFERENCE_HEADERS: List[str] = []
+    REPLACEMENT_MAP: Dict[str, str] = {}
+    VALIDATION_METHODS: Dict[str, Tuple[str, str]] = {}
+    ERROR_MESSAGES: Dict[str, str] = {}
+    NORMALIZE_SLASH = True
+    QUOTING = csv.QUOTE_MINIMAL
+
+    def __init__(self, validator=None):
+        self.validator = validator
+        self.repair_counts = Counter()
+        self.cache_size = CACHE_SIZE
+        self.compression_level: Optional[int] = None
+        self.verbose = False
+        self.validation_caches: Dict[str, MemoriaLRU] = {}
+        self.date_formats: Dict[str, FormatoFechaAdaptativo] = {}
+        self.distinct_maps: Dict[str, MapaDistintos] = {}
+        # Estadísticas por columna que envían los procesos del pool
+        self.column_totals: Dict[str, dict] = estadisticas_vacias()
+        self.proposal_totals: Counter = Counter()
+        self.error_messages = {**BASE_ERROR_MESSAGES, **self.ERROR_MESSAGES}
+
+    def normalize_column_name(self, column_name: str) -> str:
+        """Normaliza nombres de columnas reemplazando espacios y caracteres especiales."""
+        return normalizar_nombre_columna(column_name, barra=self.NORMALIZE_SLASH)
+
+    def organize_headers(self, actual_headers: List[str]) -> List[str]:
+        """Organiza headers segue REFERENCE_HEADERS y aplica reemplazos."""
+        normalized = [self.normalize_column_name(h) for h in actual_headers]
+
+        # Aplicar reemplazos
+        for i, header in enumerate(normalized):
+            normalized[i] = self.REPLACEMENT_MAP.get(header, header)
+
+        # Eliminar duplicados manteniendo orden
+        seen = set()
+        unique_headers = []
+        for h in normalized:
+            if h not in seen:
+                seen.add(h)
+                unique_headers.append(h)
+
+        # Ordenar según REFERENCE_HEADERS
+        ref_headers_normalized = [self.normalize_column_name(h) for h in self.REFERENCE_HEADERS]
+        ordered = []
+        remaining = []
+        
+        for ref_h in ref_headers_normalized:
+            if ref_h in unique_headers:
+                ordered.append(ref_h)
+        remaining = [h for h in unique_headers if h not in ordered]
+        return ordered + remaining
+
+    def clean_value(self, value: str) -> str:
+        """Limpia valores nulos y espacios."""
+        if value is None:
+            return ""
+        value = str(value).strip()
+        return "" if value.upper() in NULL_VALUES else value
+
+    def _iter_lines(self, input_file: str, use_mmap: bool = False, encoding: str = ENCODING) -> Iterator[str]:
+        """
+        Entrega las líneas una a una sin cargar el archivo completo. Los .gz y
+        .zst se descomprimen al vuelo y no se mapean en memoria.
+        """
+        if use_mmap and not es_comprimido(input_file):
+            yield from iter_lineas_mmap(input_file, encoding)
+            return
+        with abrir(input_file, 'r', encoding=encoding) as f:
+            for physical_line in f:
+                # splitlines() por línea física equivale a f.read().splitlines()
+                yield from physical_line.splitlines()
+
+    def iter_csv(self, input_file: str, use_mmap: bool = False,
+                 encoding: Optional[str] = None) -> Tuple[List[str], Iterator[List[str]]]:
+        """
+        Lee CSV en modo streaming: devuelve el encabezado y un iterador de filas.
+
+        Los registros partidos por saltos de línea (entre comillas o no) se
+        ensamblan y las filas mal divididas se reparan al vuelo usando el
+        ancho del encabezado (ver _iter_records).
+        """
+        encoding = encoding or encoding_de_archivo(input_file)
+        reader = iter_filas(self._iter_lines(input_file, use_mmap, encoding), DELIMITER)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"El archivo {input_file} está vacío")
+        return header, self._iter_records(reader, len(header), self.repair_counts)
+
+    def _iter_records(self, rows: Iterable[List[str]], width: int, counts: Counter) -> Iterator[List[str]]:
+        """Repara filas mal divididas y une las partidas por saltos de línea."""
+        return ensamblar_registros(reparar_filas(rows, width, DELIMITER, counts), width)
+
+    def read_csv(self, input_file: str, use_mmap: bool = False,
+                 encoding: Optional[str] = None) -> Tuple[List[str], List[List[str]]]:
+        """
+        Lee CSV con manejo de comas y saltos internos.
+
+        Las líneas se leen una a una (ver iter_csv) y solo se acumulan las
+        filas ya ensambladas. Con use_mmap=True el archivo se mapea en memoria.
+        Si no se indica encoding, se detecta con una muestra del archivo.
+        """
+        header, rows = self.iter_csv(input_file, use_mmap, encoding)
+        return header, list(rows)
+
+    def process_csv(self, input_file: str, output_file: str, error_file: str = None, 
+                   type_mapping: Dict[str, List[int]] = None, streaming: bool = False,
+                   use_mmap: bool = False, workers: int = 1, encoding: Optional[str] = None,
+                   cache_size: int = CACHE_SIZE, error_limit: Optional[int] = None,
+                   partitioned: bool = False, compression_level: Optional[int] = None,
+                   verbose: bool = False) -> None:
+        """
+        Procesa CSV completo con:
+        - Normalización de headers
+        - Validación de datos
+        - Manejo de errores
+
+        Con streaming=True cada fila se lee, valida, reorganiza y escribe sin
+        acumular el archivo en memoria; la salida es idéntica al modo por lotes.
+        Con use_mmap=True la entrada se lee mapeada en memoria (ver read_csv).
+        Con workers > 1 el archivo se divide en rangos de registros que se
+        validan en un pool de procesos; filas y números de fila conservan el
+        orden original.
+        El encoding de entrada se detecta una sola vez con una muestra del
+        archivo, salvo que se indique explícitamente; no se escribe nada junto
+        a la entrada (ver encoding_de_archivo).
+        Cada columna validada recuerda hasta cache_size valores (LRU). Las
+        columnas de fecha aprenden su formato más frecuente. Las columnas de
+        baja cardinalidad se validan una vez por valor distinto.
+        El archivo de errores guarda todas las filas con error; con
+        error_limit (p. ej. ERROR_LIMIT) guarda hasta esa cantidad por columna
+        y mensaje. El total y los valores más frecuentes quedan en el resumen
+        que se escribe a su lado (ver comun/errores.py), junto con los valores
+        cercanos que propusieron los catálogos del validador (ver
+        NucleoValidacion._resolver_catalogo).
+        Si output_file termina en .parquet la salida es un Parquet con los
+        tipos de type_mapping (ver comun/parquet.py).
+        Con partitioned=True las filas se reparten por MES_REPORTE en
+        <carpeta de output_file>/anio=YYYY/mes=MM/<nombre de output_file> y
+        solo se reescriben las particiones de los meses del archivo, cada una
+        completa con las filas de ese mes en el archivo (se avisa si queda con
+        menos filas que antes; ver comun/salida_particionada.py).
+        Las rutas .gz y .zst (entrada, salida y errores) se leen y escriben
+        comprimidas en streaming, con compression_level o el nivel por defecto
+        de cada formato (ver comun/compresion.py). Una entrada comprimida no
+        admite acceso directo por bytes: se lee sin mmap y con un solo proceso.
+        Con verbose=True, al final se imprime un informe: filas reparadas,
+        caché y mezcla de formatos de fecha por columna, columnas validadas
+        por valores distintos, errores recortados y filas por partición (ver
+        comun/reportes.py).
+        """
+        try:
+            self.repair_counts = Counter()
+            self.verbose = verbose
+            self.cache_size = cache_size
+            self.compression_level = compression_level
+            self.validation_caches = {}
+            self.date_formats = {}
+            self.distinct_maps = {}
+            self.column_totals = estadisticas_vacias()
+            self.proposal_totals = Counter()
+            self.validator.propuestas.clear()
+            encoding = encoding or encoding_de_archivo(input_file)
+            if workers > 1 and not es_comprimido(input_file):
+                header, _ = self.iter_csv(input_file, use_mmap=True, encoding=encoding)
+                normalized_header = self.organize_headers(header)
+                processed = self._iter_parallel_rows(input_file, header, normalized_header,
+                                                     type_mapping, workers, encoding)
+            else:
+                if streaming:
+                    header, rows = self.iter_csv(input_file, use_mmap, encoding)
+                else:
+                    header, rows = self.read_csv(input_file, use_mmap, encoding)
+                normalized_header = self.organize_headers(header)
+                processed = self._iter_processed_rows(rows, header, normalized_header, type_mapping)
+            output_types = self._output_types(header, normalized_header, type_mapping)
+
+            if streaming:
+                with AlmacenErrores(error_file, ENCODING, limite=error_limit, nivel=compression_level) as errors:
+                    self._stream_output(output_file, errors, normalized_header, processed, output_types,
+                                        partitioned)
+                    errors.agregar_propuestas(self._catalog_proposals())
+                self._report(errors)
+                return
+
+            # Los errores no se acumulan como objetos: se guardan compactos y se
+            # escriben al archivo de errores por tandas (ver comun/errores.py)
+            processed_rows = []
+            with AlmacenErrores(error_file, ENCODING, limite=error_limit, nivel=compression_level) as errors:
+                for final_row, row_errors in processed:
+                    errors.extend(row_errors)
+                    if final_row is not None:
+                        processed_rows.append(final_row)
+                errors.agregar_propuestas(self._catalog_proposals())
+
+            self._save_output(output_file, normalized_header, processed_rows, output_types, partitioned)
+            self._report(errors)
+            
+        except Exception as e:
+            raise Exception(f"Error procesando archivo: {str(e)}")
+
+    def _iter_processed_rows(self, rows: Iterable[List[str]], header: List[str],
+                             normalized_header: List[str],
+                             type_mapping: Dict[str, List[int]] = None
+                             ) -> Iterator[Tuple[Optional[List[str]], List[ErrorInfo]]]:
+        """
+        Valida y reorganiza cada fila; entrega (fila_final, errores_de_la_fila).
+
+        Las filas se toman en lotes de BATCH_ROWS y cada columna del lote se
+        valida de una vez (ver _compile_batch_validator). Si un lote falla, se
+        repite fila por fila para reportar el error igual que antes.
+        """
+        validate_row = self._compile_row_validator(header, type_mapping)
+        validate_batch = self._compile_batch_validator(header, type_mapping)
+        reorganize = self._column_projection(header, normalized_header)
+        rows = iter(rows)
+        row_num = 0
+        while True:
+            batch = list(islice(rows, BATCH_ROWS))
+            if not batch:
+                return
+
+            well_formed = [(row_num + i, row) for i, row in enumerate(batch, start=1)
+                           if len(row) == len(header)]
+            try:
+                results = iter(validate_batch([row for _, row in well_formed],
+                                              [num for num, _ in well_formed]))
+            except Exception:
+                results = None
+
+            for row in batch:
+                row_num += 1
+                errors = []
+                try:
+                    if len(row) != len(header):
+                        raise ValueError(f"Columnas esperadas: {len(header)}, obtenidas: {len(row)}")
+
+                    if results is not None:
+                        processed_row, row_errors = next(results)
+                        errors.extend(row_errors)
+                    else:
+                        processed_row = validate_row(row, row_num, errors)
+
+                    # Reorganizar según headers normalizados
+                    final_row = reorganize(processed_row)
+
+                except Exception as e:
+                    errors.append(ErrorInfo(
+                        columna="", numero_columna=0, tipo="processing",
+                        valor=str(row), fila=row_num, error=str(e)
+                    ))
+                    final_row = None
+
+                yield final_row, errors
+
+    def _process_chunk(self, input_file: str, start: int, end: int, header: List[str],
+                       normalized_header: List[str], type_mapping: Dict[str, List[int]] = None,
+                       encoding: str = ENCODING
+                       ) -> Tuple[List[Tuple[Optional[List[str]], List[ErrorInfo]]], Counter,
+                                  Dict[str, Dict[str, Counter]], List[List[str]], bool, List[List[str]]]:
+        """
+        Procesa un rango de bytes del archivo (se ejecuta en un proceso del pool).
+        Retorna los resultados del rango, el conteo de filas reparadas, las
+        estadísticas (caché y formatos de fecha por columna, propuestas de
+        catálogo) y las filas de los bordes que no se validan aquí (ver
+        _iter_parallel_rows):
+
+        - leading: las filas del inicio, hasta la primera con el ancho del
+          encabezado, que pueden continuar un registro del rango anterior;
+          closed es False si el rango no tiene ninguna fila así.
+        - trailing: el registro que quedó incompleto al final del rango.
+        """
+        self.validation_caches = {}
+        self.date_formats = {}
+        self.distinct_maps = {}
+        self.validator.propuestas.clear()
+        width = len(header)
+        rows = iter_filas(iter_lineas_mmap(input_file, encoding, start, end), DELIMITER)
+        if start == 0:
+            next(rows, None)  # Encabezado
+        counts = Counter()
+        rows = reparar_filas(rows, width, DELIMITER, counts)
+        leading = []
+        closed = start == 0
+        if not closed:
+            # Tras una fila del ancho completo no queda ningún registro a medio
+            # unir, así que desde ahí el rango se procesa igual que en serie
+            for row in rows:
+                leading.append(row)
+                if len(row) >= width:
+                    closed = True
+                    break
+        trailing = []
+        results = list(self._iter_processed_rows(ensamblar_registros(rows, width, trailing), header,
+                                                 normalized_header, type_mapping))
+        column_stats = self._column_stats()
+        column_stats["proposals"] = self.validator.propuestas
+        return results, counts, column_stats, leading, closed, trailing
+
+    def _iter_parallel_rows(self, input_file: str, header: List[str], normalized_header: List[str],
+                            type_mapping: Dict[str, List[int]], workers: int, encoding: str = ENCODING
+                            ) -> Iterator[Tuple[Optional[List[str]], List[ErrorInfo]]]:
+        """
+        Valida rangos del archivo en paralelo y entrega los resultados en orden.
+
+        Los rangos se cortan en límites de línea fuera de comillas, pero un
+        registro partido por un salto sin comillas (ver ensamblar_registros)
+        puede quedar repartido entre dos rangos. Por eso cada rango devuelve
+        sin validar el registro incompleto de su final y las filas de su
+        inicio que pueden continuarlo; aquí se unen y se validan en orden,
+        así que filas, errores y números de fila son los mismos que en serie.
+        """
+        parts = max(workers * 4, os.path.getsize(input_file) // CHUNK_BYTES)
+        ranges = iter(rangos_de_registros(input_file, parts, DELIMITER))
+        width = len(header)
+
+        def stitched(rows: List[List[str]]) -> List[Tuple[Optional[List[str]], List[ErrorInfo]]]:
+            return list(self._iter_processed_rows(ensamblar_registros(rows, width), header,
+                                                  normalized_header, type_mapping))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            def submit(byte_range):
+                return executor.submit(self._process_chunk, input_file, *byte_range,
+                                       header, normalized_header, type_mapping, encoding)
+
+            # Ventana acotada de rangos en vuelo para no acumular resultados
+            pending = deque(submit(r) for _, r in zip(range(workers * 2), ranges))
+            offset = 0
+            # Filas sin validar de un registro que puede seguir en el rango siguiente
+            carry: List[List[str]] = []
+            while pending:
+                results, counts, column_stats, leading, closed, trailing = pending.popleft().result()
+                self.repair_counts.update(counts)
+                sumar_estadisticas(self.column_totals, column_stats)
+                self.proposal_totals.update(column_stats["proposals"])
+                next_range = next(ranges, None)
+                if next_range is not None:
+                    pending.append(submit(next_range))
+
+                carry.extend(leading)
+                if not closed:
+                    continue
+                for part in (stitched(carry) if carry else [], results):
+                    for final_row, row_errors in part:
+                        for error in row_errors:
+                            error.fila += offset
+                        yield final_row, row_errors
+                    offset += len(part)
+                carry = trailing
+
+            for final_row, row_errors in stitched(carry) if carry else []:
+                for error in row_errors:
+                    error.fila += offset
+                yield final_row, row_errors
+
+    def _column_stats(self) -> Dict[str, dict]:
+        """Estadísticas por columna de este proceso (ver comun/reportes.py)."""
+        return {
+            "cache": {key: cache.estadisticas() for key, cache in self.validation_caches.items()},
+            "date_formats": {key: adaptive.mezcla for key, adaptive in self.date_formats.items()},
+            "distinct": {key: len(mapping) for key, mapping in self.distinct_maps.items()},
+        }
+
+    def _catalog_proposals(self) -> Counter:
+        """Propuestas de catálogo del archivo, de este proceso y del pool."""
+        proposals = Counter(self.proposal_totals)
+        proposals.update(self.validator.propuestas)
+        return proposals
+
+    def _report(self, errors: AlmacenErrores) -> None:
+        """Con verbose, imprime el informe del archivo: lo del pool más lo de este proceso."""
+        if not self.verbose:
+            return
+        totals = estadisticas_vacias()
+        sumar_estadisticas(totals, self.column_totals)
+        sumar_estadisticas(totals, self._column_stats())
+        report = informe_procesamiento(self.repair_counts, totals, errors)
+        if report:
+            print(report)
+
+    def _column_method(self, col_num: int, col_name: str, expected_type: str,
+                       method: Callable[..., Tuple[str, bool]]) -> Callable[[str], Tuple[str, bool]]:
+        """
+        Método del validador para una columna, compartido por la ruta por fila
+        y por lotes: las fechas prueban primero el formato aprendido y el
+        resultado pasa por la caché LRU de la columna.
+        """
+        key = f"{col_name} [{col_num}]"
+        if expected_type in DATE_TYPES:
+            if key not in self.date_formats:
+                self.date_formats[key] = FormatoFechaAdaptativo(method)
+            method = self.date_formats[key]
+        return self._column_cache(key, method) or method
+
+    def _column_cache(self, key: str, method: Callable[[str], Tuple[str, bool]]) -> Optional[MemoriaLRU]:
+        """Caché LRU de una columna."""
+        if not self.cache_size:
+            return None
+        cache = self.validation_caches.get(key)
+        if cache is None:
+            cache = self.validation_caches[key] = MemoriaLRU(method, self.cache_size)
+        return cache
+
+    def _column_types(self, type_mapping: Dict[str, List[int]]) -> Dict[int, str]:
+        """Número de columna -> tipo; si una columna está en varias listas gana la primera."""
+        column_types = {}
+        for type_name, columns in type_mapping.items():
+            for col_num in columns:
+                column_types.setdefault(col_num, type_name)
+        return column_types
+
+    def _compile_row_validator(self, header: List[str], type_mapping: Dict[str, List[int]] = None
+                               ) -> Callable[[List[str], int, List[ErrorInfo]], List[str]]:
+        """
+        Compila type_mapping una sola vez por archivo en una función por fila.
+
+        Cada columna validada queda con su método y su mensaje de error ya
+        resueltos, así que por celda solo hay una llamada directa; las demás
+        columnas solo se limpian.
+        """
+        clean_value = self.clean_value
+        checks = []
+        if type_mapping and self.validator:
+            column_types = self._column_types(type_mapping)
+            for index, col_name in enumerate(header):
+                expected_type = column_types.get(index + 1, "str")
+                if expected_type in self.VALIDATION_METHODS:
+                    checks.append((index, self._compile_cell_validator(expected_type, col_name, index + 1)))
+
+        def validate_row(row: List[str], row_num: int, errors: List[ErrorInfo]) -> List[str]:
+            processed_row = [clean_value(value) for value in row]
+            for index, validate in checks:
+                value = processed_row[index]
+                if value:
+                    processed_row[index], error = validate(value, row_num)
+                    if error:
+                        errors.append(error)
+            return processed_row
+
+        return validate_row
+
+    def _compile_batch_validator(self, header: List[str], type_mapping: Dict[str, List[int]] = None
+                                 ) -> Callable[[List[List[str]], List[int]],
+                                               List[Tuple[List[str], List[ErrorInfo]]]]:
+        """
+        Variante por columnas de _compile_row_validator: cada columna validada
+        del lote se entrega completa a la versión por lotes de su método
+        (ver ValidacionPorLotes.metodo_por_lotes).
+
+        Con el primer lote como muestra se detectan las columnas de baja
+        cardinalidad (catálogos, estados, mes de reporte, archivo fuente): en
+        ellas cada valor distinto se limpia y valida una sola vez por archivo
+        y la columna se traduce con ese mapa (ver comun/cardinalidad.py).
+
+        Una columna cuyo validador no tiene método por lotes o cuyo tipo no
+        tiene mensaje de error se valida celda por celda con el validador
+        escalar de _compile_cell_validator, sin afectar a las demás.
+        """
+        column_types = self._column_types(type_mapping) if type_mapping and self.validator else {}
+        checks = {}
+        scalar_checks = {}
+        for index, col_name in enumerate(header):
+            expected_type = column_types.get(index + 1, "str")
+            if expected_type not in self.VALIDATION_METHODS:
+                continue
+            method_name, error_key = self.VALIDATION_METHODS[expected_type]
+            batch_method = self.validator.metodo_por_lotes(method_name)
+            message = self.error_messages.get(error_key)
+            if batch_method is None or message is None:
+                scalar_checks[index] = self._compile_cell_validator(expected_type, col_name, index + 1)
+                continue
+            key = f"{col_name} [{index + 1}]"
+            if expected_type in DATE_TYPES:
+                # Las fechas se vectorizan; las que no, pasan por el método
+                # escalar con el formato aprendido para la columna
+                self._column_method(index + 1, col_name, expected_type, getattr(self.validator, method_name))
+                adaptive = self.date_formats[key]
+                batch_method = partial(batch_method, respaldo=adaptive, mezcla=adaptive.mezcla)
+            cache = self._column_cache(key, getattr(self.validator, method_name))
+            if cache is not None:
+                batch_method = partial(cache.lote, batch_method)
+            checks[index] = (batch_method, message, expected_type, col_name)
+        clean_value = self.clean_value
+        distinct_maps: Optional[Dict[int, MapaDistintos]] = None
+
+        def validate_values(index: int, values: List[str]) -> List[Tuple[int, str]]:
+            """Valida en su lugar los valores no vacíos; retorna (posición, valor) de los inválidos."""
+            invalid = []
+            if index not in checks:
+                return invalid
+            positions = [i for i, value in enumerate(values) if value]
+            if positions:
+                validated, mask = checks[index][0]([values[i] for i in positions])
+                for i, value, is_valid in zip(positions, validated, mask):
+                    if not is_valid:
+                        invalid.append((i, values[i]))
+                    values[i] = value
+            return invalid
+
+        def validate_batch(rows: List[List[str]], row_nums: List[int]
+                           ) -> List[Tuple[List[str], List[ErrorInfo]]]:
+            nonlocal distinct_maps
+            if not rows:
+                return []
+            if distinct_maps is None:
+                distinct_maps = {}
+                for index in columnas_baja_cardinalidad(rows):
+                    if index in scalar_checks:
+                        continue
+                    distinct_maps[index] = MapaDistintos()
+                    self.distinct_maps[f"{header[index]} [{index + 1}]"] = distinct_maps[index]
+            columns = [list(column) for column in zip(*rows)]
+            errors = [[] for _ in rows]
+            for index, column in enumerate(columns):
+                validate = scalar_checks.get(index)
+                if validate is not None:
+                    column = [clean_value(value) for value in column]
+                    for i, value in enumerate(column):
+                        if value:
+                            column[i], error = validate(value, row_nums[i])
+                            if error:
+                                errors[i].append(error)
+                    columns[index] = column
+                    continue
+                mapping = distinct_maps.get(index)
+                if mapping is None:
+                    column = [clean_value(value) for value in column]
+                    invalid = validate_values(index, column)
+                else:
+                    missing = mapping.faltantes(column)
+                    if missing:
+                        values = [clean_value(value) for value in missing]
+                        mapping.agregar(missing, values, validate_values(index, values))
+                        if mapping.desbordado():
+                            # La muestra se equivocó: desde el siguiente lote, celda por celda
+                            del distinct_maps[index]
+                            del self.distinct_maps[f"{header[index]} [{index + 1}]"]
+                    column, invalid = mapping.aplicar(column)
+                columns[index] = column
+                if invalid:
+                    _, message, expected_type, col_name = checks[index]
+                    for i, value in invalid:
+                        errors[i].append(ErrorInfo(
+                            columna=col_name, numero_columna=index + 1,
+                            tipo=expected_type, valor=value, fila=row_nums[i],
+                            error=message
+                        ))
+            return list(zip(map(list, zip(*columns)), errors))
+
+        return validate_batch
+
+    def _compile_cell_validator(self, expected_type: str, col_name: str, col_num: int
+                                ) -> Callable[[str, int], Tuple[str, Optional[ErrorInfo]]]:
+        """Resuelve de antemano el método del validador y el mensaje de una columna."""
+        method_name, error_key = self.VALIDATION_METHODS[expected_type]
+        method = getattr(self.validator, method_name, None)
+        message = self.error_messages.get(error_key)
+
+        def validate_generic(value: str, row_num: int) -> Tuple[str, Optional[ErrorInfo]]:
+            return self._validate_value(value, expected_type, col_name, col_num, row_num)
+
+        if method is None or message is None:
+            # Sin método o sin mensaje: el camino general produce el mismo error de antes
+            return validate_generic
+        method = self._column_method(col_num, col_name, expected_type, method)
+
+        def validate(value: str, row_num: int) -> Tuple[str, Optional[ErrorInfo]]:
+            try:
+                validated, is_valid = method(value)
+            except Exception:
+                return validate_generic(value, row_num)
+            if is_valid:
+                return validated, None
+            return validated, ErrorInfo(
+                columna=col_name, numero_columna=col_num,
+                tipo=expected_type, valor=value, fila=row_num,
+                error=message
+            )
+
+        return validate
+
+    def _validate_value(self, value: str, expected_type: str, col_name: str, 
+                       col_num: int, row_num: int) -> Tuple[str, Optional[ErrorInfo]]:
+        """Valida un valor según su tipo esperado."""
+        if not value or not self.validator:
+            return value, None
+            
+        try:
+            if expected_type in self.VALIDATION_METHODS:
+                method, error_key = self.VALIDATION_METHODS[expected_type]
+                validator = getattr(self.validator, method)
+                validated, is_valid = validator(value)
+                if not is_valid:
+                    raise ValueError(self.error_messages[error_key])
+                
+                return validated, None
+            
+            return value, None
+            
+        except ValueError as e:
+            error = ErrorInfo(
+                columna=col_name, numero_columna=col_num,
+                tipo=expected_type, valor=value, fila=row_num,
+                error=str(e)
+            )
+            return validated, error
+
+    def _column_indices(self, original_headers: List[str], final_headers: List[str]) -> List[Optional[int]]:
+        """
+        Posición en el archivo de la columna de cada header final, directa o
+        por REPLACEMENT_MAP (None si no está).
+        """
+        header_map = {self.normalize_column_name(h): i for i, h in enumerate(original_headers)}
+        indices = []
+        for header in final_headers:
+            index = header_map.get(self.normalize_column_name(header))
+            if index is None:
+                # Buscar posibles mapeos alternativos
+                for orig, replacement in self.REPLACEMENT_MAP.items():
+                    if replacement == header and orig in header_map:
+                        index = header_map[orig]
+                        break
+            indices.append(index)
+        return indices
+
+    def _column_projection(self, original_headers: List[str], final_headers: List[str]
+                           ) -> Callable[[List[str]], List[str]]:
+        """
+        Reorganización de filas según los headers finales, resuelta una vez
+        por archivo (ver _column_indices); las columnas que no están quedan vacías.
+        """
+        return proyector(self._column_indices(original_headers, final_headers))
+
+    def _output_types(self, original_headers: List[str], final_headers: List[str],
+                      type_mapping: Dict[str, List[int]] = None) -> List[str]:
+        """
+        Tipo de type_mapping de cada columna de salida, para la salida Parquet.
+        Solo las columnas que el validador normaliza salen con tipo; las
+        demás (y todas, sin validador) quedan como texto.
+        """
+        column_types = self._column_types(type_mapping) if type_mapping and self.validator else {}
+        output_types = []
+        for index in self._column_indices(original_headers, final_headers):
+            expected_type = column_types.get(index + 1, "str") if index is not None else "str"
+            method = self.VALIDATION_METHODS.get(expected_type, (None,))[0]
+            output_types.append(expected_type if method and hasattr(self.validator, method) else "str")
+        return output_types
+
+    def _reorganize_row(self, row: List[str], original_headers: List[str], 
+                       final_headers: List[str]) -> List[str]:
+        """Reorganiza una fila según los headers finales."""
+        return self._column_projection(original_headers, final_headers)(row)
+
+    def _save_output(self, file_path: str, header: List[str], data: Iterable[List[str]],
+                     column_types: Optional[List[str]] = None, partitioned: bool = False) -> None:
+        """Guarda datos procesados en CSV, o en Parquet con column_types si la ruta es .parquet."""
+        if partitioned:
+            self._save_partitioned(file_path, header, data, column_types)
+            return
+        if es_parquet(file_path):
+            with EscritorParquet(file_path, header, column_types) as writer:
+                writer.escribir(data)
+            self._warn_text_integers(writer)
+            return
+        with abrir(file_path, 'w', encoding=ENCODING, newline='', nivel=self.compression_level) as f:
+            writer = self._csv_writer(f)
+            writer.writerow(header)
+            writer.writerows(data)
+
+    def _csv_writer(self, f):
+        """Escritor CSV de la salida procesada."""
+        return csv.writer(f, delimiter=DELIMITER, quoting=self.QUOTING)
+
+    def _open_output(self, file_path: str, header: List[str], column_types: Optional[List[str]] = None
+                     ) -> Tuple[Callable[[List[str]], None], Callable[[], None]]:
+        """Abre una salida fila a fila (CSV o Parquet, según la ruta); retorna (escribir_fila, cerrar)."""
+        if es_parquet(file_path):
+            writer = EscritorParquet(file_path, header, column_types)
+
+            def close():
+                writer.cerrar()
+                self._warn_text_integers(writer)
+            return writer.agregar, close
+        f = abrir(file_path, 'w', encoding=ENCODING, newline='', nivel=self.compression_level)
+        writer = self._csv_writer(f)
+        writer.writerow(header)
+        return writer.writerow, f.close
+
+    @staticmethod
+    def _warn_text_integers(writer: EscritorParquet) -> None:
+        """Avisa de las columnas int que quedaron como texto en el Parquet (ver comun/parquet.py)."""
+        for column in writer.enteros_como_texto:
+            print(f"Aviso: {column} tiene enteros de más de 18 dígitos; en el Parquet queda como texto")
+
+    def _save_partitioned(self, file_path: str, header: List[str], data: Iterable[List[str]],
+                          column_types: Optional[List[str]] = None) -> None:
+        """
+        Guarda los datos partidos por MES_REPORTE (ver comun/salida_particionada.py);
+        avisa de las particiones que quedan con menos filas que antes y con
+        verbose informa filas por partición.
+        """
+        if COLUMNA_PARTICION not in header:
+            raise ValueError(f"La salida particionada necesita la columna {COLUMNA_PARTICION}")
+        with EscritorParticionado(os.path.dirname(os.path.abspath(file_path)), os.path.basename(file_path),
+                                  header.index(COLUMNA_PARTICION),
+                                  lambda path: self._open_output(path, header, column_types)) as writer:
+            writer.escribir(data)
+        for key, (before, after) in writer.reducidas.items():
+            print(f"Aviso: {key} tenía {before} filas y se reemplazó con {after} (¿entrega parcial del mes?)")
+        if self.verbose:
+            print(writer.reporte())
+
+    def _stream_output(self, output_file: str, errors: AlmacenErrores, header: List[str],
+                       processed: Iterator[Tuple[Optional[List[str]], List[ErrorInfo]]],
+                       column_types: Optional[List[str]] = None, partitioned: bool = False) -> None:
+        """Escribe filas y errores a medida que se generan (modo streaming)."""
+        def rows():
+            for final_row, row_errors in processed:
+                if row_errors:
+                    errors.extend(row_errors)
+                if final_row is not None:
+                    yield final_row
+
+        self._save_output(output_file, header, rows(), column_types, partitioned)
+
+    def _save_errors(self, file_path: str, errors: List[ErrorInfo]) -> None:
+        """Guarda errores en CSV."""
+        with AlmacenErrores(file_path, ENCODING, nivel=self.compression_level) as store:
+            store.extend(errors)
@@ -0,0 +1,27 @@
+from operator import itemgetter
+from typing import Callable, List, Optional, Sequence
+
+
+def proyector(indices: Sequence[Optional[int]], relleno: str = "") -> Callable[[Sequence[str]], List[str]]:
+    """
+    Función que arma la fila de salida tomando de la fila de entrada la
+    columna indices[i] para cada posición i; None deja `relleno`.
+
+    Los índices se resuelven una vez por archivo y por fila queda una sola
+    llamada a operator.itemgetter, que copia las columnas en C. Para las
+    columnas que faltan se agrega `relleno` al final de la fila y se toma
+    con el índice -1.
+    """
+    indices = [-1 if indice is None else indice for indice in indices]
+    if not indices:
+        return lambda fila: []
+    if len(indices) == 1:
+        # itemgetter con un solo índice no retorna tupla
+        indice = indices[0]
+        if indice == -1:
+            return lambda fila: [relleno]
+        return lambda fila: [fila[indice]]
+    tomar = itemgetter(*indices)
+    if -1 not in indices:
+        return lambda fila: list(tomar(fila))
+    return lambda fila: list(tomar([*fila, relleno]))
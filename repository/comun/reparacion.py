@@ -0,0 +1,45 @@
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+REDIVIDIDA = 'redividida'
+VACIOS_FINALES = 'vacios_finales'
+
+
+def reparar_fila(fila: List[str], ancho: int, delimitador: str = '|') -> Tuple[List[str], Optional[str]]:
+    """
+    Intenta llevar una fila al ancho del encabezado.
+
+    - Con menos columnas: si algún campo quedó con el delimitador sin dividir
+      (p. ej. por una comilla que abrió en la columna 3 y cerró al final), se
+      vuelve a dividir; se acepta solo si el resultado tiene `ancho` campos.
+    - Con más columnas: si las sobrantes están vacías (delimitadores de más al
+      final de la línea), se recortan.
+
+    Retorna (fila, motivo); motivo es None si la fila no se pudo reparar y en
+    ese caso la fila se devuelve sin cambios.
+    """
+    largo = len(fila)
+    if largo > ancho:
+        if not any(fila[ancho:]):
+            return fila[:ancho], VACIOS_FINALES
+    elif 0 < largo < ancho and any(delimitador in campo for campo in fila):
+        partida = [parte for campo in fila for parte in campo.split(delimitador)]
+        if len(partida) == ancho:
+            return partida, REDIVIDIDA
+    return fila, None
+
+
+def reparar_filas(filas: Iterable[List[str]], ancho: int, delimitador: str = '|',
+                  conteo: Optional[Counter] = None) -> Iterator[List[str]]:
+    """
+    Repara en streaming las filas cuyo número de columnas no coincide con el
+    encabezado (ver reparar_fila). Las filas correctas solo pagan un len().
+
+    Si se pasa `conteo`, se suma una unidad por motivo de reparación.
+    """
+    for fila in filas:
+        if len(fila) != ancho:
+            fila, motivo = reparar_fila(fila, ancho, delimitador)
+            if motivo and conteo is not None:
+                conteo[motivo] += 1
+        yield fila
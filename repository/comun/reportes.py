@@ -0,0 +1,50 @@
+from collections import Counter
+from typing import Dict, Mapping
+
+from comun.errores import AlmacenErrores, ruta_resumen
+from comun.formatos_fecha import reporte_formatos_fecha
+from comun.memoizacion import reporte_memoria
+
+
+def estadisticas_vacias() -> Dict[str, dict]:
+    """
+    Estadísticas por columna de un archivo, con la forma que arma cada
+    proceso del pool: caché (columna -> aciertos/fallos/desalojos), formatos
+    de fecha (columna -> mezcla) y valores distintos (columna -> cantidad).
+    """
+    return {"cache": {}, "date_formats": {}, "distinct": {}}
+
+
+def sumar_estadisticas(totales: Dict[str, dict], estadisticas: Mapping[str, Mapping]) -> None:
+    """Suma a `totales` las estadísticas por columna de un proceso o de un rango."""
+    for columna, conteo in estadisticas["cache"].items():
+        totales["cache"].setdefault(columna, Counter()).update(conteo)
+    for columna, mezcla in estadisticas["date_formats"].items():
+        totales["date_formats"].setdefault(columna, Counter()).update(mezcla)
+    for columna, cantidad in estadisticas["distinct"].items():
+        totales["distinct"][columna] = max(cantidad, totales["distinct"].get(columna, 0))
+
+
+def informe_procesamiento(reparaciones: Counter, totales: Dict[str, dict], errores: AlmacenErrores) -> str:
+    """
+    Texto del informe de un archivo procesado: filas reparadas, caché de
+    validación, formatos de fecha y columnas validadas por valores distintos
+    (ver sumar_estadisticas), y si el detalle de errores quedó recortado.
+    Los bloques sin nada que informar se omiten; "" si no queda ninguno.
+    """
+    bloques = []
+    if reparaciones:
+        detalle = ", ".join(f"{motivo}: {cantidad}" for motivo, cantidad in reparaciones.items())
+        bloques.append(f"Filas reparadas ({sum(reparaciones.values())}): {detalle}")
+    if totales["cache"]:
+        bloques.append(reporte_memoria(totales["cache"]))
+    mezclas = {columna: mezcla for columna, mezcla in totales["date_formats"].items() if mezcla}
+    if mezclas:
+        bloques.append(reporte_formatos_fecha(mezclas))
+    if totales["distinct"]:
+        detalle = ", ".join(f"{columna}: {cantidad}" for columna, cantidad in totales["distinct"].items())
+        bloques.append(f"Columnas validadas por valores distintos ({len(totales['distinct'])}): {detalle}")
+    if errores.ruta is not None and errores.total > errores.en_detalle:
+        bloques.append(f"Errores: {errores.total} ({errores.en_detalle} en el detalle, hasta {errores.limite} "
+                       f"por columna y mensaje); resumen en {ruta_resumen(errores.ruta)}")
+    return "\n".join(bloques)
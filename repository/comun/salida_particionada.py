@@ -0,0 +1,183 @@
+import os
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from comun.compresion import separar_compresion
+from comun.manifiesto import actualizar_manifiesto, leer_manifiesto
+
+COLUMNA_PARTICION = 'MES_REPORTE'
+# Partición de los valores que no son un mes reconocible (convención de Hive
+# para nulos, que Spark, DuckDB y pyarrow leen como nulo)
+PARTICION_DESCONOCIDA = '__HIVE_DEFAULT_PARTITION__'
+# Los lectores de Hive ignoran los archivos que empiezan por '.'; el prefijo
+# conserva la extensión, que decide el formato (CSV o Parquet)
+PREFIJO_TEMPORAL = '.tmp-'
+# Manifiesto del dataset con las filas de cada partición
+MANIFIESTO_PARTICIONES = '_particiones'
+# Escritores abiertos a la vez: cada uno retiene filas sin escribir (hasta
+# FILAS_POR_GRUPO en Parquet, ver comun/parquet.py)
+MAX_ESCRITORES_ABIERTOS = 4
+
+# '1_2024', '01_2024', '01/2024', '01-2024' (lo que deja xlsx_a_csv_add_col_mes_reporte)
+_RE_MES_ANIO = re.compile(r'(\d{1,2})[_/-](\d{4})')
+# '2024-01', '2024_1', '2024-01-15', '2024/01/15 08:00:00', '202401'
+_RE_ANIO_MES = re.compile(r'(\d{4})(?:[_/-](\d{1,2})(?:[_/-]\d{1,2}(?:[ T].*)?)?|(\d{2}))')
+
+
+def anio_mes(valor: str) -> Optional[Tuple[str, str]]:
+    """('2024', '01') para los formatos de MES_REPORTE; None si no es un mes reconocible."""
+    valor = valor.strip()
+    coincidencia = _RE_MES_ANIO.fullmatch(valor)
+    if coincidencia:
+        mes, anio = coincidencia.groups()
+    else:
+        coincidencia = _RE_ANIO_MES.fullmatch(valor)
+        if not coincidencia:
+            return None
+        anio, mes, mes_pegado = coincidencia.groups()
+        mes = mes or mes_pegado
+    if not 1 <= int(mes) <= 12:
+        return None
+    return anio, f"{int(mes):02d}"
+
+
+def carpeta_particion(raiz: str, particion: Optional[Tuple[str, str]]) -> str:
+    """<raiz>/anio=YYYY/mes=MM (estilo Hive)."""
+    anio, mes = particion or (PARTICION_DESCONOCIDA, PARTICION_DESCONOCIDA)
+    return os.path.join(raiz, f"anio={anio}", f"mes={mes}")
+
+
+class EscritorParticionado:
+    """
+    Reparte filas por mes de reporte en <raiz>/anio=YYYY/mes=MM/<nombre>, a
+    medida que llegan: cada partición tiene su propio escritor, que da
+    `abrir(ruta)` como (escribir_fila, cerrar).
+
+    Solo quedan abiertos hasta `max_abiertos` escritores; para abrir otro se
+    cierra el usado hace más tiempo. Si a esa partición le llegan más filas,
+    van a una parte nueva en la misma carpeta (<nombre> sin extensión, '-2',
+    '-3'... y la extensión), que los lectores de Hive leen como un solo
+    dataset. Un archivo ordenado por mes tiene una sola parte por partición.
+
+    Cada parte se escribe en un temporal y las particiones se reemplazan
+    solo al cerrar sin errores: una re-entrega mensual reescribe la
+    partición de su mes (con sus partes anteriores) y deja intactas las
+    demás. La partición queda con las filas del archivo nuevo, aunque sean
+    menos que las de antes: un archivo con solo parte de un mes la reemplaza
+    completa. Esas particiones quedan en `reducidas` (clave -> (filas antes,
+    filas ahora)) para avisarlo. Las filas por partición quedan en el
+    manifiesto <raiz>/_particiones (ver comun/manifiesto.py), que los
+    lectores de Hive ignoran por empezar con '_'.
+    """
+
+    def __init__(self, raiz: str, nombre: str, indice: int,
+                 abrir: Callable[[str], Tuple[Callable[[Sequence[str]], None], Callable[[], None]]],
+                 max_abiertos: int = MAX_ESCRITORES_ABIERTOS):
+        self.raiz = raiz
+        self.nombre = nombre
+        self.indice = indice
+        self.abrir = abrir
+        self.max_abiertos = max_abiertos
+        self.conteos: Dict[Optional[Tuple[str, str]], int] = {}
+        self.reducidas: Dict[str, Tuple[int, int]] = {}
+        self._particiones: Dict[str, Optional[Tuple[str, str]]] = {}
+        # Escritores abiertos, del usado hace más tiempo al más reciente
+        self._abiertos: 'OrderedDict[Optional[Tuple[str, str]], Tuple[Callable, Callable]]' = OrderedDict()
+        # Temporales de las partes de cada partición, en orden
+        self._temporales: Dict[Optional[Tuple[str, str]], List[str]] = {}
+        sin_compresion, compresion = separar_compresion(nombre)
+        base, extension = os.path.splitext(sin_compresion)
+        self._base, self._extension = base, extension + compresion
+        self._re_partes = re.compile(rf"{re.escape(base)}-\d+{re.escape(self._extension)}")
+
+    def __enter__(self) -> 'EscritorParticionado':
+        return self
+
+    def __exit__(self, tipo, *exc) -> None:
+        self.cerrar(exito=tipo is None)
+
+    def clave(self, particion: Optional[Tuple[str, str]]) -> str:
+        """'anio=YYYY/mes=MM/<nombre>', relativa a la raíz."""
+        return os.path.relpath(self.ruta(particion), self.raiz).replace(os.sep, '/')
+
+    def ruta(self, particion: Optional[Tuple[str, str]]) -> str:
+        return os.path.join(carpeta_particion(self.raiz, particion), self.nombre)
+
+    def nombre_parte(self, numero: int) -> str:
+        """<nombre> para la primera parte; <base>-2<extensión>, -3... para las siguientes."""
+        return self.nombre if numero == 0 else f"{self._base}-{numero + 1}{self._extension}"
+
+    def _escritor(self, particion: Optional[Tuple[str, str]]) -> Callable[[Sequence[str]], None]:
+        if len(self._abiertos) >= self.max_abiertos:
+            _, (_, cerrar) = self._abiertos.popitem(last=False)
+            cerrar()
+        carpeta = carpeta_particion(self.raiz, particion)
+        os.makedirs(carpeta, exist_ok=True)
+        partes = self._temporales.setdefault(particion, [])
+        temporal = os.path.join(carpeta, PREFIJO_TEMPORAL + self.nombre_parte(len(partes)))
+        escribir, cerrar = self.abrir(temporal)
+        partes.append(temporal)
+        self._abiertos[particion] = (escribir, cerrar)
+        self.conteos.setdefault(particion, 0)
+        return escribir
+
+    def escribir(self, filas: Iterable[Sequence[str]]) -> None:
+        particiones = self._particiones
+        abiertos = self._abiertos
+        conteos = self.conteos
+        indice = self.indice
+        ultima = escribir_fila = None
+        for fila in filas:
+            valor = fila[indice]
+            if valor not in particiones:
+                particiones[valor] = anio_mes(valor)
+            particion = particiones[valor]
+            if particion is not ultima or escribir_fila is None:
+                escritor = abiertos.get(particion)
+                if escritor is None:
+                    escribir_fila = self._escritor(particion)
+                else:
+                    abiertos.move_to_end(particion)
+                    escribir_fila = escritor[0]
+                ultima = particion
+            escribir_fila(fila)
+            conteos[particion] += 1
+
+    def cerrar(self, exito: bool = True) -> None:
+        """Cierra los escritores; con éxito reemplaza cada partición, si no descarta los temporales."""
+        abiertos, self._abiertos = self._abiertos, OrderedDict()
+        temporales, self._temporales = self._temporales, {}
+        for _, cerrar in abiertos.values():
+            cerrar()
+        if not exito:
+            for partes in temporales.values():
+                for temporal in partes:
+                    os.remove(temporal)
+            return
+        if not temporales:
+            return
+        manifiesto = os.path.join(self.raiz, MANIFIESTO_PARTICIONES)
+        anteriores = leer_manifiesto(manifiesto)
+        for particion, partes in temporales.items():
+            carpeta = os.path.dirname(partes[0])
+            nombres = [self.nombre_parte(numero) for numero in range(len(partes))]
+            # Partes de una entrega anterior con más partes que esta
+            for sobrante in os.listdir(carpeta):
+                if self._re_partes.fullmatch(sobrante) and sobrante not in nombres:
+                    os.remove(os.path.join(carpeta, sobrante))
+            for temporal, nombre in zip(partes, nombres):
+                os.replace(temporal, os.path.join(carpeta, nombre))
+            antes = anteriores.get(self.clave(particion), {}).get('filas')
+            if antes is not None and antes > self.conteos[particion]:
+                self.reducidas[self.clave(particion)] = (antes, self.conteos[particion])
+        actualizar_manifiesto(manifiesto, {self.clave(particion): {'filas': self.conteos[particion],
+                                                                   'partes': len(partes)}
+                                           for particion, partes in temporales.items()})
+
+    def reporte(self) -> str:
+        """Filas por partición, en orden de año y mes."""
+        orden = sorted(self.conteos, key=lambda particion: particion or ('9999', '99'))
+        detalle = ", ".join(f"{os.path.dirname(self.clave(particion))}: {self.conteos[particion]}"
+                            for particion in orden)
+        return f"Particiones ({len(orden)}) en {self.raiz}: {detalle}"
@@ -0,0 +1,37 @@
+import unicodedata
+
+# Reemplazos de normalize_column_name, en el orden de siempre
+_REEMPLAZOS_COLUMNA = (
+    (' ', '_'), ('-', '_'), ('Á', 'A'), ('É', 'E'), ('Í', 'I'),
+    ('Ó', 'O'), ('Ú', 'U'), ('Ñ', 'N'), ('.', ''),
+)
+
+
+def quitar_acentos(valor: str) -> str:
+    """
+    unicodedata.normalize('NFKD', valor).encode('ASCII', 'ignore').decode('ASCII').
+
+    Casi todas las celdas de los exports ya vienen en ASCII (mayúsculas sin
+    tildes) y NFKD no les cambia nada: para esas basta con isascii(), una
+    sola pasada en C, en lugar de normalizar, codificar y decodificar.
+    """
+    if valor.isascii():
+        return valor
+    return unicodedata.normalize('NFKD', valor).encode('ASCII', 'ignore').decode('ASCII')
+
+
+def normalizar_nombre_columna(nombre: str, barra: bool = True) -> str:
+    """
+    Nombre de columna en mayúsculas con espacios y guiones a '_', vocales
+    tildadas y Ñ sin tilde, sin puntos y, con `barra`, '/' a '_'.
+
+    Un nombre en ASCII solo puede tener los reemplazos de espacio, guion,
+    punto y barra, así que se salta los de tildes.
+    """
+    nombre = nombre.strip().upper()
+    if nombre.isascii():
+        nombre = nombre.replace(' ', '_').replace('-', '_').replace('.', '')
+    else:
+        for anterior, nuevo in _REEMPLAZOS_COLUMNA:
+            nombre = nombre.replace(anterior, nuevo)
+    return nombre.replace('/', '_') if barra else nombre
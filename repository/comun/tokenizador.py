@@ -0,0 +1,58 @@
+import csv
+from itertools import chain
+from typing import Iterable, Iterator, List
+
+TEMP_NEWLINE = '⏎'
+TEMP_COMMA = '\uE000'
+ESCAPED_NEWLINE = '\\n'
+
+
+def _restaurar(campo: str) -> str:
+    """Restaura los marcadores temporales heredados a su forma original."""
+    if TEMP_COMMA in campo:
+        campo = campo.replace(TEMP_COMMA, ',')
+    if TEMP_NEWLINE in campo:
+        campo = campo.replace(TEMP_NEWLINE, '\n')
+    return campo
+
+
+def _preparar(linea: str) -> str:
+    """Protege el salto escapado '\\n' para que csv no lo tome como escape."""
+    return linea.replace(ESCAPED_NEWLINE, TEMP_NEWLINE)
+
+
+def iter_filas(lineas: Iterable[str], delimiter: str = '|') -> Iterator[List[str]]:
+    """
+    Tokeniza líneas delimitadas en una sola pasada.
+
+    - Ruta rápida: sin comillas ni '\\' la línea se divide con str.split.
+    - Ruta lenta: la línea (y las siguientes, si una comilla queda abierta)
+      se entrega a csv.reader con '\\n' escapado convertido a salto real.
+
+    Las comas no afectan el separador '|', así que no necesitan marcarse.
+    Los registros son los mismos que daba preprocess_line + csv.reader +
+    postprocess_field en CSVProcessor; la diferencia es que un campo entre
+    comillas que ocupa varias líneas conserva sus saltos reales.
+    """
+    origen = iter(lineas)
+    for linea in origen:
+        if '"' not in linea and '\\' not in linea:
+            if not linea:
+                yield []
+                continue
+            if TEMP_COMMA in linea or TEMP_NEWLINE in linea:
+                linea = _restaurar(linea)
+            yield linea.split(delimiter)
+            continue
+
+        # csv.reader solo consume líneas de `origen` mientras el registro
+        # siga abierto, así que la ruta rápida retoma justo después. Cada
+        # línea lleva su '\n' para conservar los saltos reales de un campo
+        # entre comillas que ocupa varias líneas.
+        reader = csv.reader(
+            (_preparar(siguiente) + '\n' for siguiente in chain([linea], origen)),
+            delimiter=delimiter,
+            quotechar='"',
+            escapechar='\\'
+        )
+        yield [_restaurar(campo) for campo in next(reader)]
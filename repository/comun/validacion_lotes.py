@@ -0,0 +1,107 @@
+from collections import Counter
+from functools import partial
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from comun.fechas_vectorizadas import PoliticaFechas, normalizar_fechas
+
+_RE_NO_NUMERICO = r"[^\d.-]"
+_RE_ENTERO = r"-?\d+"
+_RE_FLOTANTE = r"-?\d+(\.\d+)?"
+
+
+def _pandas():
+    """pandas es opcional: sin él, los lotes se validan por valores distintos en Python."""
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return pd
+
+
+def validar_por_valores_distintos(funcion: Callable[[str], Tuple[str, bool]],
+                                  valores: Sequence[str]) -> Tuple[List[str], List[bool]]:
+    """
+    Aplica un validador escalar a una columna evaluándolo una vez por valor
+    distinto y expandiendo el resultado a todas las posiciones.
+
+    Con pandas se usa factorize + take de NumPy; sin pandas, un diccionario.
+    El resultado es el mismo que llamar `funcion` celda por celda.
+    """
+    pd = _pandas()
+    if pd is not None:
+        import numpy as np
+        codigos, distintos = pd.factorize(pd.Series(valores, dtype=object), use_na_sentinel=False)
+        resultados = [funcion(valor) for valor in distintos]
+        normalizados = np.empty(len(resultados), dtype=object)
+        normalizados[:] = [normalizado for normalizado, _ in resultados]
+        mascara = np.array([bool(es_valido) for _, es_valido in resultados], dtype=bool)
+        return normalizados.take(codigos).tolist(), mascara.take(codigos).tolist()
+
+    cache = {}
+    normalizados, mascara = [], []
+    for valor in valores:
+        resultado = cache.get(valor)
+        if resultado is None:
+            resultado = cache[valor] = funcion(valor)
+        normalizados.append(resultado[0])
+        mascara.append(bool(resultado[1]))
+    return normalizados, mascara
+
+
+class ValidacionPorLotes:
+    """
+    API columnar para las clases Validadores*.
+
+    Cada método escalar `validar_x(valor) -> (valor, es_valido)` tiene una
+    versión `(valores) -> (valores_normalizados, mascara)` que entrega
+    metodo_por_lotes. Entero y flotante se vectorizan con las operaciones de
+    texto de pandas y las fechas con datetime64 de NumPy según
+    `politica_fechas` (validar_x_batch, declarados aquí); los demás (NIT,
+    listas de valores) se evalúan una vez por valor distinto del lote. Los
+    resultados coinciden con los del método escalar.
+    """
+
+    # Reglas de fecha de la entidad; sin política las fechas van por el escalar
+    politica_fechas: Optional[PoliticaFechas] = None
+
+    def validar_lote(self, metodo: str, valores: Sequence[str]) -> Tuple[List[str], List[bool]]:
+        """Valida una columna completa con el método escalar `metodo`."""
+        return validar_por_valores_distintos(getattr(self, metodo), valores)
+
+    def metodo_por_lotes(self, metodo: str) -> Optional[Callable[[Sequence[str]], Tuple[List[str], List[bool]]]]:
+        """
+        Versión por lotes del método escalar `metodo`: `<metodo>_batch` si la
+        clase la declara y si no validar_lote por valores distintos. None si
+        la clase no tiene `metodo`.
+        """
+        if not callable(getattr(type(self), metodo, None)):
+            return None
+        por_lotes = getattr(self, f"{metodo}_batch", None)
+        return por_lotes if por_lotes is not None else partial(self.validar_lote, metodo)
+
+    def _numerico_batch(self, metodo: str, patron: str, valores: Sequence[str]) -> Tuple[List[str], List[bool]]:
+        pd = _pandas()
+        if pd is None:
+            return self.validar_lote(metodo, valores)
+        serie = pd.Series(valores, dtype=object).astype(str)
+        limpios = serie.str.replace(_RE_NO_NUMERICO, "", regex=True)
+        mascara = limpios.str.fullmatch(patron)
+        return limpios.tolist(), mascara.astype(bool).tolist()
+
+    def validar_entero_batch(self, valores: Sequence[str]) -> Tuple[List[str], List[bool]]:
+        return self._numerico_batch('validar_entero', _RE_ENTERO, valores)
+
+    def validar_flotante_batch(self, valores: Sequence[str]) -> Tuple[List[str], List[bool]]:
+        return self._numerico_batch('validar_flotante', _RE_FLOTANTE, valores)
+
+    def validar_date_batch(self, valores: Sequence[str], formato_salida: str = 'date',
+                           respaldo: Optional[Callable[[str], Tuple[str, bool]]] = None,
+                           mezcla: Optional[Counter] = None) -> Tuple[List[str], List[bool]]:
+        """
+        `respaldo` reemplaza a validar_date para los valores que no se
+        vectorizan (p. ej. con el orden de formatos aprendido para la columna)
+        y `mezcla` recibe los formatos de los que sí.
+        """
+        if respaldo is None:
+            respaldo = partial(self.validar_date, formato_salida=formato_salida)
+        return normalizar_fechas(valores, self.politica_fechas, respaldo, formato_salida, mezcla)
@@ -1,7 +1,12 @@
 import csv
 import os
+import sys
 from typing import List, Dict
 
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from comun.texto import normalizar_nombre_columna
+
 # Encabezados de referencia en el orden correcto
 REFERENCE_HEADERS = [
     'ARCHIVO_FUENTE',
@@ -43,17 +48,7 @@ REPLACEMENT_MAP = {
 def normalize_column_name(column_name: str) -> str:
     """Normaliza los nombres de columna reemplazando espacios y caracteres especiales."""
     # Reemplazar espacios, guiones y caracteres especiales
-    column_name = column_name.strip().upper()
-    column_name = column_name.replace(' ', '_')
-    column_name = column_name.replace('-', '_')
-    column_name = column_name.replace('Á', 'A')
-    column_name = column_name.replace('É', 'E')
-    column_name = column_name.replace('Í', 'I')
-    column_name = column_name.replace('Ó', 'O')
-    column_name = column_name.replace('Ú', 'U')
-    column_name = column_name.replace('Ñ', 'N')
-    column_name = column_name.replace('.', '')
-    return column_name
+    return normalizar_nombre_columna(column_name, barra=False)
 
 def organize_headers(actual_headers: List[str]) -> List[str]:
     """Organiza los headers manteniendo el orden de REFERENCE_HEADERS primero y luego los demás en su orden original."""
@@ -1,6 +1,13 @@
 import re
 import os
 import csv
+import sys
+from itertools import chain
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from comun.deteccion_encoding import encoding_de_archivo
+from comun.reparacion import reparar_filas
 
 def procesar_csv(ruta_entrada, ruta_salida):
     """
@@ -12,23 +19,23 @@ def procesar_csv(ruta_entrada, ruta_salida):
         ruta_salida (str): La ruta al archivo CSV de salida.
     """
     try:
-        with open(ruta_entrada, 'r', encoding='utf-8', newline='') as archivo_entrada, \
+        encoding = encoding_de_archivo(ruta_entrada)
+        with open(ruta_entrada, 'r', encoding=encoding, newline='') as archivo_entrada, \
                 open(ruta_salida, 'w', encoding='utf-8', newline='') as archivo_salida:
 
             lector_csv = csv.reader(archivo_entrada, delimiter='|')
             escritor_csv = csv.writer(archivo_salida, delimiter='|', quoting=csv.QUOTE_MINIMAL)
 
-            for fila_leida in lector_csv:
-                if '|' in fila_leida[2]:
-                    # print(fila_leida)
-                    # breakpoint()
-                    # La línea no se dividió correctamente, la dividimos manualmente
-                    fila = fila_leida[2].split('|')
-                    fila = fila_leida[0:2]+ fila
-                else:
-                    # La línea ya fue dividida correctamente
-                    fila = fila_leida
+            encabezado = next(lector_csv, None)
+            if encabezado is None:
+                print(f"El archivo {ruta_entrada} está vacío")
+                return
 
+            # Las filas que no se dividieron correctamente (p. ej. con '|'
+            # sin dividir dentro de la columna 3) se reparan con el ancho del
+            # encabezado
+            filas = reparar_filas(lector_csv, len(encabezado), '|')
+            for fila in chain([encabezado], filas):
                 nueva_fila = []
                 for celda in fila:
                     if isinstance(celda, str):
@@ -1,5 +1,11 @@
 import csv
 import os
+import sys
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..')))
+from comun.parquet import es_parquet, escribir_parquet
+from comun.proyeccion import proyector
 
 # Encabezados de referencia en el orden correcto
 REFERENCE_HEADERS = [
@@ -92,9 +98,10 @@ replacement_muni_depto = {
     'FECHA_PLANILLA': 'FECHA_PLANILLA_REMISION_1'
 }
 
-def organize_headers(actual_headers:list):
+def rename_headers(actual_headers:list):
     """
-    Organiza los headers en el orden de reference_headers y maneja los renombramientos.
+    Nombre final de cada columna del archivo, en su posición: en mayúsculas
+    y con los renombramientos de replacement_muni_depto y replacement_map.
     """
     # Normalizar nombres (todo a mayúsculas)
     actual_headers_list = [header.strip().upper() for header in actual_headers ]
@@ -112,6 +119,13 @@ def organize_headers(actual_headers:list):
             index_to_replace = actual_headers_list.index(key)
             actual_headers_list[index_to_replace] = new_name
 
+    return actual_headers_list
+
+def organize_headers(actual_headers:list):
+    """
+    Organiza los headers en el orden de reference_headers y maneja los renombramientos.
+    """
+    actual_headers_list = rename_headers(actual_headers)
 
     # Agregar columnas adicionales que no están en reference_headers
     extra_headers = [header for header in actual_headers_list if header not in REFERENCE_HEADERS]
@@ -126,13 +140,17 @@ def extract_headers(csv_filename):
         headers = next(reader, None)
         return organize_headers(headers if headers else [])
 
-def reorganize_row(row, original_headers, final_headers):
+def column_indices(original_headers, final_headers):
     """
-    Reorganiza los datos de una fila según la nueva disposición de columnas.
+    Posición en el archivo de la columna de cada header final (None si no
+    está). Gana la columna que ya se llama así (la última, si se repite);
+    si no hay, la primera que se renombró a ese nombre.
     """
-    header_index = {col: idx for idx, col in enumerate(original_headers)}
-    new_row = [row[header_index[col]] if col in header_index else '' for col in final_headers]
-    return new_row
+    header_index = {col.strip().upper(): idx for idx, col in enumerate(original_headers)}
+    renamed_index = {}
+    for idx, col in enumerate(rename_headers(original_headers)):
+        renamed_index.setdefault(col, idx)
+    return [header_index.get(col, renamed_index.get(col)) for col in final_headers]
 
 def unir_csvs_en_csv(input_filepath, output_filepath):
     """
@@ -144,24 +162,33 @@ def unir_csvs_en_csv(input_filepath, output_filepath):
         print(f"Error: El archivo {input_filepath} no existe.")
         return
 
-        # Obtener los encabezados organizados
-    final_headers = extract_headers(input_filepath)
-
+    # Una sola lectura: encabezados y filas como listas, con la posición de
+    # cada columna final resuelta una vez para todo el archivo
     with open(input_filepath, mode='r', newline='', encoding='utf-8') as infile:
-        reader = csv.DictReader(infile, delimiter='|')
-        original_headers = reader.fieldnames if reader.fieldnames else []
-
-        # Estandarizar encabezados originales (strip y upper)
-        actual_headers_list = [header.strip().upper() for header in original_headers]
-
-        with open(output_filepath, mode='w', newline='', encoding='utf-8') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=final_headers, delimiter='|')
-            writer.writeheader()
+        reader = csv.reader(infile, delimiter='|')
+        original_headers = next(reader, None) or []
+        final_headers = organize_headers(original_headers)
+        reorganize = proyector(column_indices(original_headers, final_headers))
+        width = len(original_headers)
 
+        def rows():
             for row in reader:
-                cleaned_row = {key.strip().upper(): (value if value != "nan" else "")  for key, value in row.items()}
-                full_row = {header: cleaned_row.get(header, '') for header in final_headers}
-                writer.writerow(full_row)
+                if not row:
+                    continue  # Líneas vacías
+                if len(row) < width:
+                    row += [''] * (width - len(row))
+                new_row = reorganize(row)
+                if "nan" in new_row:
+                    new_row = ['' if value == "nan" else value for value in new_row]
+                yield new_row
+
+        if es_parquet(output_filepath):
+            escribir_parquet(output_filepath, final_headers, rows())
+        else:
+            with open(output_filepath, mode='w', newline='', encoding='utf-8') as outfile:
+                writer = csv.writer(outfile, delimiter='|')
+                writer.writerow(final_headers)
+                writer.writerows(rows())
     print(f"CSV procesado y guardado en {output_filepath}")
 
 # Lista de archivos CSV de entrada
@@ -1,6 +1,11 @@
 import csv
 import os
 import re
+import sys
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..')))
+from comun.deteccion_encoding import encoding_de_archivo
 
 def limpiar_nit(valor):
     """
@@ -67,7 +72,7 @@ def procesar_csv(archivo_entrada, archivo_salida, archivo_errores, tipos_por_pos
     errores = []
     filas_procesadas = []
 
-    with open(archivo_entrada, 'r', encoding='utf-8') as archivo_csv:
+    with open(archivo_entrada, 'r', encoding=encoding_de_archivo(archivo_entrada)) as archivo_csv:
         lector_csv = csv.reader(archivo_csv, delimiter='|')
         encabezado = next(lector_csv)  # Leer el encabezado
         print(f"Archivo leído exitosamente. Número de columnas: {len(encabezado)}")
@@ -0,0 +1,66 @@
+import importlib
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+
+# nombre -> (procesador bajo proyectos/, módulo del validador, clase del validador)
+PROCESADORES = {
+    'defensoria': ('DIAN/defensoria/transformar_columnas_defensoria.py',
+                   'validadores.validadores_defensoria', 'ValidadoresDefensoria'),
+    'dynamics': ('DIAN/PQR/transformar_columnas_pqr_dynamics.py',
+                 'validadores.validadores_pqr_dynamics', 'ValidadoresPQRDynamics'),
+    'muisca': ('DIAN/PQR/transformar_columnas_pqr_muisca.py',
+               'validadores.validadores_pqr_muisca', 'ValidadoresPQRMuisca'),
+    'dian_disciplinarios': ('DIAN/disciplinarios/transformar_columnas_disciplinarios.py',
+                            'validadores.validadores_disciplinarios', 'ValidadoresDisciplinarios'),
+    'ugpp_pqr': ('UGPP/PQR/transformar_columnas_pqr_ugpp.py',
+                 'validadores.validadores_pqr_ugpp', 'ValidadoresPQRUGPP'),
+    'ugpp_disciplinarios': ('UGPP/disciplinarios/transformar_columnas_disciplinarios.py',
+                            'validadores.validadores_disciplianrios', 'ValidadoresDisciplinarios'),
+    'coljuegos_pqr': ('COLJUEGOS/pqr/transformar_columnas_pqr_coljuegos.py',
+                      'validadores.validadores_pqr_coljuegos', 'ValidadoresPQRColjuegos'),
+    'coljuegos_disciplinarios': ('COLJUEGOS/disciplinarios/transformar_columnas_disciplinarios_col.py',
+                                 'validadores.validadores_disciplianrios', 'ValidadoresDisciplinarios'),
+}
+
+
+def _olvidar_paquetes_del_proyecto() -> None:
+    """Cada proyecto tiene sus propios paquetes validadores/ y valores_choice/."""
+    for nombre in list(sys.modules):
+        if nombre.split('.')[0] in ('validadores', 'valores_choice'):
+            del sys.modules[nombre]
+
+
+def cargar(nombre: str):
+    """(módulo del procesador, instancia del validador) de un proyecto de PROCESADORES."""
+    ruta, modulo_validador, clase_validador = PROCESADORES[nombre]
+    ruta = os.path.join(RAIZ, 'proyectos', ruta)
+    carpeta = os.path.dirname(ruta)
+    _olvidar_paquetes_del_proyecto()
+    sys.path.insert(0, carpeta)
+    try:
+        nombre_modulo = f"procesador_{nombre}"
+        spec = importlib.util.spec_from_file_location(nombre_modulo, ruta)
+        modulo = importlib.util.module_from_spec(spec)
+        # El pool de procesos busca el módulo por nombre al serializar los rangos
+        sys.modules[nombre_modulo] = modulo
+        spec.loader.exec_module(modulo)
+        validador = getattr(importlib.import_module(modulo_validador), clase_validador)()
+    finally:
+        sys.path.remove(carpeta)
+    return modulo, validador
+
+
+@pytest.fixture
+def procesador():
+    """Fábrica de CSVProcessor con su validador: procesador('muisca')."""
+    def crear(nombre: str):
+        modulo, validador = cargar(nombre)
+        return modulo.CSVProcessor(validator=validador)
+    return crear
@@ -0,0 +1,115 @@
+import csv
+import sys
+
+import pytest
+
+from comun.catalogos import IndiceCatalogo
+from comun.errores import TIPO_PROPUESTA, AlmacenErrores, ruta_resumen
+from conftest import PROCESADORES, cargar
+
+# (proyecto, método, entrada) -> salida de los validadores antes del índice de catálogos
+SALIDAS_ORIGINALES = [
+    ('coljuegos_pqr', 'validar_clasificacion', 'PQRSD', ('pqrsd', True)),
+    ('coljuegos_pqr', 'validar_clasificacion', 'FELICITACIÓN', ('felicitacion', True)),
+    ('coljuegos_pqr', 'validar_clasificacion', 'DERECHO DE PETICIÓN', ('derecho de peticion', True)),
+    ('coljuegos_pqr', 'validar_linea_negocio', 'PR-CAC-0325 EJECUCION DE CAMPAÑAS',
+     ('PR-CAC-0325 EJECUCION DE CAMPANAS', True)),
+    ('ugpp_pqr', 'validar_clasificacion', 'QUEJA', ('QUEJA', True)),
+    ('ugpp_pqr', 'validar_categoria_1', 'DERECHO DE PETICIÓN', ('DERECHO DE PETICION', True)),
+    ('dian_disciplinarios', 'validar_departamento', 'SAN_ANDRES', ('SAN_ANDRES', True)),
+    ('dian_disciplinarios', 'validar_ciudad', 'PUERTO CARREÑO', ('PUERTO CARRENO', True)),
+    ('dian_disciplinarios', 'validar_direccion_seccional', '1-Direccion Seccional de Aduanas de Cartagena',
+     ('direccion seccional de aduanas de cartagena', True)),
+    ('defensoria', 'validar_dependencia_dian', 'direccion seccional de aduanas de cartagen',
+     ('direccion seccional de aduanas de cartagen', True)),
+]
+
+
+@pytest.mark.parametrize("nombre, metodo, entrada, esperado", SALIDAS_ORIGINALES)
+def test_validadores_conservan_su_salida(nombre, metodo, entrada, esperado):
+    _, validador = cargar(nombre)
+    assert getattr(validador, metodo)(entrada) == esperado
+
+
+def test_sin_difuso_no_hay_propuestas():
+    catalogo = IndiceCatalogo(["bogota", "medellin"], {"bogota dc": "bogota"})
+    assert catalogo.resolver("bogota dc") == ("bogota", True)
+    assert catalogo.resolver("medelin") == ("medelin", False)
+    assert catalogo.proponer("medelin") is None
+
+
+def test_difuso_propone_sin_reemplazar():
+    catalogo = IndiceCatalogo(["direccion seccional de cali"], {"seccional cali": "direccion seccional de cali"},
+                              difuso=True, nombre="prueba")
+    assert catalogo.resolver("direccion seccionl de cali") == ("direccion seccionl de cali", False)
+    assert catalogo.proponer("direccion seccionl de cali") == "direccion seccional de cali"
+    # La forma conocida más cercana es una clave de reemplazo: se propone su valor canónico
+    assert catalogo.proponer("seccional calli") == "direccion seccional de cali"
+    assert catalogo.proponer("otra cosa distinta") is None
+    # Lo que ya está en el índice no se propone
+    assert catalogo.proponer("seccional cali") is None
+
+
+def _catalogos(nombre):
+    modulo = sys.modules[type(cargar(nombre)[1]).__module__]
+    return [valor for valor in vars(modulo).values() if isinstance(valor, IndiceCatalogo)]
+
+
+@pytest.mark.parametrize("nombre", PROCESADORES)
+def test_todos_los_catalogos_proponen(nombre):
+    catalogos = _catalogos(nombre)
+    assert catalogos
+    for catalogo in catalogos:
+        assert catalogo.nombre
+        valor = max(catalogo.valores, key=len)
+        assert catalogo.proponer(valor + "x") is not None, (catalogo.nombre, valor)
+
+
+@pytest.mark.parametrize("nombre", ['dynamics', 'muisca', 'dian_disciplinarios'])
+def test_direccion_seccional_propone_en_vez_de_corregir(nombre):
+    _, validador = cargar(nombre)
+    validador.propuestas.clear()
+    # La salida conserva el valor del archivo; la forma del catálogo queda como propuesta
+    assert validador.validar_direccion_seccional('1-Direccion Seccionalde Aduanas de Cartagena') == (
+        'direccion seccionalde aduanas de cartagena', True)
+    assert validador.validar_direccion_seccional('direccion seccional de impuestos  de bogota') == (
+        'direccion seccional de impuestos  de bogota', True)
+    assert validador.validar_direccion_seccional('direccion seccional de impuestos de bogota') == (
+        'direccion seccional de impuestos de bogota', True)
+    assert validador.propuestas == {
+        ('direccion_seccional', 'direccion seccionalde aduanas de cartagena',
+         'direccion seccional de aduanas de cartagena'): 1,
+        ('direccion_seccional', 'direccion seccional de impuestos  de bogota',
+         'direccion seccional de impuestos de bogota'): 1,
+    }
+
+
+def test_propuestas_van_al_resumen(tmp_path):
+    ruta = str(tmp_path / "errores.csv")
+    with AlmacenErrores(ruta) as errores:
+        errores.agregar_propuestas({("dependencia_dian", "aduanas de cartagen", "aduanas de cartagena"): 3})
+    with open(ruta_resumen(ruta), encoding='utf-8') as f:
+        filas = list(csv.DictReader(f))
+    assert filas == [{'columna': 'dependencia_dian', 'numero_columna': '0', 'tipo': TIPO_PROPUESTA,
+                      'error': 'Valor cercano en el catálogo: aduanas de cartagena', 'errores': '3',
+                      'en_detalle': '0', 'valor': 'aduanas de cartagen', 'veces': '3'}]
+
+
+@pytest.mark.parametrize("opciones", [{}, {"streaming": True}, {"workers": 2}])
+def test_procesador_informa_propuestas_de_defensoria(tmp_path, opciones):
+    modulo, validador = cargar('defensoria')
+    entrada = tmp_path / "defensoria.csv"
+    valores = ["direccion seccional de aduanas de cartagen", "DIRECCION SECCIONAL DE ADUANAS DE CARTAGEN",
+               "texto que no se parece a nada"] * 20
+    entrada.write_text("NOMBRE_ARCHIVO|MES_REPORTE|DEPENDENCIA\n"
+                       + "".join(f"a.csv|01_2025|{valor}\n" for valor in valores), encoding='utf-8')
+    salida, errores = tmp_path / "salida.csv", tmp_path / "errores.csv"
+    modulo.CSVProcessor(validator=validador).process_csv(
+        str(entrada), str(salida), str(errores), {"choice_dependencia_dian": [3]}, **opciones)
+    # La salida conserva el valor del archivo
+    assert salida.read_text(encoding='utf-8').count('"direccion seccional de aduanas de cartagen"\n') == 40
+    with open(ruta_resumen(str(errores)), encoding='utf-8') as f:
+        filas = [fila for fila in csv.DictReader(f) if fila['tipo'] == TIPO_PROPUESTA]
+    assert [(fila['columna'], fila['valor'], fila['error']) for fila in filas] == [
+        ("dependencia_dian", "direccion seccional de aduanas de cartagen",
+         "Valor cercano en el catálogo: direccion seccional de aduanas de cartagena")]
@@ -0,0 +1,54 @@
+import random
+
+from comun.coincidencia_difusa import IndiceDifuso, distancia_acotada
+
+LETRAS = 'abcde '
+
+
+def levenshtein(a: str, b: str) -> int:
+    anterior = list(range(len(b) + 1))
+    for i, caracter in enumerate(a, 1):
+        actual = [i]
+        for j, otro in enumerate(b, 1):
+            actual.append(min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + (caracter != otro)))
+        anterior = actual
+    return anterior[-1]
+
+
+def fuerza_bruta(indice: IndiceDifuso, valor: str):
+    if len(valor) < indice.longitud_minima:
+        return None
+    maximo = indice.distancia_maxima(len(valor))
+    cercanos = sorted((d, v) for v in indice.valores if (d := levenshtein(valor, v)) <= maximo)
+    if not cercanos or (len(cercanos) > 1 and cercanos[0][0] == cercanos[1][0]):
+        return None
+    return cercanos[0][1]
+
+
+def test_distancia_acotada():
+    assert distancia_acotada("seccional", "seccionl", 1) == 1
+    assert distancia_acotada("seccional", "secional de", 2) is None
+    assert distancia_acotada("abc", "abc", 0) == 0
+
+
+def test_propone_lo_mismo_que_levenshtein_contra_todo():
+    # Alfabeto corto: muchos trigramas repetidos dentro de un mismo valor
+    azar = random.Random(5)
+    catalogo = {''.join(azar.choices(LETRAS, k=azar.randint(5, 16))) for _ in range(150)}
+    indice = IndiceDifuso(catalogo)
+    valores = []
+    for _ in range(200):
+        letras = list(azar.choice(sorted(catalogo)))
+        for _ in range(azar.randint(0, 3)):
+            letras[azar.randrange(len(letras))] = azar.choice(LETRAS)
+        valores.append(''.join(letras))
+    valores += ["aaaaaaaaaa", "abab abab abab", "zzzzzz"]
+    assert [indice.proponer(valor) for valor in valores] == [fuerza_bruta(indice, valor) for valor in valores]
+
+
+def test_direcciones_seccionales():
+    indice = IndiceDifuso(["direccion seccional de aduanas de cali", "direccion seccional de aduanas de cucuta",
+                           "direccion seccional de impuestos de cali"])
+    assert indice.proponer("direccion seccionalde aduanas de cali") == "direccion seccional de aduanas de cali"
+    assert indice.proponer("direccion seccional de aduanas de cal") == "direccion seccional de aduanas de cali"
+    assert indice.proponer("otra cosa") is None
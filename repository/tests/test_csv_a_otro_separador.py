@@ -0,0 +1,32 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'transformar'))
+from csv_a_otro_separador import convertir_archivo
+
+NOMBRE = "ARCHIVO_COLJ_I20250101_F20250131.csv"
+
+
+def convertir(tmp_path, texto):
+    entrada, salida = tmp_path / "original", tmp_path / "limpio"
+    entrada.mkdir()
+    salida.mkdir()
+    (entrada / NOMBRE).write_text(texto, encoding='utf-8')
+    convertir_archivo(NOMBRE, str(entrada), str(salida))
+    return (salida / NOMBRE).read_text(encoding='utf-8')
+
+
+def test_filas_sin_comillas_iguales_al_conversor_original(tmp_path):
+    texto = "A|@B|@C\n1|@dos|@tres\n4|@ cinco |@6\n"
+    # Salida del conversor original: '|'.join de cada línea dividida por '|@'
+    esperado = ("nombre_archivo|mes_reporte|A|B|C\n"
+                f"{NOMBRE}|01_2025|1|dos|tres\n"
+                f"{NOMBRE}|01_2025|4| cinco |6\n")
+    assert convertir(tmp_path, texto) == esperado
+
+
+def test_campos_con_comillas_se_escriben_como_csv(tmp_path):
+    texto = 'A|@B\n"x|@y"|@dijo "sí"\n"solo"|@z\n'
+    assert convertir(tmp_path, texto) == ("nombre_archivo|mes_reporte|A|B\n"
+                                          f'{NOMBRE}|01_2025|"x|@y"|"dijo ""sí"""\n'
+                                          f"{NOMBRE}|01_2025|solo|z\n")
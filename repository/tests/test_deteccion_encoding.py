@@ -0,0 +1,28 @@
+import gzip
+
+from comun.deteccion_encoding import encoding_de_archivo
+from comun.manifiesto import leer_manifiesto, ruta_manifiesto
+
+
+def test_por_omision_no_escribe_manifiesto(tmp_path):
+    ruta = tmp_path / "entrada.csv"
+    ruta.write_bytes("ñandú|1\n".encode('cp1252'))
+    assert encoding_de_archivo(str(ruta)) == 'cp1252'
+    assert list(tmp_path.iterdir()) == [ruta]
+
+
+def test_manifiesto_a_pedido(tmp_path):
+    ruta = tmp_path / "entrada.csv"
+    ruta.write_bytes("ñandú|1\n".encode('utf-8'))
+    assert encoding_de_archivo(str(ruta), usar_manifiesto=True) == 'utf-8'
+    assert leer_manifiesto(str(ruta))['encoding'] == 'utf-8'
+    assert (tmp_path / ruta_manifiesto("entrada.csv")).exists()
+
+
+def test_comprimido_usa_solo_el_inicio(tmp_path):
+    ruta = tmp_path / "entrada.csv.gz"
+    # Un byte cp1252 más allá de la muestra no se lee; uno dentro sí
+    with gzip.open(ruta, 'wb') as f:
+        f.write("ñandú|1\n".encode('utf-8') * 100 + b"\xff|2\n")
+    assert encoding_de_archivo(str(ruta), tamano_muestra=100) == 'utf-8'
+    assert encoding_de_archivo(str(ruta), tamano_muestra=1000) == 'cp1252'
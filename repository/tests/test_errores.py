@@ -0,0 +1,30 @@
+import csv
+
+from comun.errores import ruta_resumen
+from conftest import cargar
+
+
+def procesar_fechas_invalidas(tmp_path, **opciones):
+    modulo, validador = cargar('ugpp_pqr')
+    entrada, errores = tmp_path / "ugpp.csv", tmp_path / "errores.csv"
+    entrada.write_text("NOMBRE_ARCHIVO|MES_REPORTE|FECHA\n" + "a.csv|01_2025|no es fecha\n" * 50,
+                       encoding='utf-8')
+    modulo.CSVProcessor(validator=validador).process_csv(
+        str(entrada), str(tmp_path / "salida.csv"), str(errores), {"date": [3]}, **opciones)
+    with open(errores, encoding='utf-8') as f:
+        detalle = f.read().count("no es fecha")
+    with open(ruta_resumen(str(errores)), encoding='utf-8') as f:
+        resumen = list(csv.DictReader(f))
+    return detalle, resumen
+
+
+def test_por_omision_el_detalle_guarda_todos_los_errores(tmp_path):
+    detalle, resumen = procesar_fechas_invalidas(tmp_path)
+    assert detalle == 50
+    assert [(fila['errores'], fila['en_detalle']) for fila in resumen] == [('50', '50')]
+
+
+def test_error_limit_recorta_el_detalle(tmp_path):
+    detalle, resumen = procesar_fechas_invalidas(tmp_path, error_limit=10)
+    assert detalle == 10
+    assert [(fila['errores'], fila['en_detalle']) for fila in resumen] == [('50', '10')]
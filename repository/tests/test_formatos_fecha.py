@@ -0,0 +1,40 @@
+from comun.formatos_fecha import FORMATOS_FECHA, FORMATOS_RANGO, FormatoFechaAdaptativo
+from comun.nucleo_validacion import NucleoValidacion
+
+FECHAS = ["31/01/2024", "2024-01-31", "2024-01-31 10:20:00", "2024/01/31", "2024-01-31 - 2024-02-02",
+          "1/2/2024 - 3/2/2024", "45000", "nope", "31/02/2024", ""]
+
+
+class Espia:
+    """validar_date que guarda el orden_formatos recibido en cada llamada."""
+
+    def __init__(self):
+        self.validador = NucleoValidacion()
+        self.ordenes = []
+
+    def __call__(self, valor, **opciones):
+        self.ordenes.append(opciones['orden_formatos'])
+        return self.validador.validar_date(valor, **opciones)
+
+
+def test_orden_aprendido_no_cambia_el_resultado():
+    validador = NucleoValidacion()
+    adaptativo = FormatoFechaAdaptativo(validador.validar_date, muestra=3, ventana=5)
+    valores = (FECHAS + ["15/03/2023"] * 5) * 20
+    assert [adaptativo(valor) for valor in valores] == [validador.validar_date(valor) for valor in valores]
+    assert adaptativo.orden[0] == 'date_dd_mm_yyyy'
+    assert adaptativo.orden[-len(FORMATOS_RANGO):] == FORMATOS_RANGO
+
+
+def test_orden_es_una_tupla_que_solo_cambia_si_cambian_los_conteos():
+    espia = Espia()
+    adaptativo = FormatoFechaAdaptativo(espia, muestra=5, ventana=5)
+    for _ in range(20):
+        adaptativo("2024-01-31 10:20:00")
+    assert adaptativo.orden == FORMATOS_FECHA + FORMATOS_RANGO
+    # Con los mismos conteos no se arma otra tupla
+    assert len({id(orden) for orden in espia.ordenes}) == 1
+    for _ in range(10):
+        adaptativo("31/01/2024")
+    assert isinstance(adaptativo.orden, tuple) and adaptativo.orden[0] == 'date_dd_mm_yyyy'
+    assert len({id(orden) for orden in espia.ordenes}) == 2
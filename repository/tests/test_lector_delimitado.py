@@ -0,0 +1,62 @@
+from comun.lector_delimitado import LectorDelimitado
+
+
+def escribir(tmp_path, texto, encoding='utf-8'):
+    ruta = tmp_path / "entrada.csv"
+    ruta.write_bytes(texto.encode(encoding))
+    return str(ruta)
+
+
+def literal(texto):
+    """Lo que daba el conversor original: cada línea dividida por '|@'."""
+    return [linea.strip().split('|@') for linea in texto.splitlines()]
+
+
+def test_filas_sin_comillas_igual_que_division_literal(tmp_path):
+    texto = "A|@B|@C\n1|@dos|@tres\n\n4|@ cinco |@6\n"
+    assert list(LectorDelimitado(escribir(tmp_path, texto))) == literal(texto)
+
+
+def test_campo_entre_comillas_con_delimitador_y_salto(tmp_path):
+    texto = 'A|@B|@C\n1|@"x|@y"|@z\n2|@"linea uno\nlinea dos"|@w\n3|@"di ""hola"""|@v\n'
+    assert list(LectorDelimitado(escribir(tmp_path, texto))) == [
+        ["A", "B", "C"], ["1", "x|@y", "z"], ["2", "linea uno\nlinea dos", "w"], ["3", 'di "hola"', "v"]]
+
+
+def test_comilla_sin_cerrar_no_absorbe_el_resto_del_archivo(tmp_path):
+    texto = 'A|@B\n"comilla sin cerrar|@1\n' + "".join(f"{i}|@x\n" for i in range(8000))
+    lector = LectorDelimitado(escribir(tmp_path, texto))
+    assert list(lector) == literal(texto)
+    assert lector.lineas_sin_cerrar == 1
+
+
+def test_comilla_sin_cerrar_relee_una_comilla_valida_siguiente(tmp_path):
+    lineas = ['"abierta|@1|@a'] + [f"{i}|@x|@y" for i in range(5)] + ['7|@"varias|@lineas', 'fin"|@2']
+    lector = LectorDelimitado(escribir(tmp_path, "\n".join(lineas) + "\n"), max_lineas=3)
+    assert list(lector) == ([['"abierta', '1', 'a']] + [[str(i), "x", "y"] for i in range(5)]
+                            + [["7", "varias|@lineas\nfin", "2"]])
+
+
+def test_lineas_no_utf8_con_respaldo(tmp_path):
+    ruta = tmp_path / "entrada.csv"
+    ruta.write_bytes("A|@B\n".encode() + "ñandú|@1\n".encode('latin-1'))
+    lector = LectorDelimitado(str(ruta))
+    assert list(lector) == [["A", "B"], ["ñandú", "1"]]
+    assert lector.lineas_respaldo == 1
+
+
+def test_comilla_suelta_no_se_traga_las_filas_completas_que_siguen(tmp_path):
+    texto = 'A|@B|@C\n1|@"Hola sin cerrar|@x\n2|@normal|@y\n3|@normal|@z\n4|@dijo "si"|@w\n'
+    lector = LectorDelimitado(escribir(tmp_path, texto))
+    assert list(lector) == [["A", "B", "C"], ["1", '"Hola sin cerrar', "x"], ["2", "normal", "y"],
+                            ["3", "normal", "z"], ["4", 'dijo "si"', "w"]]
+    assert lector.lineas_sin_cerrar == 1
+
+
+def test_union_con_otro_ancho_se_divide_literal(tmp_path):
+    # Las líneas siguientes no son registros completos, pero la unión da 2 campos y no 3
+    texto = 'A|@B|@C\n1|@"abierta|@x\ntexto suelto\nmas "cita\n5|@y|@z\n'
+    lector = LectorDelimitado(escribir(tmp_path, texto))
+    assert list(lector) == [["A", "B", "C"], ["1", '"abierta', "x"], ["texto suelto"], ['mas "cita'],
+                            ["5", "y", "z"]]
+    assert lector.lineas_sin_cerrar == 1
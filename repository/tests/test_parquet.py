@@ -0,0 +1,47 @@
+import pytest
+
+from comun.parquet import TIPO_ENTERO_TEXTO, EscritorParquet
+from conftest import cargar
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_columnas_con_tipo(tmp_path):
+    ruta = str(tmp_path / "salida.parquet")
+    with EscritorParquet(ruta, ["N", "FECHA", "TEXTO"], ["int", "date", "str"]) as escritor:
+        escritor.escribir([["1", "2025-01-02", "a"], ["", "no es fecha", ""]])
+    tabla = pq.read_table(ruta)
+    assert tabla.schema.field("N").type == pa.int64()
+    assert tabla.schema.field("FECHA").type == pa.date32()
+    assert tabla.column("N").to_pylist() == [1, None]
+    assert tabla.column("TEXTO").to_pylist() == ["a", ""]
+
+
+def test_enteros_largos_pasan_la_columna_a_texto(tmp_path):
+    ruta = str(tmp_path / "salida.parquet")
+    filas = [["1", "2025-01-02"], ["x", "2025-01-03"], ["3", "2025-01-04"],
+             ["12345678901234567890", "2025-01-05"], ["-5", ""]]
+    # Grupos de 2 filas: el entero largo llega cuando ya hay grupos escritos como int64
+    with EscritorParquet(ruta, ["N", "FECHA"], ["int", "date"], filas_por_grupo=2) as escritor:
+        escritor.escribir(filas)
+    assert escritor.enteros_como_texto == ["N"]
+    assert escritor.tipos == [TIPO_ENTERO_TEXTO, "date"]
+    tabla = pq.read_table(ruta)
+    assert tabla.schema.field("N").type == pa.string()
+    assert tabla.schema.field("FECHA").type == pa.date32()
+    assert tabla.column("N").to_pylist() == ["1", None, "3", "12345678901234567890", "-5"]
+    assert pq.ParquetFile(ruta).num_row_groups == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["salida.parquet"]
+
+
+def test_procesador_avisa_enteros_largos(tmp_path, capsys):
+    modulo, validador = cargar('ugpp_pqr')
+    entrada = tmp_path / "ugpp.csv"
+    entrada.write_text("NOMBRE_ARCHIVO|MES_REPORTE|NUMERO\n"
+                       "a.csv|01_2025|12\na.csv|01_2025|1234567890123456789012\n", encoding='utf-8')
+    salida = tmp_path / "salida.parquet"
+    modulo.CSVProcessor(validator=validador).process_csv(
+        str(entrada), str(salida), str(tmp_path / "errores.csv"), {"int": [3]})
+    assert "NUMERO tiene enteros de más de 18 dígitos" in capsys.readouterr().out
+    assert pq.read_table(str(salida)).column("NUMERO").to_pylist() == ["12", "1234567890123456789012"]
@@ -0,0 +1,20 @@
+import inspect
+
+from comun.procesador_csv import BASE_ERROR_MESSAGES, ProcesadorCSV
+from conftest import PROCESADORES, cargar
+
+DATOS_DEL_PROYECTO = {'REFERENCE_HEADERS', 'REPLACEMENT_MAP', 'VALIDATION_METHODS', 'ERROR_MESSAGES',
+                      'NORMALIZE_SLASH', 'QUOTING'}
+
+
+def test_los_procesadores_solo_aportan_datos():
+    for nombre in PROCESADORES:
+        modulo, validador = cargar(nombre)
+        clase = modulo.CSVProcessor
+        assert issubclass(clase, ProcesadorCSV)
+        propios = {atributo for atributo in vars(clase) if not atributo.startswith('__')}
+        assert propios <= DATOS_DEL_PROYECTO, (nombre, propios - DATOS_DEL_PROYECTO)
+        assert not any(inspect.isfunction(valor) for valor in vars(clase).values())
+        mensajes = clase(validator=validador).error_messages
+        assert mensajes.items() >= BASE_ERROR_MESSAGES.items()
+        assert mensajes.items() >= clase.ERROR_MESSAGES.items()
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from comun.ensamblador import ensamblar_registros
+
+COLUMNAS = 12
+
+
+def archivo_muisca(ruta, registros=3000, partidos=0.2, semilla=7):
+    """Registros de COLUMNAS campos; una parte con saltos de línea sin comillas (como Muisca)."""
+    azar = random.Random(semilla)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write("|".join(["NOMBRE_ARCHIVO", "MES_REPORTE"] + [f"C{i}" for i in range(3, COLUMNAS + 1)]) + "\n")
+        for registro in range(registros):
+            campos = [f"v{registro}_{i}" for i in range(COLUMNAS)]
+            if azar.random() < partidos:
+                for _ in range(azar.choice([1, 1, 2])):
+                    # El primer campo (NOMBRE_ARCHIVO) no es texto libre
+                    k = azar.randrange(1, COLUMNAS - 1)
+                    campos[k] += "\ntexto libre"
+            f.write("|".join(campos) + "\n")
+
+
+def procesar(procesador, tmp_path, entrada, nombre, **opciones):
+    salida, errores = tmp_path / f"{nombre}.csv", tmp_path / f"{nombre}_errores.csv"
+    procesador('muisca').process_csv(str(entrada), str(salida), str(errores),
+                                     {"str": list(range(1, COLUMNAS + 1))}, **opciones)
+    return salida.read_text(encoding='utf-8'), errores.read_text(encoding='utf-8') if errores.exists() else ''
+
+
+def test_ensamblar_con_resto_retoma_el_registro():
+    filas = [["a", "b"], ["c", "d", "e"], ["f"]]
+    resto = []
+    assert list(ensamblar_registros(filas[:2], 4, resto)) == [["a", "b\nc", "d", "e"]]
+    assert resto == [] and list(ensamblar_registros([["x", "y"]], 4, resto)) == []
+    assert resto == [["x", "y"]]
+    assert list(ensamblar_registros(resto + [["z", "w", "v"]], 4)) == [["x", "y\nz", "w", "v"]]
+
+
+def test_resto_de_texto_libre_no_se_pega_al_registro_siguiente():
+    filas = [["a", "b", "texto parte 1"], ["parte 2"], ["x", "y", "z"]]
+    assert list(ensamblar_registros(filas, 3)) == filas
+
+
+def test_filas_cortas_que_no_suman_el_ancho_no_se_unen():
+    assert list(ensamblar_registros([["a", "b"], ["c", "d"]], 4)) == [["a", "b"], ["c", "d"]]
+    # La primera queda sola y las siguientes sí completan un registro
+    assert list(ensamblar_registros([["p", "q", "r"], ["a", "b", "c"], ["d", "e"], ["f", "g", "h", "i"]], 4)) == [
+        ["p", "q", "r"], ["a", "b", "c\nd", "e"], ["f", "g", "h", "i"]]
+    resto = []
+    assert list(ensamblar_registros([["a", "b"], ["c"]], 4, resto)) == [] and resto == [["a", "b"], ["c"]]
+
+
+def test_defensoria_reporta_el_fragmento_y_conserva_el_registro(procesador, tmp_path):
+    entrada = tmp_path / "defensoria.csv"
+    entrada.write_text("NOMBRE_ARCHIVO|MES_REPORTE|TEXTO\na.csv|01_2025|texto parte 1\nparte 2\n"
+                       "b.csv|02_2025|ok\n", encoding='utf-8')
+    salida, errores = tmp_path / "salida.csv", tmp_path / "errores.csv"
+    procesador('defensoria').process_csv(str(entrada), str(salida), str(errores), {})
+    assert salida.read_text(encoding='utf-8').splitlines()[1:] == [
+        '"a.csv"|"01_2025"|"texto parte 1"', '"b.csv"|"02_2025"|"ok"']
+    assert "['parte 2'],2," in errores.read_text(encoding='utf-8')
+
+
+@pytest.mark.parametrize("partidos", [0.2, 1.0])
+@pytest.mark.parametrize("workers", [2, 4, 7])
+def test_paralelo_igual_que_en_serie_con_saltos_sin_comillas(procesador, tmp_path, workers, partidos):
+    entrada = tmp_path / "muisca.csv"
+    archivo_muisca(entrada, partidos=partidos)
+    serie = procesar(procesador, tmp_path, entrada, "serie", streaming=True)
+    paralelo = procesar(procesador, tmp_path, entrada, "paralelo", streaming=True, workers=workers)
+    assert serie[1] == ""
+    assert serie[0].count("\n") > 3000
+    assert paralelo == serie
@@ -0,0 +1,59 @@
+from collections import Counter
+
+import pytest
+
+from comun.reportes import estadisticas_vacias, informe_procesamiento, sumar_estadisticas
+from conftest import PROCESADORES, cargar
+
+
+def archivo_ugpp(ruta):
+    """Fechas en dos formatos y un valor de catálogo repetido."""
+    filas = ["NOMBRE_ARCHIVO|MES_REPORTE|FECHA|CLASIFICACION"]
+    filas += [f"a.csv|01_2025|{fecha}|QUEJA" for fecha in ["31/01/2024", "2024-01-31"] * 10]
+    ruta.write_text("\n".join(filas) + "\n", encoding='utf-8')
+
+
+@pytest.mark.parametrize("opciones", [{}, {"streaming": True}, {"workers": 2}, {"partitioned": True}])
+def test_por_omision_no_imprime_nada(tmp_path, capsys, opciones):
+    modulo, validador = cargar('ugpp_pqr')
+    entrada = tmp_path / "ugpp.csv"
+    archivo_ugpp(entrada)
+    modulo.CSVProcessor(validator=validador).process_csv(
+        str(entrada), str(tmp_path / "salida.csv"), str(tmp_path / "errores.csv"),
+        {"date": [3], "choice_clasificacion": [4]}, **opciones)
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("opciones", [{}, {"workers": 2}])
+def test_verbose_imprime_el_informe(tmp_path, capsys, opciones):
+    modulo, validador = cargar('ugpp_pqr')
+    entrada = tmp_path / "ugpp.csv"
+    archivo_ugpp(entrada)
+    modulo.CSVProcessor(validator=validador).process_csv(
+        str(entrada), str(tmp_path / "salida.csv"), str(tmp_path / "errores.csv"),
+        {"date": [3], "choice_clasificacion": [4]}, verbose=True, **opciones)
+    salida = capsys.readouterr().out
+    assert "Caché de validación por columna:\n  FECHA [3]: aciertos=" in salida
+    assert "Formatos de fecha por columna:\n  FECHA [3]: " in salida
+
+
+def test_sumar_estadisticas_de_varios_procesos():
+    totales = estadisticas_vacias()
+    sumar_estadisticas(totales, {"cache": {"date": {"aciertos": 3}}, "date_formats": {"date": {"iso": 2}},
+                                 "distinct": {"clase": 4}})
+    sumar_estadisticas(totales, {"cache": {"date": {"aciertos": 1, "fallos": 2}}, "date_formats": {},
+                                 "distinct": {"clase": 2, "otra": 1}})
+    assert totales == {"cache": {"date": Counter(aciertos=4, fallos=2)},
+                       "date_formats": {"date": Counter(iso=2)}, "distinct": {"clase": 4, "otra": 1}}
+
+
+def test_informe_vacio_sin_nada_que_informar():
+    class SinErrores:
+        ruta = None
+    assert informe_procesamiento(Counter(), estadisticas_vacias(), SinErrores()) == ""
+
+
+def test_todos_los_procesadores_aceptan_verbose():
+    for nombre in PROCESADORES:
+        modulo, _ = cargar(nombre)
+        assert modulo.CSVProcessor.process_csv.__defaults__[-1] is False
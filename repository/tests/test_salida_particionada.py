@@ -0,0 +1,115 @@
+import csv
+import json
+import os
+
+import pytest
+
+from comun.salida_particionada import EscritorParticionado, MANIFIESTO_PARTICIONES, anio_mes
+from conftest import cargar
+
+
+def abrir_csv(abiertos):
+    """abrir(ruta) de un CSV simple que lleva la cuenta de los escritores abiertos."""
+    def abrir(ruta):
+        f = open(ruta, 'w', encoding='utf-8', newline='')
+        abiertos.add(ruta)
+        writer = csv.writer(f, delimiter='|')
+
+        def cerrar():
+            f.close()
+            abiertos.discard(ruta)
+        return writer.writerow, cerrar
+    return abrir
+
+
+def leer(ruta):
+    with open(ruta, encoding='utf-8', newline='') as f:
+        return list(csv.reader(f, delimiter='|'))
+
+
+def escribir(raiz, filas, max_abiertos, maximo_visto=None):
+    abiertos = set()
+    abrir = abrir_csv(abiertos)
+
+    def abrir_contando(ruta):
+        resultado = abrir(ruta)
+        if maximo_visto is not None:
+            maximo_visto.append(len(abiertos))
+        return resultado
+
+    with EscritorParticionado(str(raiz), "salida.csv", 0, abrir_contando, max_abiertos=max_abiertos) as escritor:
+        escritor.escribir(filas)
+    assert not abiertos
+    return escritor
+
+
+def test_anio_mes():
+    assert anio_mes("01_2024") == ("2024", "01")
+    assert anio_mes("2024-1") == ("2024", "01")
+    assert anio_mes("13_2024") is None
+
+
+def test_limita_los_escritores_abiertos(tmp_path):
+    meses = ["01_2024", "02_2024", "03_2024"]
+    filas = [[meses[i % 3], str(i)] for i in range(30)]
+    maximo_visto = []
+    escritor = escribir(tmp_path, filas, 2, maximo_visto)
+    assert max(maximo_visto) <= 2
+    # Con meses intercalados cada partición queda en varias partes, sin perder filas
+    for mes in ("01", "02", "03"):
+        carpeta = tmp_path / "anio=2024" / f"mes={mes}"
+        archivos = sorted(os.listdir(carpeta))
+        assert "salida.csv" in archivos and len(archivos) > 1
+        assert all(nombre.startswith("salida-") for nombre in archivos if nombre != "salida.csv")
+        filas_mes = [fila for nombre in archivos for fila in leer(carpeta / nombre)]
+        assert sorted(int(fila[1]) for fila in filas_mes) == [i for i in range(30) if meses[i % 3][1] == mes[1]]
+    assert escritor.conteos == {("2024", "01"): 10, ("2024", "02"): 10, ("2024", "03"): 10}
+    with open(tmp_path / (MANIFIESTO_PARTICIONES + ".manifest.json"), encoding='utf-8') as f:
+        manifiesto = json.load(f)
+    assert manifiesto["anio=2024/mes=01/salida.csv"]["filas"] == 10
+
+
+def test_archivo_ordenado_deja_una_parte_por_particion(tmp_path):
+    filas = [["01_2024", "a"]] * 5 + [["02_2024", "b"]] * 5 + [["03_2024", "c"]] * 5
+    escribir(tmp_path, filas, 1)
+    for mes in ("01", "02", "03"):
+        assert os.listdir(tmp_path / "anio=2024" / f"mes={mes}") == ["salida.csv"]
+
+
+def test_reentrega_reemplaza_el_mes_completo_y_avisa(tmp_path):
+    escribir(tmp_path, [["01_2024", str(i)] for i in range(6)] + [["02_2024", "x"], ["01_2024", "6"]], 1)
+    assert sorted(os.listdir(tmp_path / "anio=2024" / "mes=01")) == ["salida-2.csv", "salida.csv"]
+    # Re-entrega parcial de enero: la partición queda solo con sus filas y sin la parte sobrante
+    escritor = escribir(tmp_path, [["01_2024", "nueva"]], 4)
+    assert os.listdir(tmp_path / "anio=2024" / "mes=01") == ["salida.csv"]
+    assert leer(tmp_path / "anio=2024" / "mes=01" / "salida.csv") == [["01_2024", "nueva"]]
+    assert leer(tmp_path / "anio=2024" / "mes=02" / "salida.csv") == [["02_2024", "x"]]
+    assert escritor.reducidas == {"anio=2024/mes=01/salida.csv": (7, 1)}
+
+
+def test_error_descarta_los_temporales(tmp_path):
+    escribir(tmp_path, [["01_2024", "antes"]], 4)
+
+    def filas():
+        yield ["01_2024", "a"]
+        yield ["02_2024", "b"]
+        raise ValueError("corte")
+
+    with pytest.raises(ValueError):
+        escribir(tmp_path, filas(), 1)
+    assert os.listdir(tmp_path / "anio=2024" / "mes=01") == ["salida.csv"]
+    assert leer(tmp_path / "anio=2024" / "mes=01" / "salida.csv") == [["01_2024", "antes"]]
+    assert os.listdir(tmp_path / "anio=2024" / "mes=02") == []
+
+
+def test_procesador_avisa_la_reentrega_parcial(tmp_path, capsys):
+    modulo, validador = cargar('ugpp_pqr')
+    entrada = tmp_path / "ugpp.csv"
+    salida = tmp_path / "salida" / "ugpp.csv"
+    for filas in (3, 1):
+        entrada.write_text("NOMBRE_ARCHIVO|MES_REPORTE|FECHA\n" + "a.csv|01_2025|2025-01-02\n" * filas,
+                           encoding='utf-8')
+        modulo.CSVProcessor(validator=validador).process_csv(
+            str(entrada), str(salida), str(tmp_path / "errores.csv"), {"date": [3]}, partitioned=True)
+    assert capsys.readouterr().out == (
+        "Aviso: anio=2025/mes=01/ugpp.csv tenía 3 filas y se reemplazó con 1 (¿entrega parcial del mes?)\n")
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from conftest import PROCESADORES, cargar
+
+# Valores de prueba por tipo: válidos, inválidos y vacíos
+VALORES = {
+    "int": ["12", "007", "1.0", "abc", ""],
+    "float": ["3,5", "2.25", "x", ""],
+    "date": ["2024-01-31", "31/01/2024", "20240131", "nope", ""],
+    "datetime": ["2024-01-31 10:20:00", "31/01/2024 10:20", "nope", ""],
+    "nit": ["900.123.456-7", "800123456", "abc", ""],
+}
+CATALOGO = ["PETICION", "Queja", "DERECHO DE PETICIÓN", "sin catalogo", "  x  ", ""]
+
+
+def columnas(modulo):
+    """Una columna por tipo validado más una de texto."""
+    tipos = list(modulo.VALIDATION_METHODS)
+    header = [f"COL_{i}" for i in range(1, len(tipos) + 2)]
+    type_mapping = {tipo: [i] for i, tipo in enumerate(tipos, start=1)}
+    return header, type_mapping, tipos + ["str"]
+
+
+def filas(tipos, cantidad=400, semilla=3):
+    azar = random.Random(semilla)
+    return [[azar.choice(VALORES.get(tipo, CATALOGO)) for tipo in tipos] for _ in range(cantidad)]
+
+
+def procesadores(nombre):
+    """Módulo y dos CSVProcessor independientes (mismas clases) del proyecto."""
+    modulo, validador = cargar(nombre)
+    return modulo, modulo.CSVProcessor(validator=validador), modulo.CSVProcessor(validator=validador)
+
+
+def por_fila(procesador, header, type_mapping, rows):
+    validate_row = procesador._compile_row_validator(header, type_mapping)
+    resultado = []
+    for num, row in enumerate(rows, start=1):
+        errors = []
+        resultado.append((validate_row(row, num, errors), errors))
+    return resultado
+
+
+@pytest.mark.parametrize("nombre", list(PROCESADORES))
+def test_todos_los_tipos_tienen_metodo_por_lotes_y_mensaje(nombre):
+    modulo, p, _ = procesadores(nombre)
+    for metodo, clave in modulo.VALIDATION_METHODS.values():
+        assert p.validator.metodo_por_lotes(metodo) is not None, metodo
+        assert clave in p.error_messages, clave
+
+
+def test_metodo_por_lotes_no_inventa_metodos():
+    _, validador = cargar('defensoria')
+    assert validador.metodo_por_lotes('validar_fecha') == validador.validar_fecha_batch
+    assert validador.metodo_por_lotes('validar_entero') == validador.validar_entero_batch
+    # Un nombre mal escrito no tiene versión por lotes ni atributo *_batch
+    assert validador.metodo_por_lotes('validar_dependencia_dain') is None
+    with pytest.raises(AttributeError):
+        validador.validar_dependencia_dian_batch
+    normalizados, mascara = validador.metodo_por_lotes('validar_dependencia_dian')(["x", "x"])
+    assert (normalizados, mascara) == ([validador.validar_dependencia_dian("x")[0]] * 2,
+                                       [validador.validar_dependencia_dian("x")[1]] * 2)
+
+
+@pytest.mark.parametrize("nombre", list(PROCESADORES))
+def test_lotes_igual_que_por_fila(nombre):
+    modulo, p, fila = procesadores(nombre)
+    header, type_mapping, tipos = columnas(modulo)
+    rows = filas(tipos)
+    esperado = por_fila(fila, header, type_mapping, rows)
+    validate_batch = p._compile_batch_validator(header, type_mapping)
+    assert validate_batch([list(r) for r in rows], list(range(1, len(rows) + 1))) == esperado
+    # Las columnas de pocos valores distintos se validaron una vez por valor
+    assert p.distinct_maps
+
+
+@pytest.mark.parametrize("nombre", ["defensoria", "muisca"])
+def test_columna_sin_mensaje_se_valida_celda_por_celda(nombre):
+    modulo, p, fila = procesadores(nombre)
+    header, type_mapping, tipos = columnas(modulo)
+    # Una columna cuyo mensaje falta no desactiva los lotes del resto del archivo
+    del p.error_messages[modulo.VALIDATION_METHODS["int"][1]]
+    rows = [row for row in filas(tipos) if row[0] in ("12", "007", "")]
+    esperado = por_fila(fila, header, type_mapping, rows)
+    validate_batch = p._compile_batch_validator(header, type_mapping)
+    assert validate_batch([list(r) for r in rows], list(range(1, len(rows) + 1))) == esperado
+    assert "COL_1 [1]" not in p.distinct_maps
+    assert p.distinct_maps
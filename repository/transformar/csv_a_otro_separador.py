@@ -1,6 +1,14 @@
 import os
 import csv
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from comun.compresion import abrir, separar_compresion
+from comun.deteccion_encoding import encoding_de_archivo
+from comun.lector_delimitado import LectorDelimitado
 
 base_path_original = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/copia_COLJUEGOS_PQRS/2025/CSV")
 base_path_limpio = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/copia_COLJUEGOS_PQRS/2025/CSV/A")
@@ -13,73 +21,93 @@ lista_archivos_csv_at = [
 
 ]
 
-# Asegurarse de que el directorio de salida exista
-os.makedirs(base_path_limpio, exist_ok=True)
 
-for nombre_archivo_csv_at in lista_archivos_csv_at:
+def obtener_mes_reporte(nombre_archivo_csv_at: str) -> str:
+    """Extrae el mes de reporte (MM_AAAA) de la fecha inicial del nombre del archivo."""
+    coincidencia_fecha = re.search(r"I(\d{8})", nombre_archivo_csv_at)
+    if not coincidencia_fecha:
+        return "Desconocido"
+    fecha_str = coincidencia_fecha.group(1)
+    anio = fecha_str[:4]
+    mes = fecha_str[4:6]
+    return f"{mes}_{anio}"
+
+
+def convertir_archivo(nombre_archivo_csv_at: str, base_path_original: str, base_path_limpio: str,
+                      nivel_compresion: int = None) -> str:
+    """
+    Convierte un archivo delimitado por '|@' a '|' agregando nombre_archivo y
+    mes_reporte al principio. El encoding se detecta antes con una muestra del
+    archivo; cada línea se intenta primero como UTF-8 y, si no lo es, con el
+    encoding detectado (o latin-1), sin reiniciar la conversión.
+    Un archivo .gz o .zst se descomprime al vuelo y la salida se comprime
+    igual, con nivel_compresion (ver comun/compresion.py).
+
+    Los campos entre comillas se leen enteros (ver LectorDelimitado) y la
+    salida se escribe con csv.writer (QUOTE_MINIMAL). Frente a unir los
+    campos con '|', cambian solo los campos con comillas: un campo
+    "texto" queda como texto, y uno que tiene '|', comillas o un salto de
+    línea se escribe entre comillas con las internas dobladas (a"b queda
+    como "a""b"). Los lectores de CSV, como el tokenizador de los
+    procesadores, leen el mismo valor; las filas sin comillas quedan igual
+    que antes.
+    """
     archivo_entrada = os.path.join(base_path_original, nombre_archivo_csv_at)
-    nombre_archivo_base, _ = os.path.splitext(nombre_archivo_csv_at)
-    nombre_archivo_csv_pipe = nombre_archivo_base + ".csv"
-    archivo_salida = os.path.join(base_path_limpio, nombre_archivo_csv_pipe)
-
-
-    if os.path.exists(archivo_entrada):
-        print(f"Procesando archivo: {archivo_entrada}")
-        try:
-            with open(archivo_entrada, 'r', newline='', encoding='utf-8') as infile, \
-                 open(archivo_salida, 'w', newline='', encoding='utf-8') as outfile:
-                # Escribir la cabecera con las nuevas columnas al principio
-                coincidencia_fecha = re.search(r"I(\d{8})", nombre_archivo_csv_at)
-
-                mes_reporte = "Desconocido"
-                if coincidencia_fecha:
-                    fecha_str = coincidencia_fecha.group(1)
-                    anio = fecha_str[:4]
-                    mes = fecha_str[4:6]
-                    mes_reporte = f"{mes}_{anio}"
-                primera_linea = infile.readline().strip()
-                cabecera = primera_linea.split('|@')
-                nueva_cabecera = ['nombre_archivo', 'mes_reporte'] + cabecera
-                outfile.write('|'.join(nueva_cabecera) + '\n')
-
-                # Escribir los datos con las columnas adicionales vacías al principio
-                for line in infile:
-                    campos = line.strip().split('|@')
-                    nueva_linea = [nombre_archivo_csv_at, mes_reporte] + campos
-                    outfile.write('|'.join(nueva_linea) + '\n')
-            print(f'Archivo convertido y guardado en: {archivo_salida}')
-        except UnicodeDecodeError:
-            print(f"Error de codificación UTF-8. Intentando con latin-1 para: {nombre_archivo_csv_at}")
-            try:
-                with open(archivo_entrada, 'r', newline='', encoding='latin-1') as infile_latin, \
-                     open(archivo_salida, 'w', newline='', encoding='utf-8') as outfile:
-                    # Escribir la cabecera con las nuevas columnas al principio
-                    coincidencia_fecha = re.search(r"I(\d{8})", nombre_archivo_csv_at)
-
-                    mes_reporte = "Desconocido"
-                    if coincidencia_fecha:
-                        fecha_str = coincidencia_fecha.group(1)
-                        anio = fecha_str[:4]
-                        mes = fecha_str[4:6]
-                        mes_reporte = f"{mes}_{anio}"
-                    primera_linea = infile_latin.readline().strip()
-                    cabecera = primera_linea.split('|@')
-                    nueva_cabecera = ['nombre_archivo', 'mes_reporte'] + cabecera
-                    outfile.write('|'.join(nueva_cabecera) + '\n')
-
-                    # Escribir los datos con las columnas adicionales vacías al principio
-                    for line in infile_latin:
-                        campos = line.strip().split('|@')
-                        nueva_linea = [os.path.splitext(nombre_archivo_csv_at)[0], mes_reporte] + campos
-                        outfile.write('|'.join(nueva_linea) + '\n')
-                print(f'Archivo convertido y guardado (con latin-1) en: {archivo_salida}')
-            except Exception as e_latin:
-                print(f"Error al leer o convertir el archivo {nombre_archivo_csv_at} con latin-1: {e_latin}")
-        except FileNotFoundError:
-            print(f"Error: El archivo {nombre_archivo_csv_at} no se encontró en: {base_path_original}")
-        except Exception as e:
-            print(f"Error al leer o convertir el archivo {nombre_archivo_csv_at}: {e}")
-    else:
-        print(f"El archivo {nombre_archivo_csv_at} no existe en: {base_path_original}")
-
-print("Proceso de conversión de archivos CSV completado.")
\ No newline at end of file
+    nombre_sin_compresion, compresion = separar_compresion(nombre_archivo_csv_at)
+    nombre_archivo_base, _ = os.path.splitext(nombre_sin_compresion)
+    archivo_salida = os.path.join(base_path_limpio, nombre_archivo_base + ".csv" + compresion)
+
+    if not os.path.exists(archivo_entrada):
+        return f"El archivo {nombre_archivo_csv_at} no existe en: {base_path_original}"
+
+    try:
+        mes_reporte = obtener_mes_reporte(nombre_archivo_csv_at)
+        encoding = encoding_de_archivo(archivo_entrada)
+        principal = 'utf-8-sig' if encoding == 'utf-8-sig' else 'utf-8'
+        encodings = tuple(dict.fromkeys((principal, encoding, 'latin-1')))
+        lector = LectorDelimitado(archivo_entrada, delimitador='|@', encodings=encodings)
+        registros = iter(lector)
+
+        with abrir(archivo_salida, 'w', encoding='utf-8', newline='', nivel=nivel_compresion) as outfile:
+            writer = csv.writer(outfile, delimiter='|', lineterminator='\n')
+            # Escribir la cabecera con las nuevas columnas al principio
+            cabecera = next(registros, [''])
+            writer.writerow(['nombre_archivo', 'mes_reporte'] + cabecera)
+
+            # Escribir los datos con las columnas adicionales al principio
+            for campos in registros:
+                writer.writerow([nombre_sin_compresion, mes_reporte] + campos)
+
+        avisos = []
+        if lector.lineas_respaldo:
+            avisos.append(f"{lector.lineas_respaldo} líneas no UTF-8 leídas con {encodings[1]}")
+        if lector.lineas_sin_cerrar:
+            avisos.append(f"{lector.lineas_sin_cerrar} comillas sin cerrar divididas literal")
+        if avisos:
+            return f"Archivo convertido y guardado en: {archivo_salida} ({'; '.join(avisos)})"
+        return f"Archivo convertido y guardado en: {archivo_salida}"
+    except Exception as e:
+        return f"Error al leer o convertir el archivo {nombre_archivo_csv_at}: {e}"
+
+
+def convertir_archivos(lista_archivos, base_path_original: str, base_path_limpio: str, procesos: int = None,
+                       nivel_compresion: int = None) -> None:
+    """Convierte varios archivos en paralelo, un archivo por proceso."""
+    # Asegurarse de que el directorio de salida exista
+    os.makedirs(base_path_limpio, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=procesos) as executor:
+        resultados = executor.map(
+            convertir_archivo,
+            lista_archivos,
+            [base_path_original] * len(lista_archivos),
+            [base_path_limpio] * len(lista_archivos),
+            [nivel_compresion] * len(lista_archivos),
+        )
+        for nombre_archivo_csv_at, resultado in zip(lista_archivos, resultados):
+            print(f"{nombre_archivo_csv_at}: {resultado}")
+
+
+if __name__ == "__main__":
+    convertir_archivos(lista_archivos_csv_at, base_path_original, base_path_limpio)
+    print("Proceso de conversión de archivos CSV completado.")
@@ -1,16 +1,24 @@
 import pandas as pd
 import os
+import sys
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from comun.compresion import abrir
 
 base_path_original = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/NOTIFICACIONES_DIAN/ORIGINAL/")
 base_path_limpio = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/NOTIFICACIONES_DIAN/CAMBIO_FORMATO_COLUMNAS/")
 archivo_sav = os.path.join(base_path_original, 'Consolidado2017-2019_ent.sav')
 archivo_csv = os.path.join(base_path_limpio, 'Consolidado2017-2019_ent.csv')
+# Con .csv.gz o .csv.zst el CSV se escribe comprimido en streaming (ver comun/compresion.py)
+nivel_compresion = None
 
 if os.path.exists(archivo_sav):
     print(f"El archivo .sav existe en: {archivo_sav}")
     try:
         df = pd.read_spss(archivo_sav)
-        df.to_csv(archivo_csv, index=False, sep='|')
+        with abrir(archivo_csv, 'w', encoding='utf-8', newline='', nivel=nivel_compresion) as f:
+            df.to_csv(f, index=False, sep='|')
         print(f'Archivo .sav convertido a CSV y guardado en: {archivo_csv}')
     except Exception as e:
         print(f"Error al leer el archivo .sav: {e}")
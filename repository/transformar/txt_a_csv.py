@@ -1,14 +1,26 @@
 import csv
 import os
-def txt_to_csv(filenames, base_path, input_separator="|", output_separator="|"):
+import sys
+from itertools import chain
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from comun.compresion import abrir
+from comun.deteccion_encoding import encoding_de_archivo
+
+
+def txt_to_csv(filenames, base_path, input_separator="|", output_separator="|", nivel_compresion=None):
     """
     Convierte múltiples archivos TXT a CSV, usando pipe "|" como separador en ambos.
+    Un TXT .gz o .zst se lee descomprimiendo al vuelo y su CSV se escribe
+    comprimido igual (ARCHIVO.txt.gz -> ARCHIVO_CONVERTIDO.csv.gz).
     
     Args:
         filenames (list): Lista de nombres de archivos a convertir
         base_path (str): Ruta base donde se encuentran los archivos
         input_separator (str): Separador en los archivos TXT (por defecto "|")
         output_separator (str): Separador para el CSV resultante (por defecto "|")
+        nivel_compresion (int): Nivel de compresión del CSV (ver comun/compresion.py)
     """
     
     for filename in filenames:
@@ -18,18 +30,20 @@ def txt_to_csv(filenames, base_path, input_separator="|", output_separator="|"):
         output_path = os.path.join(base_path, output_filename)
         
         try:
-            with open(input_path, 'r', encoding='utf-8') as txt_file:
-                lines = txt_file.readlines()
+            encoding = encoding_de_archivo(input_path)
+            with abrir(input_path, 'r', encoding=encoding) as txt_file:
+                # Las líneas se leen a medida que se escriben, sin cargar el archivo
+                first_line = next(txt_file, None)
                 
-                if not lines:
+                if first_line is None:
                     print(f"Archivo vacío: {filename}")
                     continue
                 
-                with open(output_path, 'w', newline='', encoding='utf-8') as csv_file:
+                with abrir(output_path, 'w', encoding='utf-8', newline='', nivel=nivel_compresion) as csv_file:
                     # Configurar escritor CSV con pipe como delimitador
                     writer = csv.writer(csv_file, delimiter=output_separator)
                     
-                    for line in lines:
+                    for line in chain([first_line], txt_file):
                         line = line.strip()
                         if not line:
                             continue
@@ -1,10 +1,18 @@
 import pandas as pd
 import os
+import sys
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from comun.compresion import abrir
 
 base_path_original = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/NOTIFICACIONES_DIAN/ORIGINAL/CSV/INFORME_2025_ENERO_MARZO_2025/")
 base_path_limpio = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/NOTIFICACIONES_DIAN/ORIGINAL/CSV/INFORME_2025_ENERO_MARZO_2025/")
 archivo_xlsx = os.path.join(base_path_original, 'Mes de Agosto de 2021.xlsx')  # Reemplaza 'archivo.xlsx' con el nombre de tu archivo
 archivo_csv = os.path.join(base_path_limpio, 'Mes_de_Agosto_de_2021.csv')      # Reemplaza 'archivo.csv' con el nombre deseado para el CSV
+# '.gz' o '.zst' escribe los CSV comprimidos en streaming (ver comun/compresion.py)
+compresion_salida = ""
+nivel_compresion = None
 
 lista_archivos_xlsx = [
     'Informe_Notificaciones_ITRC_Libro_Radicador_20250101_20250331_BAR.xlsx',
@@ -26,14 +34,15 @@ lista_archivos_xlsx = [
 for nombre_archivo_xlsx in lista_archivos_xlsx:
     archivo_xlsx = os.path.join(base_path_original, nombre_archivo_xlsx)
     nombre_archivo_base, _ = os.path.splitext(nombre_archivo_xlsx)
-    nombre_archivo_csv = nombre_archivo_base.replace(" ", "_").replace("de_", "").replace("de", "").replace(".", "_") + ".csv"
+    nombre_archivo_csv = nombre_archivo_base.replace(" ", "_").replace("de_", "").replace("de", "").replace(".", "_") + ".csv" + compresion_salida
     archivo_csv = os.path.join(base_path_limpio, nombre_archivo_csv)
 
     if os.path.exists(archivo_xlsx):
         print(f"Procesando archivo: {archivo_xlsx}")
         try:
             df = pd.read_excel(archivo_xlsx)
-            df.to_csv(archivo_csv, index=False, sep='|', encoding='utf-8')
+            with abrir(archivo_csv, 'w', encoding='utf-8', newline='', nivel=nivel_compresion) as f:
+                df.to_csv(f, index=False, sep='|')
             print(f'Archivo convertido y guardado en: {archivo_csv}')
         except Exception as e:
             print(f"Error al leer el archivo {nombre_archivo_xlsx}: {e}")
@@ -1,11 +1,19 @@
 import pandas as pd
 import os
 import re
+import sys
+
+# Raíz del repositorio, para importar los módulos compartidos de comun/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from comun.compresion import abrir
 
 base_path_original = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/copia_COLJUEGOS_PQRS/2021")
 base_path_limpio = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/copia_COLJUEGOS_PQRS/2021/CSV/")
 archivo_xlsx = os.path.join(base_path_original, 'Mes de Agosto de 2021.xlsx')  # Reemplaza 'archivo.xlsx' con el nombre de tu archivo
 archivo_csv = os.path.join(base_path_limpio, 'Mes_de_Agosto_de_2021.csv')      # Reemplaza 'archivo.csv' con el nombre deseado para el CSV
+# '.gz' o '.zst' escribe los CSV comprimidos en streaming (ver comun/compresion.py)
+compresion_salida = ""
+nivel_compresion = None
 
 lista_archivos_xlsx = [
     "01_enero_2021.xlsx",
@@ -35,7 +43,7 @@ MESES_LOWER = {
 for nombre_archivo_xlsx in lista_archivos_xlsx:
     archivo_xlsx = os.path.join(base_path_original, nombre_archivo_xlsx)
     nombre_archivo_base, _ = os.path.splitext(nombre_archivo_xlsx)
-    nombre_archivo_csv = nombre_archivo_base.replace(" ", "_").replace("de_", "").replace("de", "").replace(".", "_") + ".csv"
+    nombre_archivo_csv = nombre_archivo_base.replace(" ", "_").replace("de_", "").replace("de", "").replace(".", "_") + ".csv" + compresion_salida
     archivo_csv = os.path.join(base_path_limpio, nombre_archivo_csv)
 
     coincidencia = re.search(r"Mes_([A-Za-z]+)_(\d{4})", nombre_archivo_csv)
@@ -83,7 +91,8 @@ for nombre_archivo_xlsx in lista_archivos_xlsx:
             df.insert(0, 'nombre_archivo', nombre_archivo_base)
             df.insert(1, 'mes_reporte', mes_reporte)
 
-            df.to_csv(archivo_csv, index=False, sep='|', encoding='utf-8')
+            with abrir(archivo_csv, 'w', encoding='utf-8', newline='', nivel=nivel_compresion) as f:
+                df.to_csv(f, index=False, sep='|')
             print(f'Archivo convertido y guardado en: {archivo_csv}')
         except Exception as e:
             print(f"Error al leer el archivo {nombre_archivo_xlsx}: {e}")
@@ -1,5 +1,15 @@
 import pandas as pd
 import os
+import sys
+
+from comun.compresion import abrir
+from comun.deteccion_encoding import encoding_de_archivo
+from comun.parquet import es_parquet, escribir_parquet
+
+# Procesador del proyecto, para los tipos de la salida Parquet
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'proyectos', 'COLJUEGOS', 'pqr'))
+from transformar_columnas_pqr_coljuegos import CSVProcessor
+from validadores.validadores_pqr_coljuegos import ValidadoresPQRColjuegos
 
 # Lista de archivos CSV a combinar
 filenames = [
@@ -14,6 +24,15 @@ filenames = [
 ]
 # Ruta base donde están los archivos
 base_path = os.path.expanduser("~/Documentos/ITRC/DOCUMENTOS_LIMPIAR/copia_COLJUEGOS_PQRS")
+# Los .gz y .zst se leen y escriben comprimidos en streaming (ver comun/compresion.py)
+nivel_compresion = None
+# Tipo de type_mapping de las columnas de los archivos procesados; las demás quedan como texto
+tipos_por_columna = {
+    "FECHA_DE_RADICACION": "date",
+    "FECHA_TERMINACION": "date",
+    "CLASIFICACION": "choice_clasificacion",
+    "DEPENDENCIA_ASIGNA": "choice_dependencia_asignada",
+}
 
 # Función para limpiar valores tipo '123.0' -> '123'
 def clean_value(val):
@@ -31,7 +50,8 @@ for filename in filenames:
         print(f"⚠️ Archivo no encontrado: {file_path}")
         continue
     try:
-        df = pd.read_csv(file_path, delimiter='|', dtype=str)
+        with abrir(file_path, 'r', encoding=encoding_de_archivo(file_path), newline='') as f:
+            df = pd.read_csv(f, delimiter='|', dtype=str)
         df = df.applymap(clean_value)
         dataframes.append(df)
         print(f"📥 Cargado: {filename} ({df.shape[0]} filas)")
@@ -43,7 +63,20 @@ if not dataframes:
     print("❗ No se cargó ningún archivo válido. Proceso cancelado.")
 else:
     combined_df = pd.concat(dataframes, ignore_index=True)
+    # Con extensión .parquet se escribe Parquet por grupos de filas, con los
+    # tipos que le da el procesador del proyecto a sus columnas de salida
     output_file = os.path.join(base_path, "consolidado_coljuegos_pqr_2021.csv")
-    combined_df.to_csv(output_file, sep='|', index=False)
+    if es_parquet(output_file):
+        header = list(combined_df.columns)
+        type_mapping = {}
+        for posicion, columna in enumerate(header, start=1):
+            if columna in tipos_por_columna:
+                type_mapping.setdefault(tipos_por_columna[columna], []).append(posicion)
+        processor = CSVProcessor(validator=ValidadoresPQRColjuegos())
+        escribir_parquet(output_file, header, combined_df.fillna('').itertuples(index=False, name=None),
+                         processor._output_types(header, header, type_mapping))
+    else:
+        with abrir(output_file, 'w', encoding='utf-8', newline='', nivel=nivel_compresion) as f:
+            combined_df.to_csv(f, sep='|', index=False)
     print(f"✅ Consolidado generado con éxito en: {output_file} ({combined_df.shape[0]} filas)")
 